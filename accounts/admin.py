@@ -1,12 +1,53 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.contrib.auth.models import User
-from django.http import HttpResponse
-from django.utils import timezone
-import csv
+
+from exports.utils import streaming_csv_response
 from .models import UserProfile
 
 
+USER_EXPORT_HEADER = [
+    'Username', 'Email', 'First Name', 'Last Name', 'User Type',
+    'Company', 'Is Staff', 'Is Active', 'Date Joined', 'Last Login'
+]
+
+USER_PROFILE_EXPORT_HEADER = [
+    'User', 'User Email', 'User Type', 'Company', 'Created At'
+]
+
+
+def user_export_row(user):
+    try:
+        user_type = user.user_profile.user_type
+        company = user.user_profile.company
+    except UserProfile.DoesNotExist:
+        user_type = 'No Profile'
+        company = 'N/A'
+
+    return [
+        user.username,
+        user.email,
+        user.first_name,
+        user.last_name,
+        user_type,
+        company,
+        user.is_staff,
+        user.is_active,
+        user.date_joined.strftime('%Y-%m-%d %H:%M:%S'),
+        user.last_login.strftime('%Y-%m-%d %H:%M:%S') if user.last_login else 'Never'
+    ]
+
+
+def user_profile_export_row(user_profile):
+    return [
+        user_profile.user.username,
+        user_profile.user.email,
+        user_profile.user_type,
+        user_profile.company,
+        user_profile.created_at.strftime('%Y-%m-%d %H:%M:%S')
+    ]
+
+
 class UserProfileInline(admin.StackedInline):
     model = UserProfile
     can_delete = False
@@ -36,38 +77,10 @@ class CustomUserAdmin(UserAdmin):
     
     @admin.action(description='Export selected users to CSV')
     def export_users_csv(self, request, queryset):
-        """Export selected users to CSV file."""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="users_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow([
-            'Username', 'Email', 'First Name', 'Last Name', 'User Type', 
-            'Company', 'Is Staff', 'Is Active', 'Date Joined', 'Last Login'
-        ])
-        
-        for user in queryset:
-            try:
-                user_type = user.user_profile.user_type
-                company = user.user_profile.company
-            except UserProfile.DoesNotExist:
-                user_type = 'No Profile'
-                company = 'N/A'
-            
-            writer.writerow([
-                user.username,
-                user.email,
-                user.first_name,
-                user.last_name,
-                user_type,
-                company,
-                user.is_staff,
-                user.is_active,
-                user.date_joined.strftime('%Y-%m-%d %H:%M:%S'),
-                user.last_login.strftime('%Y-%m-%d %H:%M:%S') if user.last_login else 'Never'
-            ])
-        
-        return response
+        """Stream selected users to a CSV file."""
+        return streaming_csv_response(
+            queryset, 'users_export', USER_EXPORT_HEADER, user_export_row, select_related=('user_profile',)
+        )
 
 
 @admin.register(UserProfile)
@@ -80,25 +93,11 @@ class UserProfileAdmin(admin.ModelAdmin):
     
     @admin.action(description='Export selected user profiles to CSV')
     def export_user_profiles_csv(self, request, queryset):
-        """Export selected user profiles to CSV file."""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="user_profiles_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow([
-            'User', 'User Email', 'User Type', 'Company', 'Created At'
-        ])
-        
-        for user_profile in queryset:
-            writer.writerow([
-                user_profile.user.username,
-                user_profile.user.email,
-                user_profile.user_type,
-                user_profile.company,
-                user_profile.created_at.strftime('%Y-%m-%d %H:%M:%S')
-            ])
-        
-        return response
+        """Stream selected user profiles to a CSV file."""
+        return streaming_csv_response(
+            queryset, 'user_profiles_export', USER_PROFILE_EXPORT_HEADER, user_profile_export_row,
+            select_related=('user',)
+        )
 
 
 # Unregister the default User admin and register our custom one
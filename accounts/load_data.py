@@ -0,0 +1,374 @@
+import random
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import UserProfile
+from accounts.utils import normalize_company
+from applications.models import Application
+from communications.models import Message
+from jobs.models import Job
+from profiles.models import Profile, SavedCandidateSearch
+
+
+# (location, latitude, longitude, relative population weight)
+CITIES = [
+    ('New York, NY', 40.7128, -74.0060, 20),
+    ('Los Angeles, CA', 34.0522, -118.2437, 12),
+    ('Chicago, IL', 41.8781, -87.6298, 9),
+    ('Houston, TX', 29.7604, -95.3698, 7),
+    ('Phoenix, AZ', 33.4484, -112.0740, 5),
+    ('Philadelphia, PA', 39.9526, -75.1652, 5),
+    ('San Antonio, TX', 29.4241, -98.4936, 4),
+    ('San Diego, CA', 32.7157, -117.1611, 4),
+    ('Dallas, TX', 32.7767, -96.7970, 6),
+    ('San Jose, CA', 37.3382, -121.8863, 5),
+    ('Austin, TX', 30.2672, -97.7431, 6),
+    ('San Francisco, CA', 37.7749, -122.4194, 9),
+    ('Seattle, WA', 47.6062, -122.3321, 8),
+    ('Denver, CO', 39.7392, -104.9903, 5),
+    ('Boston, MA', 42.3601, -71.0589, 7),
+    ('Atlanta, GA', 33.7490, -84.3880, 8),
+    ('Miami, FL', 25.7617, -80.1918, 4),
+    ('Tampa, FL', 27.9506, -82.4572, 3),
+    ('Detroit, MI', 42.3314, -83.0458, 3),
+    ('Washington DC', 38.9072, -77.0369, 6),
+]
+
+# (skill, relative popularity weight)
+SKILLS = [
+    ('Python', 30), ('JavaScript', 28), ('SQL', 25), ('Java', 18), ('React', 18),
+    ('AWS', 16), ('Django', 10), ('Docker', 12), ('TypeScript', 12), ('Git', 20),
+    ('Node.js', 10), ('C++', 8), ('Go', 6), ('Kubernetes', 7), ('PostgreSQL', 9),
+    ('Machine Learning', 8), ('Pandas', 7), ('Excel', 10), ('Figma', 5), ('Rust', 3),
+    ('Spark', 4), ('Tableau', 5), ('Linux', 9), ('C#', 7), ('Terraform', 4),
+    ('GraphQL', 4), ('Swift', 3), ('Kotlin', 3), ('Airflow', 3), ('Redis', 5),
+]
+
+JOB_TITLES = [
+    'Software Engineer', 'Backend Engineer', 'Frontend Engineer', 'Full Stack Developer',
+    'Data Analyst', 'Data Scientist', 'Data Engineer', 'DevOps Engineer',
+    'Machine Learning Engineer', 'Product Designer', 'QA Engineer', 'Site Reliability Engineer',
+    'Mobile Developer', 'Security Engineer', 'Product Manager', 'Solutions Architect',
+]
+
+COMPANIES = [
+    'Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Stark Industries',
+    'Wayne Enterprises', 'Cyberdyne', 'Soylent', 'Tyrell Systems', 'Wonka Analytics',
+    'Vandelay Industries', 'Pied Piper', 'Massive Dynamic', 'Aperture Science',
+    'Oscorp', 'Gringotts Financial', 'Monarch Solutions', 'Nakatomi Trading', 'Dunder Mifflin',
+]
+
+FIRST_NAMES = [
+    'Alex', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Avery', 'Quinn', 'Parker',
+    'Priya', 'Wei', 'Mateo', 'Aisha', 'Noah', 'Sofia', 'Liam', 'Emma', 'Kenji', 'Fatima',
+]
+
+LAST_NAMES = [
+    'Smith', 'Johnson', 'Lee', 'Garcia', 'Patel', 'Nguyen', 'Brown', 'Kim', 'Martinez', 'Chen',
+    'Davis', 'Lopez', 'Wilson', 'Anderson', 'Thomas', 'Khan', 'Moore', 'Clark', 'Lewis', 'Young',
+]
+
+# (value, relative weight)
+APPLICATION_STATUS_WEIGHTS = [
+    (Application.Status.APPLIED, 50),
+    (Application.Status.REVIEW, 20),
+    (Application.Status.INTERVIEW, 12),
+    (Application.Status.OFFER, 5),
+    (Application.Status.CLOSED, 13),
+]
+JOB_STATUS_WEIGHTS = [('active', 80), ('paused', 8), ('closed', 12)]
+WORK_TYPE_WEIGHTS = [('on_site', 50), ('hybrid', 30), ('remote', 20)]
+EMPLOYMENT_TYPE_WEIGHTS = [
+    ('full_time', 70), ('part_time', 8), ('contract', 10), ('internship', 10), ('temporary', 2),
+]
+EXPERIENCE_LEVEL_WEIGHTS = [('entry', 35), ('mid', 40), ('senior', 20), ('executive', 5)]
+
+
+def default_sizes(users):
+    """
+    Derive dataset sizes from the number of job seekers.
+
+    Uses one recruiter per ten seekers, one job per five seekers, two
+    applications and two messages per seeker and two saved searches per recruiter.
+
+    Args:
+        users (int): Number of job seeker accounts
+
+    Returns:
+        dict: Keyword arguments for ``LoadDataGenerator.generate``
+    """
+    recruiters = max(1, users // 10)
+    return {
+        'seekers': users,
+        'recruiters': recruiters,
+        'jobs': max(1, users // 5),
+        'applications': users * 2,
+        'messages': users * 2,
+        'saved_searches': recruiters * 2,
+    }
+
+
+def batched(iterable, size):
+    """Yield lists of at most ``size`` items from an iterable."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class LoadDataGenerator:
+    """
+    Produce production-shaped data with ``bulk_create`` for load testing.
+
+    All choices come from one ``random.Random(seed)`` stream and rows are
+    generated in a fixed order, so the same seed and sizes always produce the
+    same dataset. Every generated username starts with ``prefix`` so the data
+    can be cleared again without touching real accounts.
+    """
+
+    def __init__(self, seed=0, prefix='load_', batch_size=2000, log=None):
+        self.random = random.Random(seed)
+        self.prefix = prefix
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self.password = make_password('loadtest123')
+        self.seeker_ids = []
+        self.recruiter_ids = []
+        self.recruiter_companies = {}
+        self.job_rows = []
+
+    def _choice(self, weighted):
+        values, weights = zip(*weighted)
+        return self.random.choices(values, weights=weights)[0]
+
+    def _city(self):
+        city = self.random.choices(CITIES, weights=[row[3] for row in CITIES])[0]
+        return city[0], city[1], city[2]
+
+    def _skills(self, low, high):
+        count = self.random.randint(low, high)
+        names, weights = zip(*SKILLS)
+        picked = []
+        while len(picked) < count:
+            skill = self.random.choices(names, weights=weights)[0]
+            if skill not in picked:
+                picked.append(skill)
+        return ', '.join(picked)
+
+    def has_existing_data(self):
+        """Return True if accounts with this generator's prefix already exist."""
+        return User.objects.filter(username__startswith=self.prefix).exists()
+
+    def clear(self):
+        """Delete previously generated users and everything that cascades from them."""
+        deleted, _ = User.objects.filter(username__startswith=self.prefix).delete()
+        return deleted
+
+    def generate(self, seekers=1000, recruiters=100, jobs=200, applications=2000,
+                 messages=2000, saved_searches=200):
+        """
+        Generate a full dataset and return the number of rows created per model.
+
+        Args:
+            seekers (int): Job seeker accounts, each with a profile
+            recruiters (int): Recruiter accounts spread across the company list
+            jobs (int): Job postings owned by recruiters
+            applications (int): Applications from seekers to postings
+            messages (int): Messages between seekers and recruiters
+            saved_searches (int): Saved candidate searches owned by recruiters
+
+        Returns:
+            dict: Created row counts keyed by model name
+        """
+        counts = {
+            'users': self._create_users(seekers, recruiters),
+            'jobs': self._create_jobs(jobs),
+        }
+        counts['applications'] = self._create_applications(applications)
+        counts['messages'] = self._create_messages(messages)
+        counts['saved_searches'] = self._create_saved_searches(saved_searches)
+        return counts
+
+    def _create_users(self, seekers, recruiters):
+        total = 0
+        plan = [('job_seeker', seekers), ('recruiter', recruiters)]
+        index = 0
+        for user_type, count in plan:
+            for batch in batched(range(count), self.batch_size):
+                users = []
+                for _ in batch:
+                    first = self.random.choice(FIRST_NAMES)
+                    last = self.random.choice(LAST_NAMES)
+                    username = f'{self.prefix}{index:07d}'
+                    index += 1
+                    users.append(User(
+                        username=username,
+                        email=f'{username}@example.com',
+                        first_name=first,
+                        last_name=last,
+                        password=self.password,
+                    ))
+                with transaction.atomic():
+                    users = User.objects.bulk_create(users)
+                    if user_type == 'job_seeker':
+                        self._create_seeker_rows(users)
+                    else:
+                        self._create_recruiter_rows(users)
+                total += len(users)
+                self.log(f'Created {total} users')
+        return total
+
+    def _create_seeker_rows(self, users):
+        user_profiles = []
+        profiles = []
+        for user in users:
+            location, _, _ = self._city()
+            user_profiles.append(UserProfile(user=user, user_type='job_seeker'))
+            profiles.append(Profile(
+                user=user,
+                headline=self.random.choice(JOB_TITLES),
+                bio=f'{user.first_name} builds things with {self._skills(1, 2)}.',
+                location=location if self.random.random() < 0.9 else 'Remote',
+                skills=self._skills(3, 8),
+                education=self.random.choice(['BS Computer Science', 'BA Economics', 'MS Data Science', 'Bootcamp']),
+                work_experience=f'Worked at {self.random.choice(COMPANIES)} on {self._skills(1, 2)} projects.',
+                is_public=self.random.random() < 0.9,
+                show_location=self.random.random() < 0.85,
+                commute_radius=self.random.choice([10, 25, 50, 100]),
+            ))
+            self.seeker_ids.append(user.id)
+        UserProfile.objects.bulk_create(user_profiles)
+        Profile.objects.bulk_create(profiles)
+
+    def _create_recruiter_rows(self, users):
+        user_profiles = []
+        for user in users:
+            company = self.random.choice(COMPANIES)
+            user_profiles.append(UserProfile(
+                user=user, user_type='recruiter', company=company, company_key=normalize_company(company)
+            ))
+            self.recruiter_ids.append(user.id)
+            self.recruiter_companies[user.id] = company
+        UserProfile.objects.bulk_create(user_profiles)
+
+    def _create_jobs(self, count):
+        if not self.recruiter_ids:
+            return 0
+        total = 0
+        for batch in batched(range(count), self.batch_size):
+            jobs = []
+            for _ in batch:
+                recruiter_id = self.random.choice(self.recruiter_ids)
+                company = self.recruiter_companies[recruiter_id]
+                work_type = self._choice(WORK_TYPE_WEIGHTS)
+                location, lat, lon = self._city()
+                has_coordinates = work_type != 'remote' and self.random.random() < 0.8
+                salary_min = self.random.randrange(40000, 160000, 5000)
+                jobs.append(Job(
+                    title=self.random.choice(JOB_TITLES),
+                    company=company,
+                    company_key=normalize_company(company),
+                    location='Remote' if work_type == 'remote' else location,
+                    latitude=round(lat + self.random.uniform(-0.2, 0.2), 6) if has_coordinates else None,
+                    longitude=round(lon + self.random.uniform(-0.2, 0.2), 6) if has_coordinates else None,
+                    employment_type=self._choice(EMPLOYMENT_TYPE_WEIGHTS),
+                    experience_level=self._choice(EXPERIENCE_LEVEL_WEIGHTS),
+                    work_type=work_type,
+                    skills_required=self._skills(2, 6),
+                    visa_sponsorship=self.random.random() < 0.25,
+                    description='Join our team to design, build and ship reliable software.',
+                    requirements='Experience with modern tooling and a collaborative mindset.',
+                    salary_min=salary_min if self.random.random() < 0.7 else None,
+                    salary_max=salary_min + self.random.randrange(10000, 60000, 5000) if self.random.random() < 0.7 else None,
+                    recruiter_id=recruiter_id,
+                    status=self._choice(JOB_STATUS_WEIGHTS),
+                ))
+            with transaction.atomic():
+                jobs = Job.objects.bulk_create(jobs)
+            self.job_rows.extend((job.id, job.title, job.company) for job in jobs)
+            total += len(jobs)
+            self.log(f'Created {total} jobs')
+        return total
+
+    def _create_applications(self, count):
+        if not self.seeker_ids or not self.job_rows:
+            return 0
+        # applied_on is always today, so (user, title, company) must stay unique
+        used = set()
+        total = 0
+        attempts = 0
+        while total < count and attempts < count * 3:
+            applications = []
+            while len(applications) < min(self.batch_size, count - total) and attempts < count * 3:
+                attempts += 1
+                user_id = self.random.choice(self.seeker_ids)
+                job_id, title, company = self.random.choice(self.job_rows)
+                key = (user_id, title, company)
+                if key in used:
+                    continue
+                used.add(key)
+                applications.append(Application(
+                    user_id=user_id,
+                    job_id=job_id,
+                    job_title=title,
+                    company_name=company,
+                    company_key=normalize_company(company),
+                    status=self._choice(APPLICATION_STATUS_WEIGHTS),
+                ))
+            if not applications:
+                break
+            with transaction.atomic():
+                Application.objects.bulk_create(applications)
+            total += len(applications)
+            self.log(f'Created {total} applications')
+        return total
+
+    def _create_messages(self, count):
+        if not self.seeker_ids or not self.recruiter_ids:
+            return 0
+        total = 0
+        now = timezone.now()
+        for batch in batched(range(count), self.batch_size):
+            messages = []
+            for _ in batch:
+                seeker_id = self.random.choice(self.seeker_ids)
+                recruiter_id = self.random.choice(self.recruiter_ids)
+                from_seeker = self.random.random() < 0.5
+                messages.append(Message(
+                    sender_id=seeker_id if from_seeker else recruiter_id,
+                    recipient_id=recruiter_id if from_seeker else seeker_id,
+                    subject=f'About the {self.random.choice(JOB_TITLES)} role',
+                    body='Hi, I wanted to follow up on the position. Looking forward to hearing from you.',
+                    read_at=now if self.random.random() < 0.6 else None,
+                ))
+            with transaction.atomic():
+                Message.objects.bulk_create(messages)
+            total += len(messages)
+            self.log(f'Created {total} messages')
+        return total
+
+    def _create_saved_searches(self, count):
+        if not self.recruiter_ids:
+            return 0
+        total = 0
+        for batch in batched(range(count), self.batch_size):
+            searches = []
+            for _ in batch:
+                location, _, _ = self._city()
+                searches.append(SavedCandidateSearch(
+                    user_id=self.random.choice(self.recruiter_ids),
+                    skills=self._skills(1, 3),
+                    location=location.split(',')[0] if self.random.random() < 0.6 else '',
+                    projects=self.random.choice(['', '', 'api', 'dashboard', 'pipeline']),
+                ))
+            with transaction.atomic():
+                SavedCandidateSearch.objects.bulk_create(searches)
+            total += len(searches)
+            self.log(f'Created {total} saved searches')
+        return total
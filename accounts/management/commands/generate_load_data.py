@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.load_data import LoadDataGenerator, default_sizes
+
+
+class Command(BaseCommand):
+    help = 'Generate a large, deterministic synthetic dataset for load and performance testing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000, help='Job seeker accounts to create')
+        parser.add_argument('--recruiters', type=int, default=None,
+                            help='Recruiter accounts to create (default: a tenth of --users)')
+        parser.add_argument('--jobs', type=int, default=None, help='Job postings (default: a fifth of --users)')
+        parser.add_argument('--applications', type=int, default=None,
+                            help='Applications (default: two per job seeker)')
+        parser.add_argument('--messages', type=int, default=None, help='Messages (default: two per job seeker)')
+        parser.add_argument('--saved-searches', type=int, default=None,
+                            help='Saved candidate searches (default: two per recruiter)')
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed yields the same data')
+        parser.add_argument('--batch-size', type=int, default=2000, help='Rows per bulk insert')
+        parser.add_argument('--prefix', default='load_', help='Username prefix marking generated accounts')
+        parser.add_argument('--clear', action='store_true',
+                            help='Delete previously generated accounts with this prefix first')
+
+    def handle(self, *args, **options):
+        sizes = default_sizes(options['users'])
+        for name in ('recruiters', 'jobs', 'applications', 'messages', 'saved_searches'):
+            if options[name] is not None:
+                sizes[name] = options[name]
+        if options['saved_searches'] is None:
+            sizes['saved_searches'] = sizes['recruiters'] * 2
+        if any(value < 0 for value in sizes.values()):
+            raise CommandError('Sizes must not be negative.')
+
+        generator = LoadDataGenerator(
+            seed=options['seed'],
+            prefix=options['prefix'],
+            batch_size=options['batch_size'],
+            log=lambda message: self.stdout.write(message) if options['verbosity'] > 1 else None,
+        )
+        if options['clear']:
+            deleted = generator.clear()
+            self.stdout.write(f'Deleted {deleted} previously generated rows.')
+        elif generator.has_existing_data():
+            raise CommandError(
+                f"Accounts prefixed '{options['prefix']}' already exist; use --clear or another --prefix."
+            )
+
+        started = time.monotonic()
+        counts = generator.generate(**sizes)
+        elapsed = time.monotonic() - started
+
+        summary = ', '.join(f'{count} {name.replace("_", " ")}' for name, count in counts.items())
+        self.stdout.write(self.style.SUCCESS(f'Generated {summary} in {elapsed:.1f}s.'))
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.14 on 2026-10-19 05:09
+
+from django.db import migrations, models
+
+from accounts.utils import normalize_company
+
+
+def backfill_company_keys(apps, schema_editor):
+    UserProfile = apps.get_model('accounts', 'UserProfile')
+    batch = []
+    for obj in UserProfile.objects.only('id', 'company').iterator(chunk_size=1000):
+        obj.company_key = normalize_company(obj.company)
+        batch.append(obj)
+        if len(batch) >= 1000:
+            UserProfile.objects.bulk_update(batch, ['company_key'])
+            batch = []
+    if batch:
+        UserProfile.objects.bulk_update(batch, ['company_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='company_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Normalized company name used for indexed company lookups', max_length=200),
+        ),
+        migrations.RunPython(backfill_company_keys, migrations.RunPython.noop),
+    ]
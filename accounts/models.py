@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import User
 
+from .utils import CompanyKeyQuerySet, normalize_company
+
 
 class UserProfile(models.Model):
     """Extended user profile to store user type and additional information."""
@@ -21,14 +23,31 @@ class UserProfile(models.Model):
         blank=True,
         help_text="Company name (for recruiters)"
     )
+    company_key = models.CharField(
+        max_length=200,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Normalized company name used for indexed company lookups"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    company_key_source = 'company'
+    objects = CompanyKeyQuerySet.as_manager()
     
     class Meta:
         ordering = ['-created_at']
     
     def __str__(self):
         return f"{self.user.username} ({self.get_user_type_display()})"
+
+    def save(self, *args, **kwargs):
+        self.company_key = normalize_company(self.company)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'company' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'company_key'}
+        super().save(*args, **kwargs)
     
     def is_job_seeker(self):
         """Check if user is a job seeker."""
@@ -0,0 +1,67 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from accounts.load_data import LoadDataGenerator
+from accounts.models import UserProfile
+from applications.models import Application
+from communications.models import Message
+from jobs.models import Job
+from profiles.models import Profile, SavedCandidateSearch
+
+
+User = get_user_model()
+
+SIZES = dict(seekers=40, recruiters=5, jobs=20, applications=80, messages=60, saved_searches=10)
+
+
+class GenerateLoadDataTests(TestCase):
+    def _snapshot(self):
+        return {
+            'profiles': list(Profile.objects.order_by('user__username').values_list(
+                'user__username', 'location', 'skills', 'is_public')),
+            'jobs': list(Job.objects.order_by('id').values_list(
+                'title', 'company', 'location', 'status', 'skills_required', 'latitude')),
+            'applications': list(Application.objects.order_by('id').values_list(
+                'user__username', 'job_title', 'company_name', 'status')),
+        }
+
+    def test_generates_requested_sizes(self):
+        counts = LoadDataGenerator(seed=1, batch_size=7).generate(**SIZES)
+
+        self.assertEqual(counts['users'], 45)
+        self.assertEqual(User.objects.filter(username__startswith='load_').count(), 45)
+        self.assertEqual(Profile.objects.count(), 40)
+        self.assertEqual(UserProfile.objects.filter(user_type='recruiter').count(), 5)
+        self.assertEqual(Job.objects.count(), 20)
+        self.assertEqual(Application.objects.count(), counts['applications'])
+        self.assertEqual(Message.objects.count(), 60)
+        self.assertEqual(SavedCandidateSearch.objects.count(), 10)
+
+    def test_company_keys_are_set_despite_bulk_create(self):
+        LoadDataGenerator(seed=1).generate(**SIZES)
+
+        self.assertFalse(Job.objects.filter(company_key='').exists())
+        self.assertFalse(Application.objects.filter(company_key='').exists())
+        self.assertFalse(UserProfile.objects.filter(user_type='recruiter', company_key='').exists())
+
+    def test_same_seed_produces_same_data(self):
+        generator = LoadDataGenerator(seed=42)
+        generator.generate(**SIZES)
+        first = self._snapshot()
+        generator.clear()
+
+        LoadDataGenerator(seed=42).generate(**SIZES)
+        self.assertEqual(first, self._snapshot())
+
+    def test_command_refuses_to_duplicate_existing_data(self):
+        call_command('generate_load_data', users=10, stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command('generate_load_data', users=10, stdout=StringIO())
+
+        call_command('generate_load_data', users=10, clear=True, stdout=StringIO())
+        self.assertEqual(User.objects.filter(username__startswith='load_').count(), 11)
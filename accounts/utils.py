@@ -0,0 +1,62 @@
+from django.db import models
+
+
+def normalize_company(company_name):
+    """
+    Return the canonical lookup key for a company name.
+
+    Keys are case-folded with surrounding and repeated whitespace collapsed, so
+    "Acme  Corp" and "acme corp" resolve to the same indexed value and company
+    checks can use an equality lookup instead of an ``iexact`` scan.
+
+    Args:
+        company_name (str): Company name as entered by a user
+
+    Returns:
+        str: Normalized company key ('' when no company is given)
+    """
+    if not company_name:
+        return ''
+    return ' '.join(company_name.split()).casefold()
+
+
+class CompanyKeyQuerySet(models.QuerySet):
+    """
+    QuerySet keeping ``company_key`` in step with the company name on bulk writes.
+
+    ``save()`` recomputes the key, but ``bulk_create``, ``bulk_update`` and
+    ``update`` bypass it, and company permission checks compare the key
+    alone. The model names the column the key is derived from in
+    ``company_key_source``.
+    """
+
+    def _with_keys(self, objs):
+        source = self.model.company_key_source
+        objs = list(objs)
+        for obj in objs:
+            obj.company_key = normalize_company(getattr(obj, source))
+        return objs
+
+    def _with_key_field(self, fields):
+        if fields and self.model.company_key_source in fields and 'company_key' not in fields:
+            return [*fields, 'company_key']
+        return fields
+
+    def bulk_create(self, objs, *args, **kwargs):
+        # Upserts rewrite the key along with the name
+        kwargs['update_fields'] = self._with_key_field(kwargs.get('update_fields'))
+        return super().bulk_create(self._with_keys(objs), *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        if self.model.company_key_source in fields:
+            objs = self._with_keys(objs)
+            fields = self._with_key_field(fields)
+        return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def update(self, **kwargs):
+        source = self.model.company_key_source
+        if source in kwargs and 'company_key' not in kwargs:
+            if hasattr(kwargs[source], 'resolve_expression'):
+                raise TypeError(f"Pass company_key along with an expression for {source}.")
+            kwargs['company_key'] = normalize_company(kwargs[source])
+        return super().update(**kwargs)
@@ -1,8 +1,29 @@
+from django.conf import settings
 from django.contrib import admin
-from django.http import HttpResponse
-from django.utils import timezone
-import csv
-from .models import Application
+
+from exports.admin import queue_export, queue_export_action
+from exports.utils import streaming_csv_response
+from .models import Application, ApplicationStatusEvent
+
+
+APPLICATION_EXPORT_HEADER = [
+    'User', 'User Email', 'Job Title', 'Company Name', 'Status',
+    'Applied On', 'Notes', 'Created At', 'Updated At'
+]
+
+
+def application_export_row(application):
+    return [
+        application.user.username,
+        application.user.email,
+        application.job_title,
+        application.company_name,
+        application.status,
+        application.applied_on.strftime('%Y-%m-%d'),
+        application.notes,
+        application.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+        application.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+    ]
 
 
 @admin.register(Application)
@@ -26,7 +47,11 @@ class ApplicationAdmin(admin.ModelAdmin):
         })
     )
     
-    actions = ['mark_as_review', 'mark_as_interview', 'mark_as_offer', 'mark_as_closed', 'export_applications_csv']
+    actions = [
+        'mark_as_review', 'mark_as_interview', 'mark_as_offer', 'mark_as_closed', 'export_applications_csv',
+        queue_export_action('applications', 'csv', 'Queue background CSV export of selected applications'),
+        queue_export_action('applications', 'jsonl', 'Queue background JSON Lines export of selected applications'),
+    ]
     
     @admin.action(description='Mark selected applications as Review')
     def mark_as_review(self, request, queryset):
@@ -50,27 +75,19 @@ class ApplicationAdmin(admin.ModelAdmin):
     
     @admin.action(description='Export selected applications to CSV')
     def export_applications_csv(self, request, queryset):
-        """Export selected applications to CSV file."""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="applications_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow([
-            'User', 'User Email', 'Job Title', 'Company Name', 'Status', 
-            'Applied On', 'Notes', 'Created At', 'Updated At'
-        ])
-        
-        for application in queryset:
-            writer.writerow([
-                application.user.username,
-                application.user.email,
-                application.job_title,
-                application.company_name,
-                application.status,
-                application.applied_on.strftime('%Y-%m-%d'),
-                application.notes,
-                application.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                application.updated_at.strftime('%Y-%m-%d %H:%M:%S')
-            ])
-        
-        return response
+        """Stream selected applications to a CSV file, or queue a background export for large selections."""
+        if queryset.count() > settings.EXPORT_INLINE_MAX_ROWS:
+            return queue_export(self, request, queryset, 'applications', 'csv')
+        return streaming_csv_response(
+            queryset, 'applications_export', APPLICATION_EXPORT_HEADER, application_export_row,
+            select_related=('user',)
+        )
+
+
+@admin.register(ApplicationStatusEvent)
+class ApplicationStatusEventAdmin(admin.ModelAdmin):
+    list_display = ('application', 'from_status', 'to_status', 'at', 'actor')
+    list_filter = ('to_status', 'at')
+    list_select_related = ('application', 'actor')
+    raw_id_fields = ('application', 'job', 'actor')
+    date_hierarchy = 'at'
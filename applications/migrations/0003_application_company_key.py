@@ -0,0 +1,34 @@
+# Generated by Django 5.0.14 on 2026-10-19 05:09
+
+from django.db import migrations, models
+
+from accounts.utils import normalize_company
+
+
+def backfill_company_keys(apps, schema_editor):
+    Application = apps.get_model('applications', 'Application')
+    batch = []
+    for obj in Application.objects.only('id', 'company_name').iterator(chunk_size=1000):
+        obj.company_key = normalize_company(obj.company_name)
+        batch.append(obj)
+        if len(batch) >= 1000:
+            Application.objects.bulk_update(batch, ['company_key'])
+            batch = []
+    if batch:
+        Application.objects.bulk_update(batch, ['company_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_application_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='company_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Normalized company name used for indexed company lookups', max_length=200),
+        ),
+        migrations.RunPython(backfill_company_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-19 05:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_applicationstatusdaily_applicationstatusevent'),
+        ('jobs', '0006_job_job_active_created_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', '-updated_at'], name='application_user_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['company_key', '-updated_at'], name='application_company_upd_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.14 on 2026-10-19 07:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_application_application_user_updated_idx_and_more'),
+        ('jobs', '0007_geocoderequest'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicationstatusevent',
+            name='job',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Job the application was linked to when the event happened', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='jobs.job'),
+        ),
+    ]
@@ -1,5 +1,8 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
+
+from accounts.utils import CompanyKeyQuerySet, normalize_company
 
 
 class Application(models.Model):
@@ -34,6 +37,13 @@ class Application(models.Model):
     )
     job_title = models.CharField(max_length=200)
     company_name = models.CharField(max_length=200)
+    company_key = models.CharField(
+        max_length=200,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Normalized company name used for indexed company lookups"
+    )
     status = models.CharField(
         max_length=20,
         choices=Status.choices,
@@ -44,13 +54,27 @@ class Application(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    company_key_source = 'company_name'
+    objects = CompanyKeyQuerySet.as_manager()
+
     class Meta:
         ordering = ['-updated_at']
         unique_together = ('user', 'job_title', 'company_name', 'applied_on')
+        indexes = [
+            models.Index(fields=['user', '-updated_at'], name='application_user_updated_idx'),
+            models.Index(fields=['company_key', '-updated_at'], name='application_company_upd_idx'),
+        ]
 
     def __str__(self):
         return f"{self.job_title} at {self.company_name} ({self.get_status_display()})"
 
+    def save(self, *args, **kwargs):
+        self.company_key = normalize_company(self.company_name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'company_name' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'company_key'}
+        super().save(*args, **kwargs)
+
     @property
     def status_index(self) -> int:
         """Zero-based position of current status in the pipeline."""
@@ -69,3 +93,73 @@ class Application(models.Model):
     def status_badge_class(self) -> str:
         """Bootstrap class for displaying a colored badge for the current status."""
         return self.STATUS_BADGE_CLASSES.get(self.status, 'bg-secondary text-dark')
+
+
+class ApplicationStatusEvent(models.Model):
+    """Append-only log of an application entering a pipeline status."""
+
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name='status_events'
+    )
+    job = models.ForeignKey(
+        'jobs.Job',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_index=False,
+        related_name='+',
+        help_text="Job the application was linked to when the event happened"
+    )
+    from_status = models.CharField(
+        max_length=10,
+        choices=Application.Status.choices,
+        blank=True,
+        help_text="Previous status (blank when the application was created)"
+    )
+    to_status = models.CharField(max_length=10, choices=Application.Status.choices)
+    at = models.DateTimeField(default=timezone.now)
+    seconds_in_previous = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Time spent in from_status before this change, in seconds"
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+'
+    )
+
+    class Meta:
+        ordering = ['at']
+        indexes = [
+            models.Index(fields=['job', 'to_status', 'at'], name='appevent_job_status_at_idx'),
+            models.Index(fields=['application', 'at'], name='appevent_application_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"Application {self.application_id}: {self.from_status or '-'} -> {self.to_status}"
+
+
+class ApplicationStatusDaily(models.Model):
+    """Per-job, per-day counters maintained alongside status events for funnel reports."""
+
+    job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE, related_name='+')
+    day = models.DateField()
+    status = models.CharField(max_length=10, choices=Application.Status.choices)
+    entered = models.PositiveIntegerField(default=0)
+    exited = models.PositiveIntegerField(default=0)
+    seconds_in_status = models.PositiveBigIntegerField(
+        default=0,
+        help_text="Total time spent in this status by applications that left it on this day"
+    )
+
+    class Meta:
+        ordering = ['-day']
+        unique_together = ('job', 'day', 'status')
+
+    def __str__(self):
+        return f"Job {self.job_id} {self.status} on {self.day}: +{self.entered}/-{self.exited}"
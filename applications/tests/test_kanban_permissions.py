@@ -0,0 +1,234 @@
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, connection
+from django.db.models.functions import Upper
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from accounts.models import UserProfile
+from applications.models import Application
+from applications.utils import application_belongs_to_company, bulk_update_application_status
+from jobs.models import Job
+
+
+User = get_user_model()
+
+
+class KanbanCompanyOwnershipTests(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        UserProfile.objects.create(user=self.recruiter, user_type='recruiter', company='Acme Corp')
+        self.applicant = User.objects.create_user('alice', 'alice@example.com', 'password123')
+
+    def _create_job(self, company='Acme Corp', recruiter=None):
+        return Job.objects.create(
+            title='Backend Engineer',
+            company=company,
+            location='Atlanta, GA',
+            description='Build APIs',
+            requirements='Python',
+            recruiter=recruiter or self.recruiter,
+        )
+
+    def _post_status(self, application, status):
+        return self.client.post(
+            reverse('applications:update_status_ajax', args=[application.pk]),
+            {'status': status},
+        )
+
+    def test_company_key_is_normalized(self):
+        job = self._create_job(company='  ACME   corp ')
+        self.assertEqual(job.company_key, 'acme corp')
+        self.assertEqual(self.recruiter.user_profile.company_key, 'acme corp')
+
+    def test_company_key_follows_bulk_writes(self):
+        job = self._create_job()
+        application = Application.objects.create(
+            user=self.applicant, job=job, job_title='Backend Engineer', company_name='Acme Corp'
+        )
+        profile = self.recruiter.user_profile
+
+        Job.objects.filter(pk=job.pk).update(company='Globex  Inc')
+        Application.objects.filter(pk=application.pk).update(company_name=' GLOBEX inc')
+        job.refresh_from_db()
+        application.refresh_from_db()
+        self.assertEqual((job.company_key, application.company_key), ('globex inc', 'globex inc'))
+        self.assertTrue(application_belongs_to_company(application.pk, 'globex inc'))
+
+        profile.company = 'Initech'
+        UserProfile.objects.bulk_update([profile], ['company'])
+        profile.refresh_from_db()
+        self.assertEqual(profile.company_key, 'initech')
+
+        created = Job.objects.bulk_create([Job(
+            title='SRE', company=' Initech ', location='Remote', description='d', requirements='r',
+            recruiter=self.recruiter,
+        )])
+        self.assertEqual(Job.objects.get(pk=created[0].pk).company_key, 'initech')
+
+    def test_update_with_a_company_expression_needs_a_key(self):
+        self._create_job()
+
+        with self.assertRaises(TypeError):
+            Job.objects.update(company=Upper('company'))
+
+    def test_belongs_to_company_matches_job_company_and_company_name(self):
+        other = User.objects.create_user('otto', 'otto@example.com', 'password123')
+        job = self._create_job(company='acme corp', recruiter=other)
+        linked = Application.objects.create(
+            user=self.applicant, job=job, job_title='Backend Engineer', company_name='Other'
+        )
+        by_name = Application.objects.create(
+            user=self.applicant, job_title='Designer', company_name='ACME Corp'
+        )
+        unrelated = Application.objects.create(
+            user=self.applicant, job_title='Analyst', company_name='Globex'
+        )
+
+        self.assertTrue(application_belongs_to_company(linked.pk, 'Acme Corp'))
+        self.assertTrue(application_belongs_to_company(by_name.pk, 'Acme Corp'))
+        self.assertFalse(application_belongs_to_company(unrelated.pk, 'Acme Corp'))
+        self.assertFalse(application_belongs_to_company(unrelated.pk, ''))
+
+    def test_recruiter_can_move_company_application(self):
+        job = self._create_job()
+        application = Application.objects.create(
+            user=self.applicant, job=job, job_title='Backend Engineer', company_name='Acme Corp'
+        )
+
+        self.client.force_login(self.recruiter)
+        response = self._post_status(application, Application.Status.INTERVIEW)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        application.refresh_from_db()
+        self.assertEqual(application.status, Application.Status.INTERVIEW)
+
+    def test_recruiter_cannot_move_other_company_application(self):
+        application = Application.objects.create(
+            user=self.applicant, job_title='Analyst', company_name='Globex'
+        )
+
+        self.client.force_login(self.recruiter)
+        response = self._post_status(application, Application.Status.OFFER)
+
+        self.assertEqual(response.status_code, 403)
+        application.refresh_from_db()
+        self.assertEqual(application.status, Application.Status.APPLIED)
+
+    def test_query_count_does_not_grow_with_company_jobs(self):
+        job = self._create_job()
+        application = Application.objects.create(
+            user=self.applicant, job=job, job_title='Backend Engineer', company_name='Acme Corp'
+        )
+        self.client.force_login(self.recruiter)
+
+        with CaptureQueriesContext(connection) as small:
+            self._post_status(application, Application.Status.REVIEW)
+
+        for _ in range(25):
+            self._create_job()
+
+        with CaptureQueriesContext(connection) as large:
+            self._post_status(application, Application.Status.INTERVIEW)
+
+        self.assertEqual(len(small), len(large))
+
+
+class BulkStatusUpdateTests(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        UserProfile.objects.create(user=self.recruiter, user_type='recruiter', company='Acme Corp')
+        self.applicant = User.objects.create_user('alice', 'alice@example.com', 'password123')
+        self.client.force_login(self.recruiter)
+
+    def _create_application(self, title, company='Acme Corp'):
+        return Application.objects.create(user=self.applicant, job_title=title, company_name=company)
+
+    def _post(self, updates):
+        return self.client.post(
+            reverse('applications:bulk_update_status_ajax'),
+            data=json.dumps({'updates': updates}),
+            content_type='application/json',
+        )
+
+    def test_bulk_update_moves_cards_with_grouped_updates(self):
+        apps = [self._create_application(f'Role {i}') for i in range(6)]
+        updates = [
+            {'id': app.pk, 'status': Application.Status.REVIEW if i % 2 else Application.Status.OFFER}
+            for i, app in enumerate(apps)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self._post(updates)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(data['updated'], 6)
+        updates_sql = [q['sql'] for q in queries if q['sql'].startswith('UPDATE "applications_application"')]
+        self.assertEqual(len(updates_sql), 2)
+        for i, app in enumerate(apps):
+            app.refresh_from_db()
+            self.assertEqual(app.status, updates[i]['status'])
+
+    def test_bulk_update_reports_per_item_failures(self):
+        own = self._create_application('Backend Engineer')
+        foreign = self._create_application('Analyst', company='Globex')
+
+        response = self._post([
+            {'id': own.pk, 'status': Application.Status.INTERVIEW},
+            {'id': foreign.pk, 'status': Application.Status.INTERVIEW},
+            {'id': own.pk, 'status': Application.Status.CLOSED},
+        ])
+
+        results = response.json()['results']
+        self.assertTrue(results[0]['success'])
+        self.assertFalse(results[1]['success'])
+        self.assertFalse(results[2]['success'])
+        foreign.refresh_from_db()
+        self.assertEqual(foreign.status, Application.Status.APPLIED)
+
+    def test_stale_updated_at_is_reported_as_conflict(self):
+        application = self._create_application('Backend Engineer')
+        stale = application.updated_at
+        application.notes = 'Edited elsewhere'
+        application.save()
+
+        response = self._post([
+            {'id': application.pk, 'status': Application.Status.OFFER, 'updated_at': stale.isoformat()},
+        ])
+
+        result = response.json()['results'][0]
+        self.assertFalse(result['success'])
+        self.assertTrue(result['conflict'])
+        application.refresh_from_db()
+        self.assertEqual(application.status, Application.Status.APPLIED)
+
+    def test_row_lock_is_limited_to_applications(self):
+        application = self._create_application('Backend Engineer')
+        updates = [{'id': application.pk, 'status': Application.Status.OFFER}]
+
+        # SQLite has no row locks; pretend it does to see the SQL a PostgreSQL server gets
+        with mock.patch.object(connection.features, 'has_select_for_update', True), \
+                mock.patch.object(connection.features, 'has_select_for_update_of', True), \
+                CaptureQueriesContext(connection) as queries, self.assertRaises(DatabaseError):
+            bulk_update_application_status('Acme Corp', updates)
+
+        locking = [query['sql'] for query in queries if 'FOR UPDATE' in query['sql']]
+        self.assertEqual(len(locking), 1)
+        self.assertIn('LEFT OUTER JOIN', locking[0])
+        self.assertTrue(locking[0].endswith('FOR UPDATE OF "applications_application"'))
+
+        # The real query runs too
+        self.assertTrue(bulk_update_application_status('Acme Corp', updates)[0]['success'])
+
+    def test_invalid_status_rejects_whole_batch(self):
+        application = self._create_application('Backend Engineer')
+
+        response = self._post([{'id': application.pk, 'status': 'hired'}])
+
+        self.assertEqual(response.status_code, 400)
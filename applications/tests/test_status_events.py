@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import UserProfile
+from applications.models import Application, ApplicationStatusDaily, ApplicationStatusEvent
+from applications.utils import get_job_funnels, record_status_changes
+from jobs.models import Job
+
+
+User = get_user_model()
+
+
+class ApplicationStatusEventTests(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        UserProfile.objects.create(user=self.recruiter, user_type='recruiter', company='Acme Corp')
+        self.applicant = User.objects.create_user('alice', 'alice@example.com', 'password123')
+        self.job = Job.objects.create(
+            title='Backend Engineer',
+            company='Acme Corp',
+            location='Atlanta, GA',
+            description='Build APIs',
+            requirements='Python',
+            recruiter=self.recruiter,
+        )
+
+    def test_quick_apply_records_creation_event(self):
+        self.client.force_login(self.applicant)
+        self.client.post(reverse('applications:quick_apply'), {
+            'job_id': self.job.pk,
+            'job_title': self.job.title,
+            'company_name': self.job.company,
+        })
+
+        event = ApplicationStatusEvent.objects.get()
+        self.assertEqual(event.from_status, '')
+        self.assertEqual(event.to_status, Application.Status.APPLIED)
+        self.assertEqual(event.job, self.job)
+        rollup = ApplicationStatusDaily.objects.get(job=self.job, status=Application.Status.APPLIED)
+        self.assertEqual(rollup.entered, 1)
+
+    def test_kanban_move_records_event_and_stage_duration(self):
+        application = Application.objects.create(
+            user=self.applicant, job=self.job, job_title=self.job.title, company_name='Acme Corp'
+        )
+        Application.objects.filter(pk=application.pk).update(created_at=timezone.now() - timedelta(hours=2))
+
+        self.client.force_login(self.recruiter)
+        self.client.post(
+            reverse('applications:update_status_ajax', args=[application.pk]),
+            {'status': Application.Status.REVIEW},
+        )
+
+        event = ApplicationStatusEvent.objects.get(application=application)
+        self.assertEqual(event.from_status, Application.Status.APPLIED)
+        self.assertGreaterEqual(event.seconds_in_previous, 2 * 3600)
+        exited = ApplicationStatusDaily.objects.get(job=self.job, status=Application.Status.APPLIED)
+        self.assertEqual(exited.exited, 1)
+
+    def test_unchanged_status_records_nothing(self):
+        application = Application.objects.create(
+            user=self.applicant, job_title='Backend Engineer', company_name='Acme'
+        )
+
+        self.client.force_login(self.applicant)
+        self.client.post(
+            reverse('applications:update_status', args=[application.pk]),
+            {f'{application.pk}-status': Application.Status.APPLIED},
+        )
+
+        self.assertFalse(ApplicationStatusEvent.objects.exists())
+
+    def test_deleting_a_job_keeps_events_of_applications_moved_elsewhere(self):
+        application = Application.objects.create(
+            user=self.applicant, job=self.job, job_title=self.job.title, company_name='Acme Corp'
+        )
+        record_status_changes([{
+            'application_id': application.pk, 'job_id': self.job.pk,
+            'from_status': '', 'to_status': Application.Status.APPLIED,
+        }])
+        other = Job.objects.create(
+            title='Platform Engineer', company='Acme Corp', location='Atlanta, GA', description='Run it',
+            requirements='Go', recruiter=self.recruiter,
+        )
+        Application.objects.filter(pk=application.pk).update(job=other)
+
+        self.job.delete()
+
+        event = ApplicationStatusEvent.objects.get(application=application)
+        self.assertIsNone(event.job_id)
+
+    def test_counters_are_created_once_per_day_and_status(self):
+        for i in range(2):
+            application = Application.objects.create(
+                user=self.applicant, job=self.job, job_title=f'Role {i}', company_name='Acme Corp'
+            )
+            record_status_changes([{
+                'application_id': application.pk, 'job_id': self.job.pk,
+                'from_status': '', 'to_status': Application.Status.APPLIED,
+            }])
+
+        rollup = ApplicationStatusDaily.objects.get(job=self.job, status=Application.Status.APPLIED)
+        self.assertEqual(rollup.entered, 2)
+
+    def test_funnel_reports_conversion_and_average_duration(self):
+        applications = [
+            Application.objects.create(
+                user=self.applicant, job=self.job, job_title=f'Role {i}', company_name='Acme Corp'
+            )
+            for i in range(4)
+        ]
+        start = timezone.now() - timedelta(hours=10)
+        record_status_changes([
+            {'application_id': app.pk, 'job_id': self.job.pk, 'from_status': '', 'to_status': 'applied'}
+            for app in applications
+        ], at=start)
+        record_status_changes([
+            {'application_id': app.pk, 'job_id': self.job.pk, 'from_status': 'applied', 'to_status': 'review'}
+            for app in applications[:2]
+        ], at=start + timedelta(hours=4))
+
+        funnel = get_job_funnels([self.job])[0]
+        stages = {stage['status']: stage for stage in funnel['stages']}
+        self.assertEqual(funnel['applied'], 4)
+        self.assertEqual(stages['review']['conversion'], 50.0)
+        self.assertEqual(stages['applied']['avg_hours'], 4.0)
+
+    def test_funnel_page_for_recruiter(self):
+        self.client.force_login(self.recruiter)
+        response = self.client.get(reverse('applications:funnel'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Backend Engineer')
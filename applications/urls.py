@@ -9,5 +9,7 @@ urlpatterns = [
     path('<int:pk>/status/', views.update_status, name='update_status'),
     path('quick-apply/', views.quick_apply, name='quick_apply'),
     path('kanban/', views.kanban_board, name='kanban_board'),
+    path('funnel/', views.funnel, name='funnel'),
     path('<int:pk>/update-status-ajax/', views.update_application_status_ajax, name='update_status_ajax'),
+    path('bulk-update-status-ajax/', views.bulk_update_application_status_ajax, name='bulk_update_status_ajax'),
 ]
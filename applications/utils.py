@@ -0,0 +1,280 @@
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import F, Max, Q, Sum
+from django.utils import timezone
+
+from accounts.utils import normalize_company
+from applications.models import Application, ApplicationStatusDaily, ApplicationStatusEvent
+
+
+def company_applications_q(company):
+    """
+    Build the filter matching every application that belongs to a company.
+
+    An application belongs to the company when its linked job was posted under
+    that company name, was posted by one of the company's recruiters, or when
+    the application itself was filed against the company name. Every branch
+    compares an indexed ``company_key`` column, so no ``iexact`` scans are needed.
+
+    Args:
+        company (str): Company name from the recruiter's profile
+
+    Returns:
+        Q: Filter usable on ``Application`` querysets
+    """
+    company_key = normalize_company(company)
+    return (
+        Q(job__company_key=company_key)
+        | Q(job__recruiter__user_profile__company_key=company_key)
+        | Q(company_key=company_key)
+    )
+
+
+def application_belongs_to_company(application_id, company):
+    """
+    Check whether an application belongs to a recruiter's company.
+
+    Resolves with a single EXISTS query keyed on the application's primary key.
+
+    Args:
+        application_id (int): Primary key of the application
+        company (str): Company name from the recruiter's profile
+
+    Returns:
+        bool: True if the recruiter's company may manage the application
+    """
+    if not normalize_company(company):
+        return False
+    return Application.objects.filter(
+        company_applications_q(company), pk=application_id
+    ).exists()
+
+
+def bulk_update_application_status(company, updates, actor=None):
+    """
+    Apply many kanban status changes for a recruiter's company at once.
+
+    All requested applications are authorized with one query, then changes are
+    written with one ``UPDATE ... WHERE id IN (...)`` per target status. An item
+    may carry the ``updated_at`` value the client last saw; if the row has been
+    modified since, the item is reported as a conflict and left untouched.
+    Applied changes are logged as status events.
+
+    Args:
+        company (str): Company name from the recruiter's profile
+        updates (list): Dicts with ``id``, ``status`` and optional ``updated_at``
+            (an aware datetime)
+        actor: User making the changes, recorded on the status events (optional)
+
+    Returns:
+        list: One result dict per requested update, in request order
+    """
+    results = [None] * len(updates)
+    pending = []
+    seen_ids = set()
+    for index, item in enumerate(updates):
+        if item['id'] in seen_ids:
+            results[index] = {'id': item['id'], 'success': False, 'error': 'Duplicate application id.'}
+        else:
+            seen_ids.add(item['id'])
+            pending.append((index, item))
+
+    with transaction.atomic():
+        current = {
+            row['id']: row
+            # Lock only the application rows: PostgreSQL refuses FOR UPDATE on the
+            # nullable side of the outer joins the company filter needs
+            for row in Application.objects.select_for_update(of=('self',)).filter(
+                company_applications_q(company),
+                pk__in=seen_ids
+            ).values('id', 'status', 'updated_at', 'created_at', 'job_id')
+        }
+
+        now = timezone.now()
+        ids_by_status = defaultdict(list)
+        changes = []
+        for index, item in pending:
+            application_id = item['id']
+            row = current.get(application_id)
+            if row is None:
+                results[index] = {
+                    'id': application_id,
+                    'success': False,
+                    'error': 'Application not found for your company.',
+                }
+                continue
+            expected = item.get('updated_at')
+            if expected is not None and expected != row['updated_at']:
+                results[index] = {
+                    'id': application_id,
+                    'success': False,
+                    'error': 'Application was modified by someone else.',
+                    'conflict': True,
+                    'status': row['status'],
+                    'updated_at': row['updated_at'].isoformat(),
+                }
+                continue
+            if row['status'] == item['status']:
+                results[index] = _status_result(application_id, row['status'], row['updated_at'])
+                continue
+            ids_by_status[item['status']].append(application_id)
+            changes.append({
+                'application_id': application_id,
+                'job_id': row['job_id'],
+                'from_status': row['status'],
+                'to_status': item['status'],
+                'since': row['created_at'],
+            })
+            results[index] = _status_result(application_id, item['status'], now)
+
+        for status, ids in ids_by_status.items():
+            Application.objects.filter(pk__in=ids).update(status=status, updated_at=now)
+        record_status_changes(changes, actor=actor, at=now)
+
+    return results
+
+
+def _status_result(application_id, status, updated_at):
+    return {
+        'id': application_id,
+        'success': True,
+        'status': status,
+        'status_display': Application.Status(status).label,
+        'badge_class': Application.STATUS_BADGE_CLASSES.get(status, 'bg-secondary text-dark'),
+        'updated_at': updated_at.isoformat(),
+    }
+
+
+def record_status_change(application, from_status, actor=None):
+    """
+    Log a single status change for an application that was just saved.
+
+    Args:
+        application: Application instance carrying its new status
+        from_status (str): Status before the change ('' for a new application)
+        actor: User who made the change (optional)
+    """
+    record_status_changes([{
+        'application_id': application.pk,
+        'job_id': application.job_id,
+        'from_status': from_status,
+        'to_status': application.status,
+        'since': application.created_at,
+    }], actor=actor)
+
+
+def record_status_changes(changes, actor=None, at=None):
+    """
+    Append status events and bump the per-job daily funnel counters.
+
+    Time spent in the previous status is measured from the application's last
+    event (or from ``since`` when it has none), looked up for the whole batch
+    in one grouped query. Counters are only kept for applications linked to a job.
+
+    Args:
+        changes (list): Dicts with ``application_id``, ``job_id``, ``from_status``,
+            ``to_status`` and optional ``since`` datetime
+        actor: User who made the changes (optional)
+        at (datetime): Timestamp of the changes (defaults to now)
+
+    Returns:
+        list: Created ApplicationStatusEvent instances
+    """
+    if not changes:
+        return []
+    at = at or timezone.now()
+    day = timezone.localdate(at)
+
+    moved_ids = [change['application_id'] for change in changes if change['from_status']]
+    last_event_at = {}
+    if moved_ids:
+        last_event_at = dict(
+            ApplicationStatusEvent.objects.filter(application_id__in=moved_ids)
+            .values('application_id')
+            .annotate(last_at=Max('at'))
+            .values_list('application_id', 'last_at')
+        )
+
+    events = []
+    counters = defaultdict(lambda: {'entered': 0, 'exited': 0, 'seconds_in_status': 0})
+    for change in changes:
+        seconds = None
+        if change['from_status']:
+            since = last_event_at.get(change['application_id']) or change.get('since')
+            if since is not None:
+                seconds = max(0, int((at - since).total_seconds()))
+        events.append(ApplicationStatusEvent(
+            application_id=change['application_id'],
+            job_id=change['job_id'],
+            from_status=change['from_status'] or '',
+            to_status=change['to_status'],
+            at=at,
+            seconds_in_previous=seconds,
+            actor=actor,
+        ))
+        if change['job_id']:
+            counters[(change['job_id'], change['to_status'])]['entered'] += 1
+            if change['from_status']:
+                exited = counters[(change['job_id'], change['from_status'])]
+                exited['exited'] += 1
+                exited['seconds_in_status'] += seconds or 0
+
+    with transaction.atomic():
+        created = ApplicationStatusEvent.objects.bulk_create(events)
+        if counters:
+            # Make sure today's rows exist, so the increments below are plain UPDATEs
+            # and the query count does not depend on earlier changes that day
+            ApplicationStatusDaily.objects.bulk_create(
+                [ApplicationStatusDaily(job_id=job_id, day=day, status=status) for job_id, status in counters],
+                ignore_conflicts=True,
+            )
+        for (job_id, status), deltas in counters.items():
+            ApplicationStatusDaily.objects.filter(job_id=job_id, day=day, status=status).update(
+                **{field: F(field) + value for field, value in deltas.items()}
+            )
+    return created
+
+
+def get_job_funnels(jobs, since=None):
+    """
+    Summarize funnel conversion and stage durations from the daily counters.
+
+    Args:
+        jobs: Iterable of Job instances
+        since (date): Only include counters from this day onward (optional)
+
+    Returns:
+        list: One dict per job with a ``stages`` list in pipeline order
+    """
+    jobs = list(jobs)
+    rollups = ApplicationStatusDaily.objects.filter(job__in=jobs)
+    if since:
+        rollups = rollups.filter(day__gte=since)
+    totals = {
+        (row['job_id'], row['status']): row
+        for row in rollups.values('job_id', 'status').annotate(
+            entered_total=Sum('entered'),
+            exited_total=Sum('exited'),
+            seconds_total=Sum('seconds_in_status'),
+        )
+    }
+
+    funnels = []
+    for job in jobs:
+        applied = totals.get((job.id, Application.Status.APPLIED), {}).get('entered_total') or 0
+        stages = []
+        for status, label in Application.Status.choices:
+            row = totals.get((job.id, status), {})
+            entered = row.get('entered_total') or 0
+            exited = row.get('exited_total') or 0
+            seconds = row.get('seconds_total') or 0
+            stages.append({
+                'status': status,
+                'label': label,
+                'entered': entered,
+                'conversion': round(entered / applied * 100, 1) if applied else None,
+                'avg_hours': round(seconds / exited / 3600, 1) if exited else None,
+            })
+        funnels.append({'job': job, 'applied': applied, 'stages': stages})
+    return funnels
@@ -1,18 +1,35 @@
+import json
+from datetime import timedelta
+
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import get_object_or_404, redirect, render
 from django.db import IntegrityError
+from django.db.models import Q
 from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.views.decorators.http import require_http_methods
-from django.db.models import Q
 
+from accounts.models import UserProfile
+from accounts.utils import normalize_company
 from applications.forms import ApplicationForm, ApplicationStatusForm
 from applications.models import Application
+from applications.utils import (
+    application_belongs_to_company,
+    bulk_update_application_status,
+    company_applications_q,
+    get_job_funnels,
+    record_status_change,
+)
+
+# Upper bound on cards moved by a single bulk status request
+BULK_STATUS_UPDATE_LIMIT = 500
 
 
 @login_required
 def index(request):
-    applications = Application.objects.filter(user=request.user)
+    applications = Application.objects.filter(user=request.user).select_related('job')
     status_steps = Application.Status.choices
     application_forms = [
         (application, ApplicationStatusForm(instance=application, prefix=str(application.id)))
@@ -35,6 +52,7 @@ def create_application(request):
             application = form.save(commit=False)
             application.user = request.user
             application.save()
+            record_status_change(application, '', actor=request.user)
             messages.success(request, 'Application added! Track its progress below.')
             return redirect('applications:index')
     else:
@@ -53,9 +71,12 @@ def update_status(request, pk):
     if request.method != 'POST':
         return redirect('applications:index')
 
+    previous_status = application.status
     form = ApplicationStatusForm(request.POST, instance=application, prefix=str(application.id))
     if form.is_valid():
         form.save()
+        if application.status != previous_status:
+            record_status_change(application, previous_status, actor=request.user)
         messages.success(request, f'Status moved to {application.get_status_display()} for {application.job_title}.')
     else:
         messages.error(request, 'Could not update status. Please choose a valid option.')
@@ -94,6 +115,7 @@ def quick_apply(request):
             company_name=company_name,
             notes=note
         )
+        record_status_change(application, '', actor=request.user)
         
         # Create a message to the recruiter about the application
         from communications.models import Message
@@ -162,21 +184,11 @@ def kanban_board(request):
         messages.warning(request, 'Please complete your profile setup first.')
         return redirect('accounts:index')
     
-    # Get all applications for jobs posted by recruiters from the same company
-    # OR applications where company_name matches the recruiter's company
-    from jobs.models import Job
-    
-    # Get all jobs posted by recruiters from the same company
-    # Also match jobs where the job's company field matches
-    company_jobs = Job.objects.filter(
-        Q(recruiter__user_profile__company=company) | Q(company__iexact=company)
-    )
-    
     # Get applications that match:
-    # 1. Applications linked to jobs from this company
-    # 2. Applications where company_name matches this company (case-insensitive)
+    # 1. Applications linked to jobs posted under or by recruiters of this company
+    # 2. Applications where company_name matches this company (normalized)
     applications = Application.objects.filter(
-        Q(job__in=company_jobs) | Q(company_name__iexact=company)
+        company_applications_q(company)
     ).select_related('user', 'job').order_by('-updated_at')
     
     # Organize applications by status
@@ -212,18 +224,8 @@ def update_application_status_ajax(request, pk):
         
         application = get_object_or_404(Application, pk=pk)
         
-        # Verify the application belongs to the recruiter's company
-        from jobs.models import Job
-        company_jobs = Job.objects.filter(
-            Q(recruiter__user_profile__company=company) | Q(company__iexact=company)
-        )
-        
-        if application.job and application.job not in company_jobs:
-            if application.company_name.lower() != company.lower():
-                return JsonResponse({'success': False, 'error': 'You can only update applications for your company.'}, status=403)
-        
-        # Also check if company_name matches (case-insensitive)
-        if not application.job and application.company_name.lower() != company.lower():
+        # Verify the application belongs to the recruiter's company (single EXISTS query)
+        if not application_belongs_to_company(application.pk, company):
             return JsonResponse({'success': False, 'error': 'You can only update applications for your company.'}, status=403)
         
         # Get new status from request
@@ -237,15 +239,119 @@ def update_application_status_ajax(request, pk):
             return JsonResponse({'success': False, 'error': 'Invalid status.'}, status=400)
         
         # Update status
+        previous_status = application.status
         application.status = new_status
-        application.save()
+        application.save(update_fields=['status', 'updated_at'])
+        if new_status != previous_status:
+            record_status_change(application, previous_status, actor=request.user)
         
         return JsonResponse({
             'success': True,
             'message': f'Status updated to {application.get_status_display()}',
             'status': application.status,
             'status_display': application.get_status_display(),
-            'badge_class': application.status_badge_class
+            'badge_class': application.status_badge_class,
+            'updated_at': application.updated_at.isoformat(),
         })
     except Exception as e:
         return JsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
+@login_required
+@require_http_methods(["POST"])
+def bulk_update_application_status_ajax(request):
+    """API endpoint to move many kanban cards in one request.
+
+    Expects a JSON body like ``{"updates": [{"id": 1, "status": "review",
+    "updated_at": "<ISO timestamp>"}]}``; ``updated_at`` is optional and enables
+    optimistic concurrency checks per item.
+    """
+    try:
+        user_profile = request.user.user_profile
+    except UserProfile.DoesNotExist:
+        return JsonResponse({'success': False, 'error': 'Only recruiters can update application status.'}, status=403)
+    if not user_profile.is_recruiter():
+        return JsonResponse({'success': False, 'error': 'Only recruiters can update application status.'}, status=403)
+
+    company = user_profile.company
+    if not company:
+        return JsonResponse({'success': False, 'error': 'Company not set in profile.'}, status=400)
+
+    try:
+        payload = json.loads(request.body or b'{}')
+        raw_updates = payload['updates']
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({'success': False, 'error': 'Expected a JSON body with an "updates" list.'}, status=400)
+    if not isinstance(raw_updates, list) or not raw_updates:
+        return JsonResponse({'success': False, 'error': 'Expected a JSON body with an "updates" list.'}, status=400)
+    if len(raw_updates) > BULK_STATUS_UPDATE_LIMIT:
+        return JsonResponse({'success': False, 'error': f'At most {BULK_STATUS_UPDATE_LIMIT} updates per request.'}, status=400)
+
+    # Validate every item before touching the database
+    valid_statuses = [choice[0] for choice in Application.Status.choices]
+    updates = []
+    for item in raw_updates:
+        if not isinstance(item, dict):
+            return JsonResponse({'success': False, 'error': 'Each update must be an object.'}, status=400)
+        try:
+            application_id = int(item.get('id'))
+        except (TypeError, ValueError):
+            return JsonResponse({'success': False, 'error': 'Each update needs a numeric id.'}, status=400)
+        if item.get('status') not in valid_statuses:
+            return JsonResponse({'success': False, 'error': f'Invalid status for application {application_id}.'}, status=400)
+        update = {'id': application_id, 'status': item['status']}
+        if item.get('updated_at'):
+            updated_at = parse_datetime(str(item['updated_at']))
+            if updated_at is None:
+                return JsonResponse({'success': False, 'error': f'Invalid updated_at for application {application_id}.'}, status=400)
+            if timezone.is_naive(updated_at):
+                updated_at = timezone.make_aware(updated_at)
+            update['updated_at'] = updated_at
+        updates.append(update)
+
+    results = bulk_update_application_status(company, updates, actor=request.user)
+    return JsonResponse({
+        'success': all(result['success'] for result in results),
+        'updated': sum(1 for result in results if result['success']),
+        'results': results,
+    })
+
+
+@login_required
+def funnel(request):
+    """Show per-job funnel conversion and average time in each stage for a recruiter's company."""
+    try:
+        user_profile = request.user.user_profile
+        if not user_profile.is_recruiter():
+            messages.warning(request, 'Only recruiters can view hiring funnels.')
+            return redirect('jobs:index')
+
+        company = user_profile.company
+        if not company:
+            messages.warning(request, 'Please set your company in your profile to view hiring funnels.')
+            return redirect('accounts:index')
+    except UserProfile.DoesNotExist:
+        messages.warning(request, 'Please complete your profile setup first.')
+        return redirect('accounts:index')
+
+    from jobs.models import Job
+
+    company_key = normalize_company(company)
+    jobs = Job.objects.filter(
+        Q(company_key=company_key) | Q(recruiter__user_profile__company_key=company_key)
+    ).order_by('-created_at')
+
+    try:
+        days = int(request.GET.get('days', 0))
+    except ValueError:
+        days = 0
+    since = timezone.localdate() - timedelta(days=days) if days > 0 else None
+
+    context = {
+        'template_data': {'title': f'Hiring Funnel - {company} - HireBuzz'},
+        'company': company,
+        'funnels': get_job_funnels(jobs, since=since),
+        'status_steps': Application.Status.choices,
+        'days': days,
+    }
+    return render(request, 'applications/funnel.html', context)
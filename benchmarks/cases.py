@@ -0,0 +1,92 @@
+from django.urls import reverse
+
+from jobs.models import Job
+from jobs.utils import (
+    calculate_skill_match_score,
+    filter_jobs_by_distance,
+    get_candidate_recommendations,
+    get_job_recommendations,
+)
+from .registry import benchmark
+
+
+# Query strings exercising each jobs index filter on its own
+JOB_INDEX_FILTERS = {
+    'unfiltered': {},
+    'search': {'search': 'Engineer'},
+    'location': {'location': 'Atlanta'},
+    'skills': {'skills': 'Python, AWS'},
+    'employment_type': {'employment_type': 'full_time'},
+    'work_type': {'work_type': 'hybrid'},
+    'experience_level': {'experience_level': 'mid'},
+    'salary': {'salary_min': 80000, 'salary_max': 150000},
+    'visa_sponsorship': {'visa_sponsorship': 'on'},
+    'remote_only': {'remote_only': 'on'},
+    'commute': {'enable_commute_filter': 'on', 'commute_radius': 50},
+}
+
+
+@benchmark('jobs.utils.get_job_recommendations')
+def job_recommendations(ctx):
+    profile = ctx.seeker.profile
+    return lambda: get_job_recommendations(profile)
+
+
+@benchmark('jobs.utils.get_candidate_recommendations')
+def candidate_recommendations(ctx):
+    return lambda: get_candidate_recommendations(ctx.job)
+
+
+@benchmark('jobs.utils.calculate_skill_match_score')
+def skill_match_score(ctx):
+    profile_skills = ctx.seeker.profile.skills
+    job_skills = list(Job.objects.filter(status='active').values_list('skills_required', flat=True))
+
+    def run():
+        for skills in job_skills:
+            calculate_skill_match_score(profile_skills, skills)
+    return run
+
+
+@benchmark('jobs.utils.filter_jobs_by_distance')
+def jobs_by_distance(ctx):
+    jobs = [
+        {'id': pk, 'latitude': float(lat), 'longitude': float(lon)}
+        for pk, lat, lon in Job.objects.filter(
+            status='active', latitude__isnull=False, longitude__isnull=False
+        ).values_list('id', 'latitude', 'longitude')
+    ]
+    return lambda: filter_jobs_by_distance(jobs, 33.7490, -84.3880, 100)
+
+
+def _register_index_case(filter_name, params):
+    @benchmark(f'jobs.views.index[{filter_name}]')
+    def index_case(ctx):
+        client = ctx.client_for(ctx.seeker)
+        url = reverse('jobs:index')
+        return lambda: ctx.get(client, url, params)
+
+
+for _filter_name, _params in JOB_INDEX_FILTERS.items():
+    _register_index_case(_filter_name, _params)
+
+
+@benchmark('applications.views.kanban_board')
+def kanban_board(ctx):
+    client = ctx.client_for(ctx.recruiter)
+    url = reverse('applications:kanban_board')
+    return lambda: ctx.get(client, url)
+
+
+@benchmark('jobs.views.applicant_cluster_map')
+def applicant_cluster_map(ctx):
+    client = ctx.client_for(ctx.recruiter)
+    url = reverse('jobs:applicant_cluster_map')
+    return lambda: ctx.get(client, url)
+
+
+@benchmark('communications.views.index')
+def communications_index(ctx):
+    client = ctx.client_for(ctx.seeker)
+    url = reverse('communications:index')
+    return lambda: ctx.get(client, url)
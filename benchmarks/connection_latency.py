@@ -0,0 +1,167 @@
+"""
+Request latency under concurrent load with different connection lifetimes.
+
+Worker threads call the real WSGI handler, so ``request_started`` and
+``request_finished`` close or keep database connections exactly as they do
+behind gunicorn's threaded workers. Each mode changes the ``default``
+database's connection settings for the duration of its run.
+"""
+import math
+import statistics
+import threading
+import time
+from wsgiref.util import setup_testing_defaults
+
+import django
+from django.core.handlers.wsgi import WSGIHandler
+from django.db import connection, connections
+from django.db.backends.signals import connection_created
+
+
+MODES = {
+    # Django's default: a new connection for every request
+    'per_request': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False},
+    # Keep each thread's connection open and check it before reuse
+    'persistent': {'CONN_MAX_AGE': 60, 'CONN_HEALTH_CHECKS': True},
+    # Django's psycopg pool (PostgreSQL, Django 5.1+)
+    'pool': {'CONN_MAX_AGE': 0, 'CONN_HEALTH_CHECKS': False, 'OPTIONS': {'pool': True}},
+}
+
+
+def available_modes():
+    """Return the modes the current database and Django version support."""
+    modes = ['per_request', 'persistent']
+    if connection.vendor == 'postgresql' and django.VERSION >= (5, 1):
+        modes.append('pool')
+    return modes
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _environ(path, query_string):
+    environ = {}
+    setup_testing_defaults(environ)
+    environ.update({
+        'PATH_INFO': path, 'QUERY_STRING': query_string,
+        'HTTP_HOST': 'testserver', 'SERVER_NAME': 'testserver',
+    })
+    return environ
+
+
+class _ConnectionCounter:
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, sender, connection, **kwargs):
+        with self._lock:
+            self.count += 1
+
+
+def measure_latency(handler, path, query_string='', threads=8, requests=400):
+    """
+    Serve ``requests`` GETs of ``path`` from ``threads`` concurrent threads.
+
+    Each thread serves one untimed warm-up request first.
+
+    Returns:
+        dict: p50/p99/mean latency in ms, request count, non-200 responses
+            and the number of database connections opened
+    """
+    per_thread = max(1, requests // threads)
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    counter = _ConnectionCounter()
+    barrier = threading.Barrier(threads)
+
+    def serve():
+        status = []
+        environ = _environ(path, query_string)
+        response = handler(dict(environ), lambda code, headers, exc_info=None: status.append(code))
+        b''.join(response)
+        response.close()
+        return status[-1]
+
+    def worker():
+        try:
+            serve()
+            barrier.wait()
+            timings, failed = [], 0
+            for _ in range(per_thread):
+                started = time.perf_counter()
+                status = serve()
+                timings.append((time.perf_counter() - started) * 1000)
+                if not status.startswith('200'):
+                    failed += 1
+            with lock:
+                latencies.extend(timings)
+                errors.append(failed)
+        finally:
+            connections.close_all()
+
+    connection_created.connect(counter)
+    try:
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    finally:
+        connection_created.disconnect(counter)
+
+    return {
+        'threads': threads,
+        'requests': len(latencies),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'mean_ms': round(statistics.fmean(latencies), 2),
+        'errors': sum(errors),
+        'connections_opened': counter.count,
+    }
+
+
+def run_latency_benchmark(modes, path='/jobs/', query_string='', threads=8, requests=400, log=None):
+    """
+    Measure ``path`` under each connection mode.
+
+    Args:
+        modes (list): Names from ``MODES``
+        path (str): URL path to request
+        query_string (str): Query string for the request
+        threads (int): Concurrent client threads
+        requests (int): Timed requests per mode
+        log (callable): Optional progress output
+
+    Returns:
+        list: One result dict per mode
+    """
+    settings_dict = connection.settings_dict
+    original = {key: settings_dict.get(key) for key in ('CONN_MAX_AGE', 'CONN_HEALTH_CHECKS', 'OPTIONS')}
+    handler = WSGIHandler()
+    results = []
+    try:
+        for mode in modes:
+            overrides = MODES[mode]
+            # Threads create their connections from this same dict
+            settings_dict.update({
+                'CONN_MAX_AGE': overrides['CONN_MAX_AGE'],
+                'CONN_HEALTH_CHECKS': overrides['CONN_HEALTH_CHECKS'],
+                'OPTIONS': {**(original['OPTIONS'] or {}), **overrides.get('OPTIONS', {})},
+            })
+            result = measure_latency(handler, path, query_string, threads=threads, requests=requests)
+            result['mode'] = mode
+            results.append(result)
+            if hasattr(connection, 'close_pool'):
+                connection.close_pool()
+            if log:
+                log(f"{mode}: p50 {result['p50_ms']} ms, p99 {result['p99_ms']} ms, "
+                    f"{result['connections_opened']} connections opened")
+    finally:
+        settings_dict.update(original)
+    return results
@@ -0,0 +1,127 @@
+"""
+Geocoding time against a stand-in geocoder with a fixed latency.
+
+Each backend configuration runs every operation in ``OPERATIONS`` twice:
+once from an empty cache ("cold"), when every location the gazetteer cannot
+answer costs one round trip to the stand-in, and once more with the cache
+filled ("warm"). The operations are the ``geocode_jobs`` command over every
+job, the job geocode endpoint for one job, and the job map and commute
+filter for a job seeker whose profile has no stored coordinates, which
+geocode the profile location per request. Coordinates are cleared before
+each pass.
+"""
+import io
+import time
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from jobs.models import Job
+from jobs.tests.geocoder_stand_in import GeocoderStandIn
+from profiles.models import Profile
+from .runner import BenchmarkContext, BenchmarkError
+
+
+# Backend configurations, as GeocoderStandIn.backend_config options
+BACKENDS = {
+    'nominatim': {'gazetteer': False},
+    'chained': {'gazetteer': True},
+}
+
+
+def _clear_jobs(target):
+    Job.objects.update(latitude=None, longitude=None)
+
+
+def _clear_job(target):
+    Job.objects.filter(pk=target['job'].pk).update(latitude=None, longitude=None)
+
+
+def _clear_profile(target):
+    Profile.objects.filter(user=target['seeker']).update(latitude=None, longitude=None)
+
+
+def _geocode_jobs(target):
+    call_command('geocode_jobs', concurrency=target['concurrency'], rate=target['rate'], stdout=io.StringIO())
+    return Job.objects.filter(latitude__isnull=False).count()
+
+
+def _geocode_job(target):
+    _check(target['client'].post(reverse('jobs:geocode_job', args=[target['job'].pk])))
+
+
+def _map_view(target):
+    _check(target['client'].get(reverse('jobs:map')))
+
+
+def _commute_filter(target):
+    _check(target['client'].get(reverse('jobs:index'), {'enable_commute_filter': 'on'}))
+
+
+def _check(response):
+    if response.status_code != 200:
+        raise BenchmarkError(f"{response.request['PATH_INFO']} returned {response.status_code}")
+
+
+# Operations to time: name -> (untimed reset before each pass, timed run). The run
+# returns the jobs with coordinates for batch geocoding and None for single requests.
+OPERATIONS = {
+    'geocode_jobs': (_clear_jobs, _geocode_jobs),
+    'geocode_job': (_clear_job, _geocode_job),
+    'map_view': (_clear_profile, _map_view),
+    'commute_filter': (_clear_profile, _commute_filter),
+}
+
+
+def run_geocoding_benchmark(backends=tuple(BACKENDS), operations=tuple(OPERATIONS), latency=0.05,
+                            concurrency=4, rate=0, seeker=None, log=None):
+    """
+    Time the geocoding ``OPERATIONS`` over the data in the current database.
+
+    Args:
+        backends (iterable): Names from ``BACKENDS``
+        operations (iterable): Names from ``OPERATIONS``
+        latency (float): Seconds the stand-in waits before each answer
+        concurrency (int): Worker threads for ``geocode_jobs``
+        rate (float): Requests per second for ``geocode_jobs``, 0 for no limit
+        seeker: Job seeker with a profile location (default: the generated one)
+        log (callable): Receives progress messages
+
+    Returns:
+        list: One dict per operation, backend and cache state with the elapsed
+            seconds, geocoder requests made and, for ``geocode_jobs``, jobs
+            given coordinates
+    """
+    seeker = seeker or BenchmarkContext().seeker
+    job = Job.objects.exclude(location__in=['Remote', 'remote', 'Anywhere', 'anywhere']).order_by('id').first()
+    if job is None:
+        raise BenchmarkError('No job with a location to geocode.')
+    client = Client()
+    client.force_login(seeker)
+    target = {'client': client, 'seeker': seeker, 'job': job, 'concurrency': concurrency, 'rate': rate}
+    results = []
+    with GeocoderStandIn(latency=latency) as stand_in:
+        for name in backends:
+            with override_settings(GEOCODER=stand_in.backend_config(**BACKENDS[name])):
+                for operation in operations:
+                    cache.clear()
+                    reset, run = OPERATIONS[operation]
+                    for state in ('cold', 'warm'):
+                        reset(target)
+                        stand_in.queries.clear()
+                        started = time.perf_counter()
+                        geocoded = run(target)
+                        elapsed = time.perf_counter() - started
+                        row = {
+                            'operation': operation, 'backend': name, 'cache': state,
+                            'seconds': round(elapsed, 3), 'requests': len(stand_in.queries),
+                            'jobs_geocoded': geocoded,
+                        }
+                        results.append(row)
+                        if log:
+                            log(f"{operation} {name} ({state}): {row['seconds']:.3f}s, "
+                                f"{row['requests']} request(s)")
+    cache.clear()
+    return results
@@ -0,0 +1,69 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from accounts.load_data import LoadDataGenerator, default_sizes
+from benchmarks.connection_latency import available_modes, run_latency_benchmark
+from benchmarks.runner import SCALES
+
+
+class Command(BaseCommand):
+    help = ('Measure p50/p99 latency of the job board under concurrent load with per-request, persistent '
+            'and (PostgreSQL on Django 5.1+) pooled database connections, in a throwaway test database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8, help='Concurrent client threads (default 8)')
+        parser.add_argument('--requests', type=int, default=400, help='Timed requests per mode (default 400)')
+        parser.add_argument('--scale', default='small', help=f"Data scale: {', '.join(SCALES)} or a job seeker count")
+        parser.add_argument('--path', default='/jobs/', help='URL path to load (default /jobs/)')
+        parser.add_argument('--query', default='', help='Query string, e.g. "work_type=remote"')
+        parser.add_argument('--modes', help=f"Comma separated modes (default: {', '.join(available_modes())})")
+        parser.add_argument('--output', help='Write the JSON results to this file')
+
+    def handle(self, *args, **options):
+        supported = available_modes()
+        modes = [mode.strip() for mode in (options['modes'] or ','.join(supported)).split(',') if mode.strip()]
+        unsupported = [mode for mode in modes if mode not in supported]
+        if unsupported:
+            raise CommandError(f"Unsupported mode(s) here: {', '.join(unsupported)} (available: {', '.join(supported)})")
+        scale = options['scale']
+        users = SCALES[scale] if scale in SCALES else int(scale) if scale.isdigit() else None
+        if not users:
+            raise CommandError(f'Unknown scale {scale!r}.')
+        log = self.stdout.write if options['verbosity'] > 0 else None
+
+        setup_test_environment(debug=False)
+        old_name = connection.settings_dict['NAME']
+        with tempfile.TemporaryDirectory() as tmp:
+            if connection.vendor == 'sqlite':
+                # An in-memory test database is never closed, which would hide the cost being measured
+                connection.settings_dict['TEST']['NAME'] = str(Path(tmp) / 'benchmark.sqlite3')
+            connection.creation.create_test_db(verbosity=0, autoclobber=True)
+            try:
+                LoadDataGenerator(seed=0, log=log).generate(**default_sizes(users))
+                connection.close()
+                results = run_latency_benchmark(
+                    modes, path=options['path'], query_string=options['query'],
+                    threads=options['threads'], requests=options['requests'], log=log,
+                )
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+                teardown_test_environment()
+
+        self.stdout.write(f"{'mode':<13}{'threads':>8}{'requests':>10}{'p50 ms':>10}{'p99 ms':>10}"
+                          f"{'mean ms':>10}{'conns':>8}{'errors':>8}")
+        for row in results:
+            self.stdout.write(
+                f"{row['mode']:<13}{row['threads']:>8}{row['requests']:>10}{row['p50_ms']:>10.2f}"
+                f"{row['p99_ms']:>10.2f}{row['mean_ms']:>10.2f}{row['connections_opened']:>8}{row['errors']:>8}"
+            )
+        if any(row['errors'] for row in results):
+            raise CommandError('Some requests did not return 200; check the path and query.')
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2) + '\n')
+            self.stdout.write(f"Results written to {options['output']}")
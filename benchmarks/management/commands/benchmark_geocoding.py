@@ -0,0 +1,71 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from accounts.load_data import LoadDataGenerator, default_sizes
+from benchmarks.geocoding import BACKENDS, OPERATIONS, run_geocoding_benchmark
+from benchmarks.runner import SCALES
+
+
+class Command(BaseCommand):
+    help = ('Time batch geocoding, the job geocode endpoint, the job map and the commute filter against a '
+            'local stand-in geocoder with a fixed latency, cold and warm cache, for each geocoder backend, '
+            'in a throwaway test database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--latency', type=float, default=0.05,
+                            help='Seconds the stand-in waits per request (default 0.05)')
+        parser.add_argument('--concurrency', type=int, default=4, help='Concurrent lookups (default 4)')
+        parser.add_argument('--rate', type=float, default=0, help='Requests per second, 0 for no limit (default 0)')
+        parser.add_argument('--scale', default='small', help=f"Data scale: {', '.join(SCALES)} or a job seeker count")
+        parser.add_argument('--backends', help=f"Comma separated backends (default: {', '.join(BACKENDS)})")
+        parser.add_argument('--operations',
+                            help=f"Comma separated operations (default: {', '.join(OPERATIONS)})")
+        parser.add_argument('--output', help='Write the JSON results to this file')
+
+    def handle(self, *args, **options):
+        backends = [name.strip() for name in (options['backends'] or ','.join(BACKENDS)).split(',') if name.strip()]
+        unknown = [name for name in backends if name not in BACKENDS]
+        if unknown:
+            raise CommandError(f"Unknown backend(s): {', '.join(unknown)} (available: {', '.join(BACKENDS)})")
+        operations = [
+            name.strip() for name in (options['operations'] or ','.join(OPERATIONS)).split(',') if name.strip()
+        ]
+        unknown = [name for name in operations if name not in OPERATIONS]
+        if unknown:
+            raise CommandError(f"Unknown operation(s): {', '.join(unknown)} (available: {', '.join(OPERATIONS)})")
+        if options['latency'] < 0 or options['concurrency'] < 1 or options['rate'] < 0:
+            raise CommandError('--latency and --rate must not be negative and --concurrency must be at least 1.')
+        scale = options['scale']
+        users = SCALES[scale] if scale in SCALES else int(scale) if scale.isdigit() else None
+        if not users:
+            raise CommandError(f'Unknown scale {scale!r}.')
+        log = self.stdout.write if options['verbosity'] > 0 else None
+
+        setup_test_environment(debug=False)
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            LoadDataGenerator(seed=0, log=log).generate(**default_sizes(users))
+            results = run_geocoding_benchmark(
+                backends, operations, latency=options['latency'], concurrency=options['concurrency'],
+                rate=options['rate'], log=log,
+            )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.stdout.write(f"{'operation':<16}{'backend':<12}{'cache':>6}{'seconds':>10}{'requests':>10}{'jobs':>8}")
+        for row in results:
+            jobs = '' if row['jobs_geocoded'] is None else row['jobs_geocoded']
+            self.stdout.write(
+                f"{row['operation']:<16}{row['backend']:<12}{row['cache']:>6}{row['seconds']:>10.3f}"
+                f"{row['requests']:>10}{jobs:>8}"
+            )
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2) + '\n')
+            self.stdout.write(f"Results written to {options['output']}")
@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from benchmarks.sqlite_writes import DEFAULT_PRAGMAS, run_write_benchmark
+
+
+class Command(BaseCommand):
+    help = ('Measure concurrent write throughput of a SQLite database with SQLite defaults and with '
+            'SQLITE_PRAGMAS, using forked worker processes against a throwaway copy of the schema.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Concurrent writer processes (default 4)')
+        parser.add_argument('--writes', type=int, default=200, help='Transactions per worker (default 200)')
+        parser.add_argument('--output', help='Write the JSON results to this file')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('This benchmark only applies to the SQLite backend.')
+        if options['workers'] < 1 or options['writes'] < 1:
+            raise CommandError('--workers and --writes must be positive.')
+
+        configs = {'default': DEFAULT_PRAGMAS, 'tuned': dict(settings.SQLITE_PRAGMAS)}
+        log = self.stdout.write if options['verbosity'] > 0 else None
+
+        setup_test_environment(debug=False)
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            results = run_write_benchmark(configs, workers=options['workers'], writes=options['writes'], log=log)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.stdout.write(f"{'config':<10}{'workers':>8}{'committed':>11}{'failed':>8}{'seconds':>10}{'tx/s':>10}")
+        for row in results:
+            self.stdout.write(
+                f"{row['config']:<10}{row['workers']:>8}{row['committed']:>11}{row['failed']:>8}"
+                f"{row['seconds']:>10.3f}{row['tx_per_sec']:>10.1f}"
+            )
+        before, after = results
+        if before['tx_per_sec']:
+            self.stdout.write(self.style.SUCCESS(
+                f"SQLITE_PRAGMAS throughput: {after['tx_per_sec'] / before['tx_per_sec']:.2f}x the defaults"
+            ))
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2) + '\n')
+            self.stdout.write(f"Results written to {options['output']}")
@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from accounts.load_data import LoadDataGenerator, default_sizes
+from benchmarks.runner import SCALES
+from benchmarks.templates import LOADERS, run_template_benchmark
+
+
+class Command(BaseCommand):
+    help = ('Time template-heavy pages with uncached, cached and pre-warmed template loaders, '
+            'first request and steady state, in a throwaway test database.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20, help='Requests per page and loader setup (default 20)')
+        parser.add_argument('--scale', default='small', help=f"Data scale: {', '.join(SCALES)} or a job seeker count")
+        parser.add_argument('--loaders', help=f"Comma separated loader setups (default: {', '.join(LOADERS)})")
+        parser.add_argument('--output', help='Write the JSON results to this file')
+
+    def handle(self, *args, **options):
+        loaders = [name.strip() for name in (options['loaders'] or ','.join(LOADERS)).split(',') if name.strip()]
+        unknown = [name for name in loaders if name not in LOADERS]
+        if unknown:
+            raise CommandError(f"Unknown loader setup(s): {', '.join(unknown)} (available: {', '.join(LOADERS)})")
+        if options['repeat'] < 2:
+            raise CommandError('--repeat must be at least 2.')
+        scale = options['scale']
+        users = SCALES[scale] if scale in SCALES else int(scale) if scale.isdigit() else None
+        if not users:
+            raise CommandError(f'Unknown scale {scale!r}.')
+        log = self.stdout.write if options['verbosity'] > 0 else None
+
+        setup_test_environment(debug=False)
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            LoadDataGenerator(seed=0, log=log).generate(**default_sizes(users))
+            results = run_template_benchmark(loaders, repeat=options['repeat'], log=log)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.stdout.write(f"{'page':<28}{'loaders':>10}{'first ms':>11}{'median ms':>11}")
+        for row in results:
+            self.stdout.write(f"{row['page']:<28}{row['loaders']:>10}{row['first_ms']:>11.2f}{row['median_ms']:>11.2f}")
+
+        if options['output']:
+            Path(options['output']).write_text(json.dumps(results, indent=2) + '\n')
+            self.stdout.write(f"Results written to {options['output']}")
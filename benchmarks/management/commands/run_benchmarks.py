@@ -0,0 +1,76 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from benchmarks.runner import BenchmarkError, compare_to_baseline, run_benchmarks
+
+
+DEFAULT_BASELINE = Path(__file__).resolve().parents[2] / 'baseline.json'
+
+
+class Command(BaseCommand):
+    help = ('Time recommendation, geo and listing code paths at several data scales in a throwaway '
+            'test database, write JSON results and flag regressions against the stored baseline.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scales', default='small,medium',
+                            help='Comma separated scale names (small, medium, large) or job seeker counts')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case')
+        parser.add_argument('--case', action='append', dest='cases',
+                            help='Only run cases whose name contains this text (repeatable)')
+        parser.add_argument('--seed', type=int, default=0, help='Seed for the generated data')
+        parser.add_argument('--output', help='Write the JSON results to this file')
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline JSON to compare against')
+        parser.add_argument('--tolerance', type=float, default=0.25,
+                            help='Allowed slowdown against the baseline as a fraction (default 0.25)')
+        parser.add_argument('--save-baseline', action='store_true',
+                            help='Store these results as the new baseline instead of comparing')
+
+    def handle(self, *args, **options):
+        scales = [scale.strip() for scale in options['scales'].split(',') if scale.strip()]
+        log = self.stdout.write if options['verbosity'] > 0 else None
+
+        setup_test_environment(debug=False)
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            results = run_benchmarks(
+                scales, repeat=options['repeat'], names=options['cases'], seed=options['seed'], log=log
+            )
+        except BenchmarkError as e:
+            raise CommandError(str(e))
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        payload = json.dumps(results, indent=2)
+        if options['output']:
+            Path(options['output']).write_text(payload + '\n')
+            self.stdout.write(f"Results written to {options['output']}")
+
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            baseline_path.write_text(payload + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Baseline saved to {baseline_path}'))
+            return
+        if not options['output']:
+            self.stdout.write(payload)
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING(f'No baseline at {baseline_path}; nothing to compare.'))
+            return
+
+        regressions = compare_to_baseline(
+            results, json.loads(baseline_path.read_text()), tolerance=options['tolerance']
+        )
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS('No regressions against the baseline.'))
+            return
+        for row in regressions:
+            self.stdout.write(self.style.ERROR(
+                f"{row['name']} [{row['scale']}]: {row['baseline_median_ms']:.2f} -> {row['median_ms']:.2f} ms"
+                f" ({row['change_pct']}%), queries {row['baseline_queries']} -> {row['queries']}"
+            ))
+        raise CommandError(f'{len(regressions)} benchmark regression(s) against {baseline_path}')
@@ -0,0 +1,221 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from accounts.load_data import LoadDataGenerator, default_sizes
+from accounts.utils import normalize_company
+from applications.models import Application
+from communications.models import Message
+from hirebuzz.slow_queries import normalize_sql
+from jobs.models import Job
+from profiles.models import SavedCandidateSearch
+from .runner import BenchmarkContext
+
+
+@dataclass
+class UrlCheck:
+    """How to request one named URL: as which role, with which URL kwargs."""
+    role: str
+    kwargs: Optional[Callable] = None
+    params: dict = field(default_factory=dict)
+
+
+# Every named URL of the project, keyed by its reversible name
+URL_CHECKS = {
+    'home:index': UrlCheck('seeker'),
+    'accounts:index': UrlCheck('recruiter'),
+    'accounts:login': UrlCheck('anonymous'),
+    'accounts:register': UrlCheck('anonymous'),
+    'accounts:register_job_seeker': UrlCheck('anonymous'),
+    'accounts:register_recruiter': UrlCheck('anonymous'),
+    'accounts:logout': UrlCheck('seeker'),
+    'profiles:index': UrlCheck('recruiter'),
+    'profiles:my_profile': UrlCheck('seeker'),
+    'profiles:create': UrlCheck('seeker'),
+    'profiles:edit': UrlCheck('seeker'),
+    'profiles:edit_user_info': UrlCheck('seeker'),
+    'profiles:view': UrlCheck('recruiter', lambda f: {'user_id': f.seeker.pk}),
+    'profiles:save_search': UrlCheck('recruiter'),
+    'profiles:saved_searches': UrlCheck('recruiter'),
+    'profiles:run_saved_search': UrlCheck('recruiter', lambda f: {'pk': f.saved_search.pk}),
+    'profiles:delete_saved_search': UrlCheck('recruiter', lambda f: {'pk': f.saved_search.pk}),
+    'jobs:index': UrlCheck('seeker'),
+    'jobs:recommendations': UrlCheck('seeker'),
+    'jobs:map': UrlCheck('seeker'),
+    'jobs:applicant_cluster_map': UrlCheck('recruiter'),
+    'jobs:detail': UrlCheck('seeker', lambda f: {'pk': f.job.pk}),
+    'jobs:geocode_job': UrlCheck('recruiter', lambda f: {'job_id': f.job.pk}),
+    'jobs:candidate_recommendations': UrlCheck('recruiter', lambda f: {'job_id': f.job.pk}),
+    'jobs:post_job': UrlCheck('recruiter'),
+    'jobs:edit_job': UrlCheck('recruiter', lambda f: {'pk': f.job.pk}),
+    'jobs:delete_job': UrlCheck('recruiter', lambda f: {'pk': f.job.pk}),
+    'jobs:my_jobs': UrlCheck('recruiter'),
+    'applications:index': UrlCheck('seeker'),
+    'applications:create': UrlCheck('seeker'),
+    'applications:update_status': UrlCheck('seeker', lambda f: {'pk': f.application.pk}),
+    'applications:quick_apply': UrlCheck('seeker'),
+    'applications:kanban_board': UrlCheck('recruiter'),
+    'applications:funnel': UrlCheck('recruiter'),
+    'communications:index': UrlCheck('seeker'),
+    'communications:send_message': UrlCheck('seeker'),
+    'communications:view_message': UrlCheck('seeker', lambda f: {'message_id': f.message.pk}),
+    'communications:reply_message': UrlCheck('seeker', lambda f: {'message_id': f.message.pk}),
+    'metrics': UrlCheck('staff'),
+    'profile_list': UrlCheck('staff'),
+}
+
+# Named URLs deliberately left out, with the reason
+SKIPPED_URLS = {
+    'applications:update_status_ajax': 'POST-only mutation; constant queries asserted in applications tests',
+    'applications:bulk_update_status_ajax': 'POST-only mutation; query shape asserted in applications tests',
+    'exports:download': 'streams one stored file; no per-row queries',
+    'profile_detail': 'reads one capture file from PROFILING_DIR; no per-row queries',
+    'profile_download': 'streams one capture file from PROFILING_DIR; no per-row queries',
+}
+
+
+def iter_url_names(urlconf=None):
+    """
+    Yield the reversible name of every named URL pattern outside the admin.
+
+    Args:
+        urlconf: URLconf module or dotted path (defaults to ROOT_URLCONF)
+    """
+    def walk(patterns, namespace):
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                if pattern.app_name == 'admin':
+                    continue
+                child = pattern.namespace or namespace
+                yield from walk(pattern.url_patterns, child)
+            elif isinstance(pattern, URLPattern) and pattern.name:
+                yield f'{namespace}:{pattern.name}' if namespace else pattern.name
+
+    yield from walk(get_resolver(urlconf).url_patterns, None)
+
+
+def admin_changelist_names():
+    """Reversible names of the admin changelists for the project's own models."""
+    return sorted(
+        f'admin:{model._meta.app_label}_{model._meta.model_name}_changelist'
+        for model in admin.site._registry
+        if not model.__module__.startswith('django.')
+    )
+
+
+def describe_query_growth(small, large, limit=5):
+    """
+    Explain which statements ran more often on the larger dataset.
+
+    Args:
+        small (list): Captured queries on the small dataset
+        large (list): Captured queries on the large dataset
+        limit (int): Maximum statements to report
+
+    Returns:
+        str: One line per grown statement with both counts and the SQL
+    """
+    before = Counter(normalize_sql(query['sql']) for query in small)
+    after = Counter(normalize_sql(query['sql']) for query in large)
+    grown = sorted(
+        ((after[sql] - before[sql], sql) for sql in after if after[sql] > before[sql]),
+        reverse=True,
+    )
+    lines = [f'  {before[sql]}x -> {after[sql]}x: {sql}' for _, sql in grown[:limit]]
+    return '\n'.join(lines) or '  (no statement repeated more often; query shapes changed)'
+
+
+class QueryBudgetFixtures:
+    """
+    Generated data plus one object of each kind the URL checks point at.
+
+    ``grow()`` multiplies the rows every listing can see, including rows owned
+    by the accounts the checks log in as, without changing those objects.
+    """
+
+    def __init__(self, seekers=8):
+        LoadDataGenerator(seed=1, prefix='load_').generate(**default_sizes(seekers))
+        ctx = BenchmarkContext(prefix='load_')
+        self.seeker = ctx.seeker
+        self.recruiter = ctx.recruiter
+        self.job = ctx.job
+        self.staff = User.objects.create_superuser('budget_staff', 'staff@example.com', 'password123')
+        self._extra = 0
+        self._add_owned_rows(3)
+        self.application = Application.objects.filter(user=self.seeker).order_by('id').first()
+        self.message = Message.objects.filter(recipient=self.seeker).order_by('id').first()
+        self.saved_search = SavedCandidateSearch.objects.filter(user=self.recruiter).order_by('id').first()
+
+    def grow(self, factor=4, seekers=8):
+        """Add ``factor`` times more generated data and owned rows."""
+        LoadDataGenerator(seed=2, prefix='more_').generate(**default_sizes(seekers * factor))
+        self._add_owned_rows(3 * factor)
+
+    def _add_owned_rows(self, count):
+        company = self.recruiter.user_profile.company
+        jobs = []
+        for i in range(count):
+            self._extra += 1
+            jobs.append(Job(
+                title=f'Budget Role {self._extra}', company=company, company_key=normalize_company(company),
+                location='Atlanta, GA', latitude=33.7490, longitude=-84.3880,
+                skills_required=self.job.skills_required if self.job else 'Python',
+                description='Budget check posting', requirements='Python', recruiter=self.recruiter,
+            ))
+        jobs = Job.objects.bulk_create(jobs)
+        Application.objects.bulk_create(
+            Application(
+                user=self.seeker, job=job, job_title=job.title, company_name=job.company,
+                company_key=job.company_key,
+            )
+            for job in jobs
+        )
+        Message.objects.bulk_create(
+            Message(sender=sender, recipient=recipient, subject='Budget check', body='Hello')
+            for _ in range(count)
+            for sender, recipient in ((self.recruiter, self.seeker), (self.seeker, self.recruiter))
+        )
+        SavedCandidateSearch.objects.bulk_create(
+            SavedCandidateSearch(user=self.recruiter, skills='Python') for _ in range(count)
+        )
+
+
+class QueryBudgetMixin:
+    """
+    TestCase mixin asserting that pages run a constant number of queries.
+
+    ``measure_url`` warms a URL up once (so one-off writes such as marking a
+    message read are not counted) and then captures the queries of a second
+    request. Compare the captures from two dataset sizes with
+    ``assertSameQueryCount``.
+    """
+
+    def client_for(self, fixtures, role):
+        client = Client()
+        if role != 'anonymous':
+            client.force_login(getattr(fixtures, role))
+        return client
+
+    def measure_url(self, fixtures, name, check, urlconf=None):
+        kwargs = check.kwargs(fixtures) if check.kwargs else None
+        url = reverse(name, kwargs=kwargs, urlconf=urlconf)
+        self.client_for(fixtures, check.role).get(url, check.params)
+        client = self.client_for(fixtures, check.role)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, check.params)
+        self.assertLess(response.status_code, 500, f'{name} failed with {response.status_code}')
+        return list(queries.captured_queries)
+
+    def assertSameQueryCount(self, name, small, large):
+        if len(small) != len(large):
+            self.fail(
+                f'{name} ran {len(small)} queries on the small dataset but {len(large)} on the large one; '
+                f'statements that grew with the data:\n{describe_query_growth(small, large)}'
+            )
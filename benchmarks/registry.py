@@ -0,0 +1,17 @@
+# Benchmark cases keyed by name, in registration order
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register a benchmark case.
+
+    The decorated function receives a ``BenchmarkContext`` for the current
+    data scale and returns the zero-argument callable to time. Anything done
+    before returning the callable (loading fixtures, building inputs) is not
+    part of the measurement.
+    """
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
@@ -0,0 +1,210 @@
+import platform
+import statistics
+import time
+from unittest import mock
+
+import django
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from accounts.load_data import CITIES, LoadDataGenerator, default_sizes
+from . import cases  # noqa: F401  (registers the benchmark cases)
+from .registry import BENCHMARKS
+
+
+# Named data scales, as numbers of generated job seekers
+SCALES = {
+    'small': 200,
+    'medium': 1000,
+    'large': 5000,
+}
+
+# Coordinates for the generated cities, so views that geocode never leave the machine
+OFFLINE_COORDINATES = {name.lower(): (lat, lon) for name, lat, lon, _ in CITIES}
+
+
+class BenchmarkError(Exception):
+    """Raised when a benchmark case cannot run against the generated data."""
+
+
+def offline_geocode(location_string):
+    """Stand-in for ``geocode_location`` that resolves the generated cities locally."""
+    if not location_string:
+        return None, None
+    return OFFLINE_COORDINATES.get(location_string.strip().lower(), (None, None))
+
+
+async def offline_ageocode(location_string):
+    """Stand-in for ``ageocode_location``; see ``offline_geocode``."""
+    return offline_geocode(location_string)
+
+
+class BenchmarkContext:
+    """
+    Accounts and objects the cases run against at one data scale.
+
+    The job seeker has a profile, skills and a city location; the recruiter is
+    the one owning the most postings, and ``job`` is one of their active postings.
+    """
+
+    def __init__(self, prefix='load_'):
+        generated = User.objects.filter(username__startswith=prefix).order_by('id')
+        self.seeker = generated.filter(
+            user_profile__user_type='job_seeker', profile__isnull=False
+        ).exclude(profile__location='Remote').exclude(profile__skills='').first()
+        self.recruiter = generated.filter(user_profile__user_type='recruiter').annotate(
+            job_count=Count('posted_jobs')
+        ).order_by('-job_count', 'id').first()
+        if self.seeker is None or self.recruiter is None:
+            raise BenchmarkError('Generated data has no usable job seeker or recruiter.')
+        self.job = self.recruiter.posted_jobs.filter(status='active').exclude(
+            skills_required=''
+        ).order_by('id').first() or self.recruiter.posted_jobs.order_by('id').first()
+        self._clients = {}
+
+    def client_for(self, user):
+        """Return a test client logged in as ``user`` (one per user)."""
+        if user.pk not in self._clients:
+            client = Client()
+            client.force_login(user)
+            self._clients[user.pk] = client
+        return self._clients[user.pk]
+
+    def get(self, client, url, params=None):
+        """GET a page and fail loudly unless it renders."""
+        response = client.get(url, params or {})
+        if response.status_code != 200:
+            raise BenchmarkError(f'GET {url} returned {response.status_code}')
+        return response
+
+
+def scale_users(scale):
+    """Resolve a scale name or a plain number to a number of job seekers."""
+    if scale in SCALES:
+        return SCALES[scale]
+    try:
+        return int(scale)
+    except ValueError:
+        raise BenchmarkError(f"Unknown scale '{scale}' (use one of {', '.join(SCALES)} or a number)")
+
+
+def run_benchmarks(scales, repeat=5, names=None, seed=0, log=None):
+    """
+    Generate data at each scale and time every registered case against it.
+
+    Each case is run once untimed to warm caches and count its queries, then
+    ``repeat`` timed runs are taken. Geocoding is served from the generated city
+    table so no network calls are made. Generated data is removed afterwards.
+
+    Args:
+        scales (list): Scale names from ``SCALES`` or numbers of job seekers
+        repeat (int): Timed runs per case
+        names (list): Only run cases whose name contains one of these strings
+        seed (int): Seed for the load data generator
+        log: Callable receiving progress messages (optional)
+
+    Returns:
+        dict: ``meta`` describing the run and a ``results`` list with one
+            entry per case and scale
+    """
+    log = log or (lambda message: None)
+    results = []
+    with mock.patch('jobs.utils.geocode_location', offline_geocode), \
+            mock.patch('jobs.utils.ageocode_location', offline_ageocode), \
+            mock.patch('jobs.views.ageocode_location', offline_ageocode):
+        for scale in scales:
+            users = scale_users(scale)
+            generator = LoadDataGenerator(seed=seed, batch_size=5000)
+            generator.clear()
+            log(f'Generating {users} job seekers for scale {scale}...')
+            generator.generate(**default_sizes(users))
+            try:
+                ctx = BenchmarkContext(prefix=generator.prefix)
+                for name, setup in BENCHMARKS.items():
+                    if names and not any(part in name for part in names):
+                        continue
+                    results.append(_time_case(name, setup, ctx, str(scale), users, repeat))
+                    log(f"  {name} [{scale}]: {results[-1]['median_ms']:.2f} ms, "
+                        f"{results[-1]['queries']} queries")
+            finally:
+                generator.clear()
+
+    return {
+        'meta': {
+            'created_at': timezone.now().isoformat(),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'machine': platform.machine(),
+            'repeat': repeat,
+            'seed': seed,
+        },
+        'results': results,
+    }
+
+
+def _time_case(name, setup, ctx, scale, users, repeat):
+    run = setup(ctx)
+    with CaptureQueriesContext(connection) as queries:
+        run()
+    # Read the count now; later requests reset the log the capture slices
+    query_count = len(queries)
+
+    timings = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'name': name,
+        'scale': scale,
+        'users': users,
+        'median_ms': round(statistics.median(timings), 3),
+        'min_ms': round(min(timings), 3),
+        'max_ms': round(max(timings), 3),
+        'queries': query_count,
+    }
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25, min_delta_ms=1.0):
+    """
+    Find cases that got slower or issue more queries than the baseline.
+
+    A case regresses when its median is more than ``tolerance`` (a fraction)
+    above the baseline median and at least ``min_delta_ms`` slower in absolute
+    terms, or when it runs more queries. Cases missing from the baseline are
+    ignored.
+
+    Args:
+        results (dict): Output of ``run_benchmarks``
+        baseline (dict): Previously stored ``run_benchmarks`` output
+        tolerance (float): Allowed relative slowdown
+        min_delta_ms (float): Noise floor for timing regressions
+
+    Returns:
+        list: One dict per regressed case and scale
+    """
+    stored = {(row['name'], row['scale']): row for row in baseline.get('results', [])}
+    regressions = []
+    for row in results['results']:
+        base = stored.get((row['name'], row['scale']))
+        if base is None:
+            continue
+        delta = row['median_ms'] - base['median_ms']
+        slower = delta > base['median_ms'] * tolerance and delta >= min_delta_ms
+        if slower or row['queries'] > base['queries']:
+            regressions.append({
+                'name': row['name'],
+                'scale': row['scale'],
+                'median_ms': row['median_ms'],
+                'baseline_median_ms': base['median_ms'],
+                'change_pct': round(delta / base['median_ms'] * 100, 1) if base['median_ms'] else None,
+                'queries': row['queries'],
+                'baseline_queries': base['queries'],
+            })
+    return regressions
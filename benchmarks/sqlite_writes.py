@@ -0,0 +1,156 @@
+"""
+Concurrent write throughput of a SQLite file, with and without ``SQLITE_PRAGMAS``.
+
+Each worker is a forked process, like a gunicorn worker, with its own
+connection to a copy of the migrated schema. It repeats what the busiest
+request paths do: send a message and move an application on the kanban
+board in one transaction, then read the unread-message badge.
+"""
+import multiprocessing
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.db import OperationalError, connection, connections, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import override_settings
+from django.utils import timezone
+
+from applications.models import Application
+from communications.models import Message
+
+
+BENCH_ALIAS = 'sqlite_write_benchmark'
+
+# SQLite's own defaults (rollback journal, full sync); journal_mode persists in
+# the file, so it is set explicitly
+DEFAULT_PRAGMAS = {'journal_mode': 'delete', 'synchronous': 'full'}
+
+
+def _use_database(path):
+    """Register (or replace) the benchmark alias pointing at ``path``."""
+    connections[BENCH_ALIAS] = DatabaseWrapper({**connection.settings_dict, 'NAME': str(path)}, alias=BENCH_ALIAS)
+    return connections[BENCH_ALIAS]
+
+
+def prepare_database(path, workers):
+    """
+    Copy the current database's schema and data to ``path`` and add the rows workers write against.
+
+    Returns:
+        tuple: (sender id, recipient id, application ids, one per worker)
+    """
+    connection.ensure_connection()
+    target = sqlite3.connect(str(path))
+    try:
+        connection.connection.backup(target)
+    finally:
+        target.close()
+
+    bench = _use_database(path)
+    try:
+        with override_settings(SQLITE_PRAGMAS={}):
+            sender = User.objects.db_manager(BENCH_ALIAS).create_user('bench_sender')
+            recipient = User.objects.db_manager(BENCH_ALIAS).create_user('bench_recipient')
+            application_ids = [
+                Application.objects.using(BENCH_ALIAS).create(
+                    user=recipient, job_title=f'Bench Role {i}', company_name='Bench Co'
+                ).pk
+                for i in range(workers)
+            ]
+    finally:
+        bench.close()
+    return sender.pk, recipient.pk, application_ids
+
+
+def _worker(path, pragmas, ids, writes, barrier, results):
+    sender_id, recipient_id, application_id = ids
+    statuses = [status for status, _ in Application.Status.choices]
+    with override_settings(SQLITE_PRAGMAS=pragmas):
+        bench = _use_database(path)
+        bench.ensure_connection()
+        barrier.wait()
+        started = time.perf_counter()
+        committed = failed = 0
+        for i in range(writes):
+            try:
+                with transaction.atomic(using=BENCH_ALIAS):
+                    Message.objects.using(BENCH_ALIAS).create(
+                        sender_id=sender_id, recipient_id=recipient_id,
+                        subject=f'Benchmark {i}', body='Concurrent write benchmark message.',
+                    )
+                    Application.objects.using(BENCH_ALIAS).filter(pk=application_id).update(
+                        status=statuses[i % len(statuses)], updated_at=timezone.now()
+                    )
+                committed += 1
+            except OperationalError:
+                failed += 1
+            Message.objects.using(BENCH_ALIAS).filter(recipient_id=recipient_id, read_at__isnull=True).count()
+        elapsed = time.perf_counter() - started
+        bench.close()
+    results.put((committed, failed, elapsed))
+
+
+def measure_writes(path, pragmas, workers, writes, ids):
+    """Run ``workers`` forked writers against ``path`` and return the combined result."""
+    sender_id, recipient_id, application_ids = ids
+    context = multiprocessing.get_context('fork')
+    barrier = context.Barrier(workers)
+    results = context.Queue()
+    # Forked children must not share the parent's open SQLite handles
+    connections[BENCH_ALIAS].close()
+    processes = [
+        context.Process(
+            target=_worker,
+            args=(str(path), pragmas, (sender_id, recipient_id, application_ids[n]), writes, barrier, results),
+        )
+        for n in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    outcomes = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    committed = sum(outcome[0] for outcome in outcomes)
+    seconds = max(outcome[2] for outcome in outcomes)
+    return {
+        'workers': workers,
+        'committed': committed,
+        'failed': sum(outcome[1] for outcome in outcomes),
+        'seconds': round(seconds, 3),
+        'tx_per_sec': round(committed / seconds, 1) if seconds else 0.0,
+    }
+
+
+def run_write_benchmark(configs, workers=4, writes=200, log=None):
+    """
+    Measure write throughput for each named pragma set on a fresh copy of the database.
+
+    Args:
+        configs (dict): Label to ``SQLITE_PRAGMAS`` dict
+        workers (int): Concurrent writer processes
+        writes (int): Transactions per worker
+        log (callable): Optional progress output
+
+    Returns:
+        list: One result dict per config, with its label and pragmas
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp) / 'template.sqlite3'
+        ids = prepare_database(template, workers)
+        for label, pragmas in configs.items():
+            path = Path(tmp) / f'{label}.sqlite3'
+            shutil.copyfile(template, path)
+            result = measure_writes(path, pragmas, workers, writes, ids)
+            result.update({'config': label, 'pragmas': pragmas})
+            results.append(result)
+            if log:
+                log(f"{label}: {result['committed']} committed, {result['failed']} failed, "
+                    f"{result['tx_per_sec']} tx/s")
+    del connections[BENCH_ALIAS]
+    return results
@@ -0,0 +1,90 @@
+"""
+Per-request time of template-heavy pages under each template loader setup.
+
+Every page is requested ``repeat`` times with each entry of ``LOADERS``:
+"uncached" parses each template on every request, "cached" parses it on the
+first request in a worker and "warmed" is the production profile, where
+``warm_templates`` compiles everything before the first request. The first
+request and the median of the rest are reported separately, since the
+first one is where the cold cached loader pays for parsing.
+"""
+import statistics
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+
+from hirebuzz.template_warmup import warm_templates
+from .runner import BenchmarkContext, offline_ageocode, offline_geocode
+
+
+_FILE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
+# Loader setups, as TEMPLATES option overrides, and whether to warm them
+LOADERS = {
+    'uncached': ({'loaders': _FILE_LOADERS}, False),
+    'cached': ({'loaders': [('django.template.loaders.cached.Loader', _FILE_LOADERS)]}, False),
+    'warmed': ({'loaders': [('django.template.loaders.cached.Loader', _FILE_LOADERS)]}, True),
+}
+
+# Pages to request: (label, URL name, URL args callable, context attribute of the user)
+PAGES = [
+    ('jobs.index', 'jobs:index', lambda ctx: [], 'seeker'),
+    ('jobs.detail', 'jobs:detail', lambda ctx: [ctx.job.pk], 'seeker'),
+    ('jobs.map', 'jobs:map', lambda ctx: [], 'seeker'),
+    ('applications.kanban_board', 'applications:kanban_board', lambda ctx: [], 'recruiter'),
+]
+
+
+def _templates_setting(options):
+    base = settings.TEMPLATES[0]
+    return [{**base, 'APP_DIRS': False, 'OPTIONS': {**base['OPTIONS'], **options}}]
+
+
+def run_template_benchmark(loaders=tuple(LOADERS), repeat=20, log=None):
+    """
+    Time the ``PAGES`` against the generated data in the current database.
+
+    Args:
+        loaders (iterable): Names from ``LOADERS``
+        repeat (int): Requests per page and loader setup
+        log (callable): Receives progress messages
+
+    Returns:
+        list: One dict per page and loader setup with the first request's
+            time and the median of the following ones, in milliseconds
+    """
+    ctx = BenchmarkContext()
+    pages = [(label, reverse(name, args=args(ctx)), getattr(ctx, user)) for label, name, args, user in PAGES]
+    results = []
+    with mock.patch('jobs.utils.geocode_location', offline_geocode), \
+            mock.patch('jobs.utils.ageocode_location', offline_ageocode):
+        for name in loaders:
+            options, warm = LOADERS[name]
+            # Changing TEMPLATES discards the engines, so each setup starts from a cold worker
+            with override_settings(TEMPLATES=_templates_setting(options)):
+                if warm:
+                    warm_templates()
+                for label, url, user in pages:
+                    client = ctx.client_for(user)
+                    timings = []
+                    for _ in range(max(2, repeat)):
+                        cache.clear()
+                        started = time.perf_counter()
+                        ctx.get(client, url)
+                        timings.append((time.perf_counter() - started) * 1000)
+                    row = {
+                        'page': label, 'loaders': name, 'first_ms': round(timings[0], 3),
+                        'median_ms': round(statistics.median(timings[1:]), 3),
+                    }
+                    results.append(row)
+                    if log:
+                        log(f"{label} ({name}): first {row['first_ms']:.2f} ms, median {row['median_ms']:.2f} ms")
+    cache.clear()
+    return results
@@ -0,0 +1,28 @@
+from django.db import connection
+from django.test import SimpleTestCase
+
+from benchmarks.connection_latency import percentile, run_latency_benchmark
+
+
+class ConnectionLatencyTests(SimpleTestCase):
+    databases = {'default'}
+
+    def test_percentile_uses_nearest_rank(self):
+        samples = list(range(1, 101))
+
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile([7.0], 99), 7.0)
+
+    def test_modes_serve_the_job_board_and_restore_settings(self):
+        before = dict(connection.settings_dict)
+
+        results = run_latency_benchmark(['per_request', 'persistent'], threads=2, requests=4)
+
+        self.assertEqual([row['mode'] for row in results], ['per_request', 'persistent'])
+        for row in results:
+            self.assertEqual(row['requests'], 4)
+            self.assertEqual(row['errors'], 0)
+            self.assertLessEqual(row['p50_ms'], row['p99_ms'])
+        self.assertEqual(connection.settings_dict['CONN_MAX_AGE'], before['CONN_MAX_AGE'])
+        self.assertEqual(connection.settings_dict['OPTIONS'], before['OPTIONS'])
@@ -0,0 +1,41 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from benchmarks.geocoding import run_geocoding_benchmark
+from accounts.models import UserProfile
+from jobs.models import Job
+from profiles.models import Profile
+
+
+class GeocodingBenchmarkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User = get_user_model()
+        recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        cls.seeker = User.objects.create_user('sam', 'sam@example.com', 'password123')
+        UserProfile.objects.create(user=cls.seeker, user_type='job_seeker')
+        Profile.objects.create(user=cls.seeker, headline='Engineer', skills='Python', location='Boston, MA')
+        for title, location in [('A', 'Atlanta, GA'), ('B', 'atlanta, ga'), ('C', 'Denver, CO'), ('D', 'Remote')]:
+            Job.objects.create(
+                title=title, company='Acme', location=location, description='d', requirements='r',
+                recruiter=recruiter,
+            )
+
+    def test_cold_passes_hit_the_stand_in_and_warm_passes_do_not(self):
+        results = run_geocoding_benchmark(latency=0, rate=0, seeker=self.seeker)
+
+        rows = {(row['operation'], row['backend'], row['cache']): row for row in results}
+        self.assertEqual(len(rows), 16)
+        self.assertEqual(rows['geocode_jobs', 'nominatim', 'cold']['requests'], 2)
+        self.assertEqual(rows['geocode_jobs', 'nominatim', 'warm']['requests'], 0)
+        # Both cities are in the gazetteer, so the chained backend never asks
+        self.assertEqual(rows['geocode_jobs', 'chained', 'cold']['requests'], 0)
+        for backend in ('nominatim', 'chained'):
+            for state in ('cold', 'warm'):
+                self.assertEqual(rows['geocode_jobs', backend, state]['jobs_geocoded'], 3)
+        self.assertEqual(rows['geocode_job', 'nominatim', 'cold']['requests'], 1)
+        # The profile location is geocoded per page view until the cache has it
+        for operation in ('map_view', 'commute_filter'):
+            self.assertEqual(rows[operation, 'nominatim', 'cold']['requests'], 1)
+            self.assertEqual(rows[operation, 'nominatim', 'warm']['requests'], 0)
+        self.assertEqual(Job.objects.filter(latitude__isnull=False).count(), 3)
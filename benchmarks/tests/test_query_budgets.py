@@ -0,0 +1,48 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from benchmarks.query_budget import (
+    SKIPPED_URLS,
+    URL_CHECKS,
+    QueryBudgetFixtures,
+    QueryBudgetMixin,
+    UrlCheck,
+    admin_changelist_names,
+    describe_query_growth,
+    iter_url_names,
+)
+from benchmarks.runner import offline_ageocode, offline_geocode
+
+
+@mock.patch('jobs.views.ageocode_location', offline_ageocode)
+@mock.patch('jobs.utils.ageocode_location', offline_ageocode)
+@mock.patch('jobs.utils.geocode_location', offline_geocode)
+class UrlQueryBudgetTests(QueryBudgetMixin, TestCase):
+    def test_every_named_url_is_checked_or_skipped(self):
+        names = set(iter_url_names())
+
+        self.assertEqual(names - set(URL_CHECKS) - set(SKIPPED_URLS), set())
+        self.assertEqual(set(URL_CHECKS) - names, set())
+
+    def test_query_counts_do_not_grow_with_data(self):
+        fixtures = QueryBudgetFixtures()
+        checks = dict(URL_CHECKS)
+        checks.update({name: UrlCheck('staff') for name in admin_changelist_names()})
+
+        small = {name: self.measure_url(fixtures, name, check) for name, check in checks.items()}
+        fixtures.grow()
+        for name, check in checks.items():
+            with self.subTest(url=name):
+                self.assertSameQueryCount(name, small[name], self.measure_url(fixtures, name, check))
+
+
+class DescribeQueryGrowthTests(TestCase):
+    def test_reports_statements_repeated_per_row(self):
+        small = [{'sql': 'SELECT 1 FROM "auth_user" WHERE "id" = 4'}]
+        large = [{'sql': f'SELECT 1 FROM "auth_user" WHERE "id" = {pk}'} for pk in range(3)]
+
+        report = describe_query_growth(small, large)
+
+        self.assertIn('1x -> 3x', report)
+        self.assertIn('WHERE "id" = ?', report)
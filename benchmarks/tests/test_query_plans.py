@@ -0,0 +1,77 @@
+from unittest import mock
+
+from django.db import connection
+from django.db.models import Q
+from django.test import TestCase
+from django.urls import reverse
+
+from benchmarks.query_budget import QueryBudgetFixtures, QueryBudgetMixin
+from benchmarks.runner import offline_ageocode, offline_geocode
+from communications.models import Message
+from hirebuzz.slow_queries import explain_query_plan
+from jobs.models import Job
+
+
+# (URL name, role, query string, table, index the view's query on that table must use)
+HOT_QUERIES = [
+    ('jobs:index', 'seeker', {}, 'jobs_job', 'job_active_created_idx'),
+    ('jobs:index', 'seeker', {'work_type': 'remote'}, 'jobs_job', 'job_active_work_type_idx'),
+    ('jobs:index', 'seeker', {'employment_type': 'full_time'}, 'jobs_job', 'job_active_employment_idx'),
+    ('jobs:index', 'seeker', {'experience_level': 'entry'}, 'jobs_job', 'job_active_experience_idx'),
+    ('jobs:recommendations', 'seeker', {}, 'jobs_job', 'job_active_created_idx'),
+    ('jobs:map', 'seeker', {}, 'jobs_job', 'job_active_geocoded_idx'),
+    ('jobs:my_jobs', 'recruiter', {}, 'jobs_job', 'job_recruiter_created_idx'),
+    ('applications:index', 'seeker', {}, 'applications_application', 'application_user_updated_idx'),
+    ('communications:index', 'seeker', {}, 'communications_message', 'message_unread_idx'),
+    ('communications:index', 'seeker', {}, 'communications_message', 'message_recipient_sent_idx'),
+    ('communications:index', 'seeker', {}, 'communications_message', 'message_sender_sent_idx'),
+]
+
+
+@mock.patch('jobs.views.ageocode_location', offline_ageocode)
+@mock.patch('jobs.utils.ageocode_location', offline_ageocode)
+@mock.patch('jobs.utils.geocode_location', offline_geocode)
+class QueryPlanTests(QueryBudgetMixin, TestCase):
+    """EXPLAIN the queries hot views actually run and check they use the intended indexes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.fixtures = QueryBudgetFixtures()
+
+    def plans_for(self, client, url, params):
+        """Return ``(sql, plan)`` for every SELECT run while serving ``url``."""
+        plans = []
+
+        def explain(execute, sql, params, many, context):
+            plans.append((sql, explain_query_plan(context['connection'], sql, params)))
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(explain):
+            response = client.get(url, params)
+        self.assertEqual(response.status_code, 200, url)
+        return [(sql, plan) for sql, plan in plans if plan is not None]
+
+    def test_hot_view_queries_use_indexes(self):
+        for url_name, role, params, table, index in HOT_QUERIES:
+            with self.subTest(url=url_name, params=params, index=index):
+                plans = self.plans_for(self.client_for(self.fixtures, role), reverse(url_name), params)
+                table_plans = [plan for sql, plan in plans if f'FROM "{table}"' in sql]
+                self.assertTrue(table_plans, f'{url_name} ran no query on {table}')
+                self.assertTrue(
+                    any(f'USING INDEX {index}' in step or f'USING COVERING INDEX {index}' in step
+                        for plan in table_plans for step in plan),
+                    f'{url_name} {params} did not use {index}: {table_plans}',
+                )
+
+    def test_background_queries_use_indexes(self):
+        queries = {
+            'job_missing_coords_idx': Job.objects.filter(latitude__isnull=True, longitude__isnull=True).exclude(
+                Q(location__isnull=True) | Q(location='') | Q(location__in=['Remote', 'remote'])
+            ),
+            'message_unread_idx': Message.objects.filter(
+                recipient=self.fixtures.seeker, read_at__isnull=True
+            ).order_by(),
+        }
+        for index, queryset in queries.items():
+            with self.subTest(index=index):
+                self.assertIn(f'USING INDEX {index}', queryset.explain())
@@ -0,0 +1,62 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from benchmarks.registry import BENCHMARKS
+from benchmarks.runner import compare_to_baseline, offline_geocode, run_benchmarks
+
+
+User = get_user_model()
+
+
+def _results(**cases):
+    return {'results': [
+        {'name': name, 'scale': 'small', 'median_ms': median, 'queries': queries}
+        for name, (median, queries) in cases.items()
+    ]}
+
+
+class RunBenchmarksTests(TestCase):
+    def test_runs_every_case_at_each_scale(self):
+        results = run_benchmarks([10, 20], repeat=1)
+
+        self.assertEqual(len(results['results']), len(BENCHMARKS) * 2)
+        self.assertEqual({row['scale'] for row in results['results']}, {'10', '20'})
+        for row in results['results']:
+            self.assertGreaterEqual(row['median_ms'], 0)
+        # Generated accounts are removed afterwards
+        self.assertFalse(User.objects.filter(username__startswith='load_').exists())
+
+    def test_view_cases_count_their_queries(self):
+        results = run_benchmarks([10], repeat=1, names=['communications.views.index'])
+
+        self.assertEqual(len(results['results']), 1)
+        self.assertGreater(results['results'][0]['queries'], 0)
+
+    def test_offline_geocode_resolves_generated_cities(self):
+        self.assertEqual(offline_geocode('Atlanta, GA'), (33.7490, -84.3880))
+        self.assertEqual(offline_geocode('Remote'), (None, None))
+
+
+class CompareToBaselineTests(TestCase):
+    def test_flags_slowdowns_beyond_tolerance(self):
+        baseline = _results(fast=(10.0, 3), steady=(10.0, 3))
+        current = _results(fast=(14.0, 3), steady=(11.0, 3))
+
+        regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+
+        self.assertEqual([row['name'] for row in regressions], ['fast'])
+        self.assertEqual(regressions[0]['change_pct'], 40.0)
+
+    def test_ignores_noise_below_absolute_floor(self):
+        baseline = _results(tiny=(0.1, 0))
+        current = _results(tiny=(0.5, 0))
+
+        self.assertEqual(compare_to_baseline(current, baseline, tolerance=0.25, min_delta_ms=1.0), [])
+
+    def test_flags_extra_queries_and_skips_unknown_cases(self):
+        baseline = _results(listing=(10.0, 3))
+        current = _results(listing=(10.0, 4), new_case=(50.0, 100))
+
+        regressions = compare_to_baseline(current, baseline)
+
+        self.assertEqual([(row['name'], row['queries']) for row in regressions], [('listing', 4)])
@@ -0,0 +1,20 @@
+from django.test import TestCase
+
+from benchmarks.sqlite_writes import DEFAULT_PRAGMAS, run_write_benchmark
+from communications.models import Message
+
+
+class SqliteWriteBenchmarkTests(TestCase):
+    def test_forked_workers_commit_every_write_on_a_copy(self):
+        results = run_write_benchmark(
+            {'default': DEFAULT_PRAGMAS, 'tuned': {'busy_timeout': 5000, 'journal_mode': 'wal'}},
+            workers=2, writes=5,
+        )
+
+        self.assertEqual([row['config'] for row in results], ['default', 'tuned'])
+        for row in results:
+            self.assertEqual(row['committed'] + row['failed'], 10)
+            self.assertGreater(row['committed'], 0)
+            self.assertGreater(row['tx_per_sec'], 0)
+        # The workers wrote to throwaway copies, not the test database
+        self.assertFalse(Message.objects.exists())
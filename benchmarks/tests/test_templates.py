@@ -0,0 +1,17 @@
+from django.test import TestCase
+
+from accounts.load_data import LoadDataGenerator, default_sizes
+from benchmarks.templates import LOADERS, PAGES, run_template_benchmark
+
+
+class TemplateBenchmarkTests(TestCase):
+    def test_times_every_page_with_each_loader_setup(self):
+        LoadDataGenerator(seed=0).generate(**default_sizes(10))
+
+        results = run_template_benchmark(repeat=2)
+
+        self.assertEqual(len(results), len(LOADERS) * len(PAGES))
+        self.assertEqual({row['loaders'] for row in results}, set(LOADERS))
+        for row in results:
+            self.assertGreater(row['first_ms'], 0)
+            self.assertGreater(row['median_ms'], 0)
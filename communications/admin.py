@@ -1,10 +1,29 @@
 from django.contrib import admin
-from django.http import HttpResponse
-from django.utils import timezone
-import csv
+
+from exports.utils import streaming_csv_response
 from .models import Message
 
 
+MESSAGE_EXPORT_HEADER = [
+    'Subject', 'Sender', 'Sender Email', 'Recipient', 'Recipient Email',
+    'Body', 'Sent At', 'Read At', 'Is Read'
+]
+
+
+def message_export_row(message):
+    return [
+        message.subject,
+        message.sender.username,
+        message.sender.email,
+        message.recipient.username,
+        message.recipient.email,
+        message.body,
+        message.sent_at.strftime('%Y-%m-%d %H:%M:%S'),
+        message.read_at.strftime('%Y-%m-%d %H:%M:%S') if message.read_at else 'Not Read',
+        'Yes' if message.is_read() else 'No'
+    ]
+
+
 @admin.register(Message)
 class MessageAdmin(admin.ModelAdmin):
     list_display = ('subject', 'sender', 'recipient', 'sent_at', 'is_read')
@@ -43,27 +62,8 @@ class MessageAdmin(admin.ModelAdmin):
     
     @admin.action(description='Export selected messages to CSV')
     def export_messages_csv(self, request, queryset):
-        """Export selected messages to CSV file."""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="messages_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow([
-            'Subject', 'Sender', 'Sender Email', 'Recipient', 'Recipient Email', 
-            'Body', 'Sent At', 'Read At', 'Is Read'
-        ])
-        
-        for message in queryset:
-            writer.writerow([
-                message.subject,
-                message.sender.username,
-                message.sender.email,
-                message.recipient.username,
-                message.recipient.email,
-                message.body,
-                message.sent_at.strftime('%Y-%m-%d %H:%M:%S'),
-                message.read_at.strftime('%Y-%m-%d %H:%M:%S') if message.read_at else 'Not Read',
-                'Yes' if message.is_read() else 'No'
-            ])
-        
-        return response
+        """Stream selected messages to a CSV file."""
+        return streaming_csv_response(
+            queryset, 'messages_export', MESSAGE_EXPORT_HEADER, message_export_row,
+            select_related=('sender', 'recipient')
+        )
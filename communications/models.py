@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
 from django.core.validators import EmailValidator
 
@@ -30,6 +31,12 @@ class Message(models.Model):
     
     class Meta:
         ordering = ['-sent_at']
+        indexes = [
+            # Unread badge counted on every page
+            models.Index(fields=['recipient'], condition=Q(read_at__isnull=True), name='message_unread_idx'),
+            models.Index(fields=['recipient', '-sent_at'], name='message_recipient_sent_idx'),
+            models.Index(fields=['sender', '-sent_at'], name='message_sender_sent_idx'),
+        ]
     
     def __str__(self):
         return f"From {self.sender.username} to {self.recipient.username}: {self.subject}"
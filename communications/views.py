@@ -4,6 +4,7 @@ from django.contrib import messages
 from django.core.mail import send_mail
 from django.conf import settings
 from django.db.models import Q
+from hirebuzz.metrics import EMAILS_SENT
 from .models import Message
 from .forms import MessageForm
 
@@ -13,7 +14,7 @@ def index(request):
     """Display user's messages (sent and received)."""
     user_messages = Message.objects.filter(
         Q(sender=request.user) | Q(recipient=request.user)
-    ).order_by('-sent_at')
+    ).select_related('sender', 'recipient').order_by('-sent_at')
     
     # Separate sent and received messages
     sent_messages = user_messages.filter(sender=request.user)
@@ -50,8 +51,10 @@ def send_message(request):
                     recipient_list=[message.recipient.email],
                     fail_silently=False,
                 )
+                EMAILS_SENT.inc(result='sent')
                 messages.success(request, f'Message sent to {message.recipient.get_full_name() or message.recipient.username}!')
             except Exception as e:
+                EMAILS_SENT.inc(result='failed')
                 # Message saved but email failed
                 messages.warning(request, f'Message sent but email notification failed: {str(e)}')
             
@@ -126,8 +129,10 @@ def reply_message(request, message_id):
                     recipient_list=[reply.recipient.email],
                     fail_silently=False,
                 )
+                EMAILS_SENT.inc(result='sent')
                 messages.success(request, f'Reply sent to {reply.recipient.get_full_name() or reply.recipient.username}!')
             except Exception as e:
+                EMAILS_SENT.inc(result='failed')
                 messages.warning(request, f'Reply sent but email notification failed: {str(e)}')
             
             return redirect('communications:index')
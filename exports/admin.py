@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from django.contrib import admin
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.html import format_html
+
+from .models import ExportJob
+from .utils import EXPORT_CLAIM_TIMEOUT, enqueue_export
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'kind', 'format', 'status', 'progress', 'requested_by', 'created_at', 'download_link')
+    list_filter = ('status', 'kind', 'format', 'created_at')
+    list_select_related = ('requested_by',)
+    readonly_fields = (
+        'kind', 'format', 'status', 'requested_by', 'all_rows', 'total_rows', 'rows_written',
+        'file', 'error', 'created_at', 'started_at', 'updated_at', 'finished_at', 'download_link'
+    )
+    actions = ['requeue_exports']
+
+    def has_add_permission(self, request):
+        return False
+
+    def progress(self, obj):
+        return f"{obj.rows_written}/{obj.total_rows} ({obj.progress_percentage}%)"
+    progress.short_description = 'Progress'
+
+    def download_link(self, obj):
+        if not obj.is_downloadable():
+            return '-'
+        return format_html('<a href="{}">Download</a>', reverse('exports:download', args=[obj.pk]))
+    download_link.short_description = 'File'
+
+    @admin.action(description='Re-queue selected exports')
+    def requeue_exports(self, request, queryset):
+        # Running exports are left alone unless they have stalled
+        cutoff = timezone.now() - timedelta(seconds=EXPORT_CLAIM_TIMEOUT)
+        updated = queryset.exclude(status=ExportJob.Status.RUNNING, updated_at__gte=cutoff).update(
+            status=ExportJob.Status.PENDING, rows_written=0, error='', started_at=None, finished_at=None
+        )
+        self.message_user(request, f"Re-queued {updated} export(s).")
+
+
+def queue_export(modeladmin, request, queryset, kind, export_format):
+    """Queue a background export of an admin selection and tell the user where to find it."""
+    export_job = enqueue_export(kind, queryset, export_format=export_format, requested_by=request.user)
+    modeladmin.message_user(
+        request,
+        f"Queued export #{export_job.pk} of {export_job.total_rows} row(s). "
+        f"Track it under Exports > Export jobs."
+    )
+
+
+def queue_export_action(kind, export_format, description):
+    """
+    Build an admin action that queues a background export of the selection.
+
+    Args:
+        kind (str): One of the ``ExportJob.Kind`` values
+        export_format (str): 'csv' or 'jsonl'
+        description (str): Label shown in the admin action dropdown
+
+    Returns:
+        function: Admin action
+    """
+    @admin.action(description=description)
+    def action(modeladmin, request, queryset):
+        queue_export(modeladmin, request, queryset, kind, export_format)
+
+    action.__name__ = f'queue_{kind}_export_{export_format}'
+    return action
@@ -0,0 +1,50 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from exports.utils import EXPORT_CHUNK_SIZE, claim_next_export_job, run_export_job
+
+
+class Command(BaseCommand):
+    help = 'Process queued background exports and write them to MEDIA_ROOT/exports'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the pending exports and exit instead of polling'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Seconds to wait between queue checks when idle (default: 5)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help=f'Rows fetched per query and per progress update (default: {EXPORT_CHUNK_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('Waiting for export jobs...' if not options['once'] else 'Processing pending export jobs...')
+
+        while True:
+            export_job = claim_next_export_job()
+            if export_job is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            self.stdout.write(f'Running {export_job}...')
+            export_job = run_export_job(export_job, chunk_size=options['chunk_size'])
+            if export_job.status == export_job.Status.DONE:
+                self.stdout.write(
+                    self.style.SUCCESS(f'Wrote {export_job.rows_written} rows to {export_job.file.name}')
+                )
+            elif export_job.status == export_job.Status.FAILED:
+                self.stdout.write(self.style.ERROR(f'Export #{export_job.pk} failed: {export_job.error}'))
+            else:
+                self.stdout.write(self.style.WARNING(f'Export #{export_job.pk} was claimed by another worker'))
@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.db import models
+
+
+class ExportJob(models.Model):
+    """A queued data export written to disk by the ``run_export_jobs`` worker."""
+
+    class Kind(models.TextChoices):
+        JOBS = 'jobs', 'Jobs'
+        PROFILES = 'profiles', 'Profiles'
+        APPLICATIONS = 'applications', 'Applications'
+
+    class Format(models.TextChoices):
+        CSV = 'csv', 'CSV (gzip)'
+        JSONL = 'jsonl', 'JSON Lines (gzip)'
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        RUNNING = 'running', 'Running'
+        DONE = 'done', 'Done'
+        FAILED = 'failed', 'Failed'
+
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    format = models.CharField(max_length=10, choices=Format.choices, default=Format.CSV)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='export_jobs'
+    )
+    all_rows = models.BooleanField(
+        default=False,
+        help_text="Export every row instead of the rows listed in the job's selection"
+    )
+    total_rows = models.PositiveIntegerField(default=0)
+    rows_written = models.PositiveIntegerField(default=0)
+    file = models.FileField(upload_to='exports/', blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="Last claim or progress update; running jobs idle for too long are claimed again"
+    )
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.get_kind_display()} export #{self.pk} ({self.get_status_display()})"
+
+    @property
+    def progress_percentage(self) -> int:
+        """Share of rows written so far, for progress display."""
+        if self.status == self.Status.DONE:
+            return 100
+        if not self.total_rows:
+            return 0
+        return int(self.rows_written / self.total_rows * 100)
+
+    def is_downloadable(self):
+        """Check if the export finished and its file is available."""
+        return self.status == self.Status.DONE and bool(self.file)
+
+
+class ExportSelection(models.Model):
+    """Primary key of one row an export job covers, written in batches when the job is queued."""
+
+    export_job = models.ForeignKey(ExportJob, on_delete=models.CASCADE, related_name='selection')
+    object_id = models.PositiveBigIntegerField()
+
+    class Meta:
+        unique_together = ('export_job', 'object_id')
+
+    def __str__(self):
+        return f"Export #{self.export_job_id} row {self.object_id}"
@@ -0,0 +1,45 @@
+from django.apps import apps
+from django.utils.module_loading import import_string
+
+
+# Export kinds available to background export jobs. Column definitions live
+# next to the admin actions that stream the same data synchronously.
+EXPORT_SPECS = {
+    'jobs': {
+        'model': 'jobs.Job',
+        'header': 'jobs.admin.JOB_EXPORT_HEADER',
+        'row': 'jobs.admin.job_export_row',
+        'select_related': ('recruiter',),
+    },
+    'profiles': {
+        'model': 'profiles.Profile',
+        'header': 'profiles.admin.PROFILE_EXPORT_HEADER',
+        'row': 'profiles.admin.profile_export_row',
+        'select_related': ('user',),
+    },
+    'applications': {
+        'model': 'applications.Application',
+        'header': 'applications.admin.APPLICATION_EXPORT_HEADER',
+        'row': 'applications.admin.application_export_row',
+        'select_related': ('user',),
+    },
+}
+
+
+def get_export_spec(kind):
+    """
+    Resolve the model, columns and row builder for an export kind.
+
+    Args:
+        kind (str): One of the ``ExportJob.Kind`` values
+
+    Returns:
+        dict: ``model``, ``header``, ``row`` and ``select_related`` entries
+    """
+    spec = EXPORT_SPECS[kind]
+    return {
+        'model': apps.get_model(spec['model']),
+        'header': import_string(spec['header']),
+        'row': import_string(spec['row']),
+        'select_related': spec['select_related'],
+    }
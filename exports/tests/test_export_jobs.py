@@ -0,0 +1,163 @@
+import csv
+import gzip
+import json
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from exports.admin import ExportJobAdmin
+from exports.models import ExportJob
+from exports.utils import EXPORT_CLAIM_TIMEOUT, claim_next_export_job, enqueue_export, run_export_job
+from jobs.admin import JobAdmin
+from jobs.models import Job
+
+
+User = get_user_model()
+
+
+class BackgroundExportTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.staff = User.objects.create_user('staff', 'staff@example.com', 'password123', is_staff=True)
+        for i in range(3):
+            Job.objects.create(
+                title=f'Job {i}', company='Acme', location='Atlanta, GA',
+                description='Build', requirements='Python', recruiter=self.staff,
+            )
+
+    def _run_worker(self):
+        call_command('run_export_jobs', '--once', '--chunk-size', '2', stdout=open('/dev/null', 'w'))
+
+    def test_worker_writes_gzip_csv(self):
+        export_job = enqueue_export('jobs', Job.objects.filter(title__in=['Job 0', 'Job 2']))
+
+        self._run_worker()
+
+        export_job.refresh_from_db()
+        self.assertEqual(export_job.status, ExportJob.Status.DONE)
+        self.assertEqual(export_job.rows_written, 2)
+        self.assertEqual(export_job.progress_percentage, 100)
+        with gzip.open(export_job.file.path, 'rt') as handle:
+            rows = list(csv.reader(handle))
+        self.assertEqual(rows[0][0], 'Title')
+        self.assertEqual([row[0] for row in rows[1:]], ['Job 0', 'Job 2'])
+
+    def test_selection_is_stored_as_ids_at_queue_time(self):
+        export_job = enqueue_export('jobs', Job.objects.exclude(title='Job 1').order_by('-title'))
+        self.assertEqual(export_job.total_rows, 2)
+        Job.objects.create(
+            title='Job 3', company='Acme', location='Atlanta, GA',
+            description='Build', requirements='Python', recruiter=self.staff,
+        )
+
+        self._run_worker()
+
+        export_job.refresh_from_db()
+        with gzip.open(export_job.file.path, 'rt') as handle:
+            rows = list(csv.reader(handle))
+        # The worker exports the rows selected when the job was queued, in primary key order
+        self.assertEqual([row[0] for row in rows[1:]], ['Job 0', 'Job 2'])
+        self.assertEqual(export_job.selection.count(), 2)
+
+    def test_stalled_running_export_is_claimed_again(self):
+        export_job = enqueue_export('jobs')
+        stalled = timezone.now() - timedelta(seconds=EXPORT_CLAIM_TIMEOUT + 60)
+        ExportJob.objects.filter(pk=export_job.pk).update(
+            status=ExportJob.Status.RUNNING, started_at=stalled, updated_at=stalled
+        )
+
+        self._run_worker()
+
+        export_job.refresh_from_db()
+        self.assertEqual(export_job.status, ExportJob.Status.DONE)
+        self.assertEqual(export_job.rows_written, 3)
+
+    def test_active_running_export_is_not_claimed(self):
+        export_job = enqueue_export('jobs')
+        ExportJob.objects.filter(pk=export_job.pk).update(
+            status=ExportJob.Status.RUNNING, started_at=timezone.now()
+        )
+
+        self.assertIsNone(claim_next_export_job())
+
+    def test_worker_stops_when_its_claim_is_taken(self):
+        enqueue_export('jobs')
+        export_job = claim_next_export_job()
+        # Another worker reclaims the job after this one stalled
+        ExportJob.objects.filter(pk=export_job.pk).update(started_at=timezone.now() + timedelta(seconds=1))
+
+        run_export_job(export_job, chunk_size=2)
+
+        export_job.refresh_from_db()
+        self.assertEqual(export_job.status, ExportJob.Status.RUNNING)
+        self.assertEqual(export_job.error, '')
+
+    def test_admin_requeues_stalled_exports_only(self):
+        stalled = timezone.now() - timedelta(seconds=EXPORT_CLAIM_TIMEOUT + 60)
+        stalled_job = enqueue_export('jobs')
+        active_job = enqueue_export('jobs')
+        ExportJob.objects.filter(pk=stalled_job.pk).update(status=ExportJob.Status.RUNNING, updated_at=stalled)
+        ExportJob.objects.filter(pk=active_job.pk).update(status=ExportJob.Status.RUNNING)
+        request = RequestFactory().post('/admin/exports/exportjob/')
+        request.user = self.staff
+        request.session = {}
+        request._messages = FallbackStorage(request)
+
+        ExportJobAdmin(ExportJob, admin.site).requeue_exports(request, ExportJob.objects.all())
+
+        stalled_job.refresh_from_db()
+        active_job.refresh_from_db()
+        self.assertEqual(stalled_job.status, ExportJob.Status.PENDING)
+        self.assertEqual(active_job.status, ExportJob.Status.RUNNING)
+
+    def test_worker_writes_json_lines_for_whole_table(self):
+        export_job = enqueue_export('jobs', export_format=ExportJob.Format.JSONL)
+
+        self._run_worker()
+
+        export_job.refresh_from_db()
+        with gzip.open(export_job.file.path, 'rt') as handle:
+            records = [json.loads(line) for line in handle]
+        self.assertEqual(len(records), 3)
+        self.assertEqual(records[0]['Recruiter'], 'staff')
+
+    def test_large_admin_export_is_queued(self):
+        request = RequestFactory().post('/admin/jobs/job/')
+        request.user = self.staff
+        request.session = {}
+        request._messages = FallbackStorage(request)
+
+        with override_settings(EXPORT_INLINE_MAX_ROWS=1):
+            response = JobAdmin(Job, admin.site).export_jobs_csv(request, Job.objects.all())
+
+        self.assertIsNone(response)
+        self.assertEqual(ExportJob.objects.get().total_rows, 3)
+
+    def test_download_requires_finished_export_and_staff(self):
+        export_job = enqueue_export('jobs')
+        url = reverse('exports:download', args=[export_job.pk])
+
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get(url).status_code, 404)
+
+        self._run_worker()
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment', response['Content-Disposition'])
+        response.close()
+
+        self.client.force_login(User.objects.create_user('bob', 'bob@example.com', 'password123'))
+        self.assertEqual(self.client.get(url).status_code, 302)
@@ -0,0 +1,68 @@
+import csv
+import io
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
+from django.test import RequestFactory, TestCase
+
+from accounts.admin import CustomUserAdmin
+from accounts.models import UserProfile
+from jobs.admin import JobAdmin
+from jobs.models import Job
+from profiles.admin import ProfileAdmin
+from profiles.models import Profile
+
+
+User = get_user_model()
+
+
+def read_csv(response):
+    content = b''.join(
+        chunk if isinstance(chunk, bytes) else chunk.encode() for chunk in response.streaming_content
+    )
+    return list(csv.reader(io.StringIO(content.decode())))
+
+
+class StreamingExportTests(TestCase):
+    def setUp(self):
+        self.request = RequestFactory().get('/admin/')
+        for i in range(5):
+            user = User.objects.create_user(f'user{i}', f'user{i}@example.com', 'password123')
+            UserProfile.objects.create(user=user, user_type='recruiter', company='Acme')
+            Profile.objects.create(
+                user=user, headline='Engineer', skills='Python', education='BS', work_experience='Acme'
+            )
+            Job.objects.create(
+                title=f'Job {i}', company='Acme', location='Atlanta, GA',
+                description='Build', requirements='Python', recruiter=user,
+            )
+
+    def test_job_export_streams_with_single_query(self):
+        response = JobAdmin(Job, admin.site).export_jobs_csv(self.request, Job.objects.all())
+
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertIn('jobs_export_', response['Content-Disposition'])
+        with self.assertNumQueries(1):
+            rows = read_csv(response)
+        self.assertEqual(rows[0][0], 'Title')
+        self.assertEqual(len(rows), 6)
+
+    def test_profile_export_streams_with_single_query(self):
+        response = ProfileAdmin(Profile, admin.site).export_profiles_csv(self.request, Profile.objects.all())
+
+        with self.assertNumQueries(1):
+            rows = read_csv(response)
+        self.assertEqual(len(rows), 6)
+        self.assertTrue(all(row[0].startswith('user') for row in rows[1:]))
+
+    def test_user_export_handles_missing_user_profile(self):
+        User.objects.create_user('noprofile', 'np@example.com', 'password123')
+
+        response = CustomUserAdmin(User, admin.site).export_users_csv(self.request, User.objects.all())
+
+        with self.assertNumQueries(1):
+            rows = read_csv(response)
+        by_username = {row[0]: row for row in rows[1:]}
+        self.assertEqual(by_username['noprofile'][4], 'No Profile')
+        self.assertEqual(by_username['user0'][5], 'Acme')
@@ -0,0 +1,263 @@
+import csv
+import gzip
+import json
+import os
+from datetime import timedelta
+from itertools import islice
+
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+
+# Rows fetched per database round trip while streaming an export
+EXPORT_CHUNK_SIZE = 2000
+
+# Running export jobs without a progress update for this many seconds are
+# claimed again, e.g. after the worker running them crashed
+EXPORT_CLAIM_TIMEOUT = 600
+
+
+class ExportClaimLost(Exception):
+    """Raised when another worker has claimed the export job this worker is running."""
+
+
+class Echo:
+    """Pseudo-buffer whose ``write`` hands the formatted line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv_lines(header, rows):
+    """
+    Yield CSV-formatted lines one at a time without buffering the whole file.
+
+    Args:
+        header (list): Column names for the first line
+        rows: Iterable of row value lists
+
+    Yields:
+        str: One CSV line per row, starting with the header
+    """
+    writer = csv.writer(Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def iter_export_rows(queryset, row_func, select_related=(), chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield export rows from a queryset in constant memory.
+
+    Related objects used by ``row_func`` should be listed in ``select_related``
+    so each chunk costs one query instead of one query per row.
+
+    Args:
+        queryset: QuerySet to export
+        row_func: Callable turning a model instance into a list of values
+        select_related (tuple): Relations joined into the export query
+        chunk_size (int): Rows fetched per database round trip
+
+    Yields:
+        list: Row values for each object
+    """
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        yield row_func(obj)
+
+
+def streaming_csv_response(queryset, filename_prefix, header, row_func, select_related=(),
+                           chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Build a streaming CSV download for a queryset.
+
+    Args:
+        queryset: QuerySet to export
+        filename_prefix (str): Prefix for the timestamped attachment filename
+        header (list): Column names
+        row_func: Callable turning a model instance into a list of values
+        select_related (tuple): Relations joined into the export query
+        chunk_size (int): Rows fetched per database round trip
+
+    Returns:
+        StreamingHttpResponse: CSV attachment response
+    """
+    rows = iter_export_rows(queryset, row_func, select_related=select_related, chunk_size=chunk_size)
+    response = StreamingHttpResponse(iter_csv_lines(header, rows), content_type='text/csv')
+    response['Content-Disposition'] = (
+        f'attachment; filename="{filename_prefix}_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
+    )
+    return response
+
+
+def enqueue_export(kind, queryset=None, export_format='csv', requested_by=None):
+    """
+    Queue a background export for the ``run_export_jobs`` worker.
+
+    The selected primary keys are copied into ``ExportSelection`` rows in
+    batches of ``EXPORT_CHUNK_SIZE``, so neither the job row nor the copy
+    holds the whole selection in memory. Without a queryset the worker
+    exports every row.
+
+    Args:
+        kind (str): One of the ``ExportJob.Kind`` values
+        queryset: Rows to export (optional, defaults to the whole table)
+        export_format (str): 'csv' or 'jsonl'
+        requested_by: User who asked for the export (optional)
+
+    Returns:
+        ExportJob: The pending export job
+    """
+    from exports.models import ExportJob, ExportSelection
+
+    with transaction.atomic():
+        export_job = ExportJob.objects.create(
+            kind=kind,
+            format=export_format,
+            requested_by=requested_by,
+            all_rows=queryset is None,
+        )
+        if queryset is not None:
+            ids = queryset.order_by().values_list('pk', flat=True).distinct().iterator(chunk_size=EXPORT_CHUNK_SIZE)
+            total_rows = 0
+            while True:
+                batch = [
+                    ExportSelection(export_job=export_job, object_id=object_id)
+                    for object_id in islice(ids, EXPORT_CHUNK_SIZE)
+                ]
+                if not batch:
+                    break
+                ExportSelection.objects.bulk_create(batch)
+                total_rows += len(batch)
+            export_job.total_rows = total_rows
+            ExportJob.objects.filter(pk=export_job.pk).update(total_rows=total_rows)
+    return export_job
+
+
+def export_queryset(export_job):
+    """
+    Build the queryset of rows an export job covers, in primary key order.
+
+    Args:
+        export_job: ExportJob instance
+
+    Returns:
+        QuerySet: Rows of the export kind's model
+    """
+    from exports.models import ExportSelection
+    from exports.registry import get_export_spec
+
+    queryset = get_export_spec(export_job.kind)['model'].objects.all()
+    if not export_job.all_rows:
+        queryset = queryset.filter(
+            pk__in=ExportSelection.objects.filter(export_job=export_job).values('object_id')
+        )
+    return queryset.order_by('pk')
+
+
+def claim_next_export_job(timeout=EXPORT_CLAIM_TIMEOUT):
+    """
+    Atomically claim the oldest pending export job.
+
+    The status flip is a conditional UPDATE, so several workers can poll the
+    queue without processing the same job twice. Running jobs without a
+    progress update for ``timeout`` seconds are claimed again; the claim
+    moves ``started_at``, which tells the previous worker to stop.
+
+    Returns:
+        ExportJob or None: The claimed job, now marked as running
+    """
+    from exports.models import ExportJob
+
+    now = timezone.now()
+    claimable = ExportJob.objects.filter(
+        Q(status=ExportJob.Status.PENDING)
+        | Q(status=ExportJob.Status.RUNNING, updated_at__lt=now - timedelta(seconds=timeout))
+    )
+    for job_id in claimable.order_by('created_at').values_list('pk', flat=True)[:10]:
+        claimed = claimable.filter(pk=job_id).update(
+            status=ExportJob.Status.RUNNING, started_at=now, updated_at=now
+        )
+        if claimed:
+            return ExportJob.objects.get(pk=job_id)
+    return None
+
+
+def run_export_job(export_job, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Write an export job's rows to a gzip-compressed file under MEDIA_ROOT.
+
+    Rows are read with ``iterator(chunk_size=...)`` and progress is saved after
+    every chunk, so memory stays flat and the admin can show how far along the
+    export is. Failures are recorded on the job instead of being raised. If
+    another worker claims the job in the meantime, this one stops and leaves
+    the job to it.
+
+    Args:
+        export_job: ExportJob instance already marked as running
+        chunk_size (int): Rows fetched and written between progress updates
+
+    Returns:
+        ExportJob: The finished (done or failed) job, or the job as the
+            worker that took over the claim left it
+    """
+    from exports.models import ExportJob
+    from exports.registry import get_export_spec
+
+    spec = get_export_spec(export_job.kind)
+    queryset = export_queryset(export_job)
+    # Updates only apply while this worker still holds the claim
+    claim = ExportJob.objects.filter(pk=export_job.pk, started_at=export_job.started_at)
+
+    def update(**fields):
+        if not claim.update(updated_at=timezone.now(), **fields):
+            raise ExportClaimLost(f'Export #{export_job.pk} was claimed by another worker')
+
+    extension = 'jsonl.gz' if export_job.format == ExportJob.Format.JSONL else 'csv.gz'
+    name = f"exports/{export_job.kind}_export_{export_job.pk}_{timezone.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+    path = default_storage.path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    try:
+        update(total_rows=queryset.count(), rows_written=0)
+
+        rows_written = 0
+        rows = iter_export_rows(queryset, spec['row'], select_related=spec['select_related'], chunk_size=chunk_size)
+        with gzip.open(path, 'wt', encoding='utf-8', newline='') as output:
+            if export_job.format == ExportJob.Format.JSONL:
+                lines = (json.dumps(dict(zip(spec['header'], row)), default=str) + '\n' for row in rows)
+            else:
+                lines = iter_csv_lines(spec['header'], rows)
+                output.write(next(lines))
+            for line in lines:
+                output.write(line)
+                rows_written += 1
+                if rows_written % chunk_size == 0:
+                    update(rows_written=rows_written)
+
+        update(
+            status=ExportJob.Status.DONE,
+            rows_written=rows_written,
+            total_rows=rows_written,
+            file=name,
+            finished_at=timezone.now(),
+        )
+    except ExportClaimLost:
+        if os.path.exists(path):
+            os.remove(path)
+    except Exception as e:
+        if os.path.exists(path):
+            os.remove(path)
+        claim.update(
+            status=ExportJob.Status.FAILED,
+            error=str(e),
+            updated_at=timezone.now(),
+            finished_at=timezone.now(),
+        )
+
+    export_job.refresh_from_db()
+    return export_job
@@ -0,0 +1,18 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse, Http404
+from django.shortcuts import get_object_or_404
+
+from .models import ExportJob
+
+
+@staff_member_required
+def download(request, pk):
+    """Download the file written by a finished background export."""
+    export_job = get_object_or_404(ExportJob, pk=pk)
+    if not export_job.is_downloadable():
+        raise Http404('Export is not ready yet.')
+    return FileResponse(
+        export_job.file.open('rb'),
+        as_attachment=True,
+        filename=export_job.file.name.rsplit('/', 1)[-1],
+    )
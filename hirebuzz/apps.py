@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class HirebuzzConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'hirebuzz'
+
+    def ready(self):
+        from .db import configure_sqlite
+        from .instrumentation import install_query_counter
+        from .slow_queries import install_slow_query_log
+
+        connection_created.connect(configure_sqlite, dispatch_uid='hirebuzz_sqlite_pragmas')
+        connection_created.connect(install_slow_query_log, dispatch_uid='hirebuzz_slow_query_log')
+        connection_created.connect(install_query_counter, dispatch_uid='hirebuzz_query_counter')
@@ -12,5 +12,12 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hirebuzz.settings')
+# Read by the settings, which turn persistent database connections off under ASGI
+os.environ.setdefault('HIREBUZZ_ASGI', '1')
 
 application = get_asgi_application()
+
+# Imported once the app registry is ready
+from hirebuzz.template_warmup import warm_templates_on_start  # noqa: E402
+
+warm_templates_on_start()
@@ -0,0 +1,192 @@
+"""
+Page and fragment caching keyed on the version of the object shown.
+
+Cache keys include the object's ``updated_at``, so saving the object moves
+its pages and fragments to fresh keys and the stale entries simply expire;
+nothing has to be deleted on save. ``cache_anonymous_page`` caches whole
+responses for anonymous visitors, whose pages are the same for everyone.
+Templates cache the expensive parts of personalised pages with
+``{% cache %}``, varying on ``fragment_version`` and ``viewer_role``.
+``conditional_page`` answers repeat requests for an unchanged page with a
+304 from the same version, before the view runs at all.
+"""
+import datetime
+import hashlib
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import caches
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag, urlencode
+
+from hirebuzz.metrics import PAGE_CACHE
+
+
+def fragment_version(obj):
+    """Cache key part identifying a saved version of ``obj``."""
+    return f'{obj.pk}:{obj.updated_at.isoformat()}'
+
+
+def viewer_role(user, owner=None):
+    """
+    Describe who is looking at a page, for fragments that differ by audience.
+
+    Args:
+        user: The requesting user (possibly anonymous)
+        owner: The user the page belongs to, if any
+
+    Returns:
+        str: 'anonymous', 'owner', 'staff', the account type
+            ('job_seeker' or 'recruiter') or 'member'
+    """
+    if not user.is_authenticated:
+        return 'anonymous'
+    if owner is not None and user.pk == owner.pk:
+        return 'owner'
+    if user.is_staff:
+        return 'staff'
+    account = getattr(user, 'user_profile', None)
+    return getattr(account, 'user_type', None) or 'member'
+
+
+def _page_version(request, version_func, args, kwargs):
+    """Call ``version_func`` once per request, however many decorators ask."""
+    versions = request.__dict__.setdefault('_page_versions', {})
+    if version_func not in versions:
+        versions[version_func] = version_func(request, *args, **kwargs)
+    return versions[version_func]
+
+
+def _page_key(request, version, params):
+    # Only the parameters the view reads, so made-up query strings share one entry
+    query = urlencode([(param, value) for param in params for value in request.GET.getlist(param)])
+    digest = hashlib.md5(f'{request.path}?{query}|{version}'.encode('utf-8')).hexdigest()
+    return f'page:{request.method}:{digest}'
+
+
+def cache_anonymous_page(version_func, name, params=()):
+    """
+    Cache a view's responses for anonymous GET requests.
+
+    ``version_func(request, *args, **kwargs)`` returns the version of what
+    the page shows (usually the object's ``updated_at``, from one indexed
+    query) or None when the page must not be cached, e.g. a missing object.
+    Requests with flash messages waiting bypass the cache, and responses that
+    set cookies, use the CSRF token or are not 200 are never stored.
+
+    Args:
+        version_func (callable): Returns the page version or None
+        name (str): Label for the page cache hit/miss metric
+        params (iterable): Query parameters the view reads; others are
+            left out of the cache key
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            timeout = settings.PAGE_CACHE_SECONDS
+            if (not timeout or request.method not in ('GET', 'HEAD') or request.user.is_authenticated
+                    or len(get_messages(request))):
+                return view(request, *args, **kwargs)
+            version = _page_version(request, version_func, args, kwargs)
+            if version is None:
+                return view(request, *args, **kwargs)
+
+            cache = caches[settings.PAGE_CACHE_ALIAS]
+            key = _page_key(request, version, params)
+            response = cache.get(key)
+            if response is not None:
+                PAGE_CACHE.inc(view=name, result='hit')
+                return response
+            PAGE_CACHE.inc(view=name, result='miss')
+
+            response = view(request, *args, **kwargs)
+            # A page that used the CSRF token would hand one visitor's token to everyone
+            if (response.status_code == 200 and not response.cookies and not response.streaming
+                    and not request.META.get('CSRF_COOKIE_NEEDS_UPDATE')):
+                cache.set(key, response, timeout)
+            return response
+        return wrapper
+    return decorator
+
+
+def _validators(request, version_func, name, args, kwargs):
+    """Return the (ETag, Last-Modified timestamp) for a request, or (None, None)."""
+    if request.method not in ('GET', 'HEAD') or len(get_messages(request)):
+        return None, None
+    version = _page_version(request, version_func, args, kwargs)
+    if version is None:
+        return None, None
+
+    user = request.user
+    # The session key changes on login and logout, so a page rendered for an
+    # earlier session (with its CSRF token and navigation) is never reused
+    viewer = f'{user.pk}:{request.session.session_key}' if user.is_authenticated else 'anonymous'
+    digest = hashlib.md5(f'{name}|{request.get_full_path()}|{version}|{viewer}'.encode('utf-8')).hexdigest()
+
+    last_modified = None
+    # Signed-in pages also change with the viewer, and a composite version (e.g.
+    # the latest date and row count of a listing) can change without its date
+    # moving forward, when a row leaves the set; neither fits in a date
+    if not user.is_authenticated and isinstance(version, datetime.datetime):
+        last_modified = int(version.timestamp())
+    return quote_etag(digest), last_modified
+
+
+def _add_validators(request, response, etag, last_modified):
+    if etag is None or response.status_code != 200:
+        return response
+    response.headers.setdefault('ETag', etag)
+    if last_modified and not response.has_header('Last-Modified'):
+        response.headers['Last-Modified'] = http_date(last_modified)
+    # Browsers must revalidate rather than guess a freshness lifetime
+    patch_cache_control(response, no_cache=True, private=request.user.is_authenticated)
+    return response
+
+
+def conditional_page(version_func, name):
+    """
+    Answer conditional GET requests for a view from the version of its data.
+
+    ``version_func(request, *args, **kwargs)`` works as for
+    ``cache_anonymous_page``; a tuple version (e.g. a listing's latest
+    ``updated_at`` and row count) is allowed. The ETag combines the version
+    with the URL and the viewer's session, so an unchanged page gets a 304
+    without the view running. Last-Modified is only sent to anonymous
+    visitors, and only when the version is a single date. Works on sync and
+    async views; for async views ``version_func`` runs in a thread, and
+    ``request.user`` is resolved up front so it is the user ``auser()`` returns.
+
+    Args:
+        version_func (callable): Returns the page version or None
+        name (str): Page name, part of the ETag
+    """
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def wrapper(request, *args, **kwargs):
+                if hasattr(request, 'auser'):
+                    # Resolve the viewer once for the version function, the view and its
+                    # templates; request.user and request.auser() would each query for it
+                    request.user = await request.auser()
+                etag, last_modified = await sync_to_async(_validators)(request, version_func, name, args, kwargs)
+                if etag is not None:
+                    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                    if response is not None:
+                        return response
+                response = await view(request, *args, **kwargs)
+                await sync_to_async(_add_validators)(request, response, etag, last_modified)
+                return response
+            return wrapper
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            etag, last_modified = _validators(request, version_func, name, args, kwargs)
+            if etag is not None:
+                response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+                if response is not None:
+                    return response
+            return _add_validators(request, view(request, *args, **kwargs), etag, last_modified)
+        return wrapper
+    return decorator
@@ -0,0 +1,124 @@
+"""
+Database configuration and connection setup.
+
+``database_settings`` builds ``DATABASES`` (primary plus read replicas) from
+the environment. ``configure_sqlite`` runs on ``connection_created`` and
+applies the ``SQLITE_PRAGMAS`` setting, so every worker process gets WAL
+journaling, a busy timeout and the cache settings without a custom backend.
+"""
+import django
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+
+def sqlite_pragma_statements(pragmas):
+    """
+    Build the PRAGMA statements for a settings dict.
+
+    ``busy_timeout`` goes first so a journal mode switch waits for other
+    connections instead of failing with "database is locked".
+
+    Args:
+        pragmas (dict): Pragma name to value, e.g. ``{'journal_mode': 'wal'}``
+
+    Returns:
+        list: SQL statements in execution order
+    """
+    ordered = sorted(pragmas.items(), key=lambda item: item[0] != 'busy_timeout')
+    return [f'PRAGMA {name} = {value}' for name, value in ordered]
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """``connection_created`` receiver applying ``SQLITE_PRAGMAS`` to SQLite connections."""
+    if connection.vendor != 'sqlite':
+        return
+    for statement in sqlite_pragma_statements(getattr(settings, 'SQLITE_PRAGMAS', {})):
+        # Straight to the driver: these are setup, not queries to count or log
+        connection.connection.execute(statement)
+
+
+def database_settings(environ, base_dir):
+    """
+    Build ``DATABASES`` from ``HIREBUZZ_DB_*`` environment variables.
+
+    ``HIREBUZZ_DB_ENGINE`` selects ``sqlite`` (the default) or ``postgresql``.
+    PostgreSQL reads ``HIREBUZZ_DB_NAME``, ``_USER``, ``_PASSWORD``, ``_HOST``
+    and ``_PORT``. ``HIREBUZZ_DB_REPLICAS`` lists read replicas separated by
+    commas: ``host[:port]`` entries sharing the primary's credentials for
+    PostgreSQL, or database file paths for SQLite (handy for trying the
+    routing locally against a copy of the primary).
+
+    Connections persist for ``HIREBUZZ_DB_CONN_MAX_AGE`` seconds (default 60,
+    0 closes them after each request) and are health-checked before reuse.
+    Under ASGI (``HIREBUZZ_ASGI=1``, set by ``hirebuzz.asgi``) the default is
+    0: Django runs each async request's queries in a fresh thread, so
+    persistent connections would pile up instead of being reused.
+    For PostgreSQL, ``HIREBUZZ_DB_POOL=1`` uses Django's connection pool
+    (Django 5.1+, replaces persistent connections) and
+    ``HIREBUZZ_DB_PGBOUNCER=1`` adapts the settings to a transaction-pooling
+    pgbouncer in front of the database.
+
+    Args:
+        environ (Mapping): Environment variables
+        base_dir (Path): Project root, for the default SQLite file
+
+    Returns:
+        tuple: (DATABASES dict, list of replica aliases)
+    """
+    engine = environ.get('HIREBUZZ_DB_ENGINE', 'sqlite').lower()
+    default_max_age = '0' if environ.get('HIREBUZZ_ASGI') == '1' else '60'
+    connection_options = {
+        'CONN_MAX_AGE': int(environ.get('HIREBUZZ_DB_CONN_MAX_AGE', default_max_age)),
+        'CONN_HEALTH_CHECKS': True,
+    }
+    if engine in ('postgres', 'postgresql'):
+        primary = {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': environ.get('HIREBUZZ_DB_NAME', 'hirebuzz'),
+            'USER': environ.get('HIREBUZZ_DB_USER', ''),
+            'PASSWORD': environ.get('HIREBUZZ_DB_PASSWORD', ''),
+            'HOST': environ.get('HIREBUZZ_DB_HOST', ''),
+            'PORT': environ.get('HIREBUZZ_DB_PORT', ''),
+            **connection_options,
+            'OPTIONS': {},
+        }
+        if environ.get('HIREBUZZ_DB_POOL') == '1':
+            if django.VERSION < (5, 1):
+                raise ImproperlyConfigured(
+                    'HIREBUZZ_DB_POOL needs Django 5.1 or newer; use HIREBUZZ_DB_PGBOUNCER with pgbouncer instead.'
+                )
+            # The pool hands out connections per request, so they must not also persist
+            primary['CONN_MAX_AGE'] = 0
+            primary['OPTIONS']['pool'] = {
+                'min_size': int(environ.get('HIREBUZZ_DB_POOL_MIN_SIZE', '2')),
+                'max_size': int(environ.get('HIREBUZZ_DB_POOL_MAX_SIZE', '10')),
+            }
+        if environ.get('HIREBUZZ_DB_PGBOUNCER') == '1':
+            # Transaction pooling gives each transaction any server connection, so
+            # named cursors and session-level prepared statements cannot be used
+            primary['DISABLE_SERVER_SIDE_CURSORS'] = True
+            primary['OPTIONS']['prepare_threshold'] = None
+    elif engine == 'sqlite':
+        primary = {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': environ.get('HIREBUZZ_DB_NAME', str(base_dir / 'db.sqlite3')),
+            **connection_options,
+        }
+    else:
+        raise ImproperlyConfigured(f'Unsupported HIREBUZZ_DB_ENGINE {engine!r}; use sqlite or postgresql.')
+
+    databases = {'default': primary}
+    replicas = []
+    entries = [entry.strip() for entry in environ.get('HIREBUZZ_DB_REPLICAS', '').split(',') if entry.strip()]
+    for number, entry in enumerate(entries, start=1):
+        if primary['ENGINE'] == 'django.db.backends.sqlite3':
+            replica = {**primary, 'NAME': entry}
+        else:
+            host, _, port = entry.partition(':')
+            replica = {**primary, 'HOST': host, 'PORT': port or primary['PORT'], 'OPTIONS': dict(primary['OPTIONS'])}
+        # Tests run against the primary; a replica is only another view of it
+        replica['TEST'] = {'MIRROR': 'default'}
+        alias = f'replica_{number}'
+        databases[alias] = replica
+        replicas.append(alias)
+    return databases, replicas
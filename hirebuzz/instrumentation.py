@@ -0,0 +1,203 @@
+"""
+Per-request performance counters.
+
+``PerformanceMiddleware`` opens a ``RequestMetrics`` for each request and the
+hooks below add to it: database queries through an execute wrapper that
+``install_query_counter`` adds to every connection, cache
+lookups through ``CacheMetricsMixin``, template rendering through the
+``InstrumentedDjangoTemplates`` backend and outbound HTTP calls through
+``track_http``. Outside an instrumented request every hook is a single
+context variable lookup.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.template.backends.django import DjangoTemplates
+
+
+_current = ContextVar('hirebuzz_request_metrics', default=None)
+_MISSING = object()
+
+
+class RequestMetrics:
+    """Counters collected while serving one request."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_queries = 0
+        self.db_ms = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.template_ms = 0.0
+        self.http_calls = 0
+        self.http_ms = 0.0
+        self._template_depth = 0
+
+    @property
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def as_dict(self):
+        return {
+            'total_ms': round(self.total_ms, 2),
+            'db_queries': self.db_queries,
+            'db_ms': round(self.db_ms, 2),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'template_ms': round(self.template_ms, 2),
+            'http_calls': self.http_calls,
+            'http_ms': round(self.http_ms, 2),
+        }
+
+    def server_timing(self):
+        """Format the counters as a ``Server-Timing`` header value."""
+        return ', '.join([
+            f'db;dur={self.db_ms:.1f};desc="{self.db_queries} queries"',
+            f'tpl;dur={self.template_ms:.1f}',
+            f'cache;desc="{self.cache_hits} hits, {self.cache_misses} misses"',
+            f'http;dur={self.http_ms:.1f};desc="{self.http_calls} calls"',
+            f'total;dur={self.total_ms:.1f}',
+        ])
+
+
+def current_metrics():
+    """Return the metrics of the request being served, or None."""
+    return _current.get()
+
+
+def start_request_metrics():
+    """Begin collecting metrics; returns the token for ``finish_request_metrics``."""
+    metrics = RequestMetrics()
+    return metrics, _current.set(metrics)
+
+
+def finish_request_metrics(token):
+    _current.reset(token)
+
+
+@contextmanager
+def request_metrics():
+    """
+    Collect metrics for the enclosed request handling.
+
+    Nested uses (several middlewares) share the outermost ``RequestMetrics``,
+    so queries are only counted once. The metrics live in a context variable,
+    so queries an async view runs through ``sync_to_async`` count as well.
+    """
+    metrics = _current.get()
+    if metrics is not None:
+        yield metrics
+        return
+    metrics, token = start_request_metrics()
+    try:
+        yield metrics
+    finally:
+        finish_request_metrics(token)
+
+
+def install_query_counter(sender, connection, **kwargs):
+    """``connection_created`` receiver adding ``count_query`` to new connections."""
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+def count_query(execute, sql, params, many, context):
+    """``connection.execute_wrapper`` hook counting and timing queries."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_queries += 1
+        metrics.db_ms += (time.perf_counter() - started) * 1000
+
+
+@contextmanager
+def track_http(service=''):
+    """
+    Time an outbound HTTP call made while serving a request.
+
+    Args:
+        service (str): Short name of the remote service (for readability only)
+    """
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.http_calls += 1
+        metrics.http_ms += (time.perf_counter() - started) * 1000
+
+
+class CacheMetricsMixin:
+    """Count hits and misses of ``get``/``get_many`` on a cache backend."""
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version=version)
+        metrics = _current.get()
+        if value is _MISSING:
+            if metrics is not None:
+                metrics.cache_misses += 1
+            return default
+        if metrics is not None:
+            metrics.cache_hits += 1
+        return value
+
+    def get_many(self, keys, version=None):
+        keys = list(keys)
+        metrics = _current.get()
+        # The default get_many calls get() per key; count the batch only once
+        token = _current.set(None)
+        try:
+            found = super().get_many(keys, version=version)
+        finally:
+            _current.reset(token)
+        if metrics is not None:
+            metrics.cache_hits += len(found)
+            metrics.cache_misses += len(keys) - len(found)
+        return found
+
+
+class InstrumentedLocMemCache(CacheMetricsMixin, LocMemCache):
+    """Local-memory cache that reports hits and misses to the request metrics."""
+
+
+class InstrumentedTemplate:
+    """Wrap a backend template so top-level renders are timed."""
+
+    def __init__(self, template):
+        self.template = template
+
+    def __getattr__(self, name):
+        return getattr(self.template, name)
+
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return self.template.render(context, request)
+        metrics._template_depth += 1
+        started = time.perf_counter()
+        try:
+            return self.template.render(context, request)
+        finally:
+            metrics._template_depth -= 1
+            # Nested render_to_string calls are already inside the outer timing
+            if metrics._template_depth == 0:
+                metrics.template_ms += (time.perf_counter() - started) * 1000
+
+
+class InstrumentedDjangoTemplates(DjangoTemplates):
+    """Django template backend reporting render time to the request metrics."""
+
+    def from_string(self, template_code):
+        return InstrumentedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return InstrumentedTemplate(super().get_template(template_name))
@@ -0,0 +1,72 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from hirebuzz.slow_queries import parse_log_lines, summarize
+
+
+class Command(BaseCommand):
+    help = 'Summarize SLOW_QUERY log lines into the top statements by total time'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'logs',
+            nargs='*',
+            help='Log files to read (default: standard input)'
+        )
+        parser.add_argument(
+            '--top',
+            type=int,
+            default=20,
+            help='Number of entries to show (default: 20)'
+        )
+        parser.add_argument(
+            '--group-by',
+            choices=['sql', 'view', 'location'],
+            default='sql',
+            help='Group by normalized statement, view or source line (default: sql)'
+        )
+        parser.add_argument(
+            '--full-scans',
+            action='store_true',
+            help='Only show statements whose query plan scans a whole table'
+        )
+
+    def handle(self, *args, **options):
+        entries = []
+        if options['logs']:
+            for path in options['logs']:
+                try:
+                    with open(path, encoding='utf-8', errors='replace') as log:
+                        entries.extend(parse_log_lines(log))
+                except OSError as exc:
+                    raise CommandError(f'Could not read {path}: {exc}')
+        else:
+            entries.extend(parse_log_lines(sys.stdin))
+
+        if not entries:
+            self.stdout.write(self.style.WARNING('No SLOW_QUERY lines found.'))
+            return
+
+        groups = summarize(entries, group_by=options['group_by'], top=len(entries))
+        if options['full_scans']:
+            groups = [group for group in groups if group['full_scan']]
+        groups = groups[:options['top']]
+
+        self.stdout.write(f'{len(entries)} slow queries, showing top {len(groups)} by total time\n')
+        for rank, group in enumerate(groups, start=1):
+            header = (
+                f"#{rank}  {group['count']}x  total {group['total_ms']:.1f} ms  "
+                f"avg {group['avg_ms']:.1f} ms  max {group['max_ms']:.1f} ms"
+            )
+            if group['full_scan']:
+                header += '  FULL SCAN'
+            self.stdout.write(self.style.MIGRATE_HEADING(header))
+            if options['group_by'] != 'sql':
+                self.stdout.write(f"    {options['group_by']}: {group['key']}")
+            self.stdout.write(f"    views: {', '.join(group['views'])}")
+            self.stdout.write(f"    at: {', '.join(group['locations'])}")
+            self.stdout.write(f"    sql: {group['sql']}")
+            for step in group['plan'] or []:
+                self.stdout.write(f'    plan: {step}')
+            self.stdout.write('')
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from hirebuzz.template_warmup import warm_templates
+
+
+class Command(BaseCommand):
+    help = 'Compile every template, as workers do at start with TEMPLATE_WARMUP, and report any that fail'
+
+    def handle(self, *args, **options):
+        compiled, errors = warm_templates()
+        for name, error in errors.items():
+            self.stderr.write(f'{name}: {error}')
+        if errors:
+            raise CommandError(f'{len(errors)} template(s) failed to compile')
+        self.stdout.write(f'Compiled {compiled} templates')
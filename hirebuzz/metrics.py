@@ -0,0 +1,304 @@
+"""
+Prometheus metrics shared by every worker process.
+
+Each process buffers counter increments in memory, and a background thread
+adds them every ``METRICS_FLUSH_INTERVAL`` seconds to a small SQLite file
+(``METRICS_DB``) with one UPSERT transaction, so any gunicorn worker
+answering ``/metrics`` reports the totals of all workers. Request threads
+never wait for the file.
+Gauges are computed when the endpoint is scraped. Recording is a no-op
+unless ``METRICS_ENABLED`` is set.
+"""
+import atexit
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+MATCH_COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 1000)
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsRegistry:
+    """Buffered, SQLite-backed store of counter and histogram samples."""
+
+    def __init__(self):
+        self.metrics = {}
+        self.collectors = []
+        self._lock = threading.Lock()
+        self._flusher = None
+        self.reset()
+        atexit.register(self._flush_at_exit)
+
+    def reset(self):
+        """Drop buffered samples and re-read settings (used after forks and settings changes)."""
+        with self._lock:
+            self._buffer = {}
+            if getattr(self, '_pid', None) != os.getpid():
+                # A forked worker does not inherit the parent's flush thread
+                self._flusher = None
+            self._pid = os.getpid()
+            self._local = threading.local()
+        self.enabled = getattr(settings, 'METRICS_ENABLED', False)
+        self.path = str(getattr(settings, 'METRICS_DB', 'metrics.sqlite3'))
+        self.flush_interval = getattr(settings, 'METRICS_FLUSH_INTERVAL', 1.0)
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def collector(self, func):
+        """Register a function returning ``(metric, help, [(labels, value)])`` gauges at scrape time."""
+        self.collectors.append(func)
+        return func
+
+    def add(self, name, labels, suffix, amount):
+        if not self.enabled:
+            return
+        if os.getpid() != self._pid:
+            # Forked worker: samples buffered by the parent are not ours to report
+            self.reset()
+        key = (name, labels, suffix)
+        with self._lock:
+            self._buffer[key] = self._buffer.get(key, 0) + amount
+            if self._flusher is None and self.flush_interval > 0:
+                self._flusher = threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True)
+                self._flusher.start()
+
+    def _flush_loop(self):
+        """Flush the buffer every ``flush_interval`` seconds, off the request threads."""
+        while self.flush_interval > 0:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Could not flush metrics to %s', self.path)
+        with self._lock:
+            self._flusher = None
+
+    def _flush_at_exit(self):
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('Could not flush metrics to %s', self.path)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS metric_samples ('
+                'metric TEXT NOT NULL, labels TEXT NOT NULL, suffix TEXT NOT NULL, '
+                'value REAL NOT NULL, PRIMARY KEY (metric, labels, suffix))'
+            )
+            self._local.conn = conn
+        return conn
+
+    def flush(self):
+        """
+        Add this process's buffered increments to the shared file.
+
+        If the file is locked or cannot be written, the error is logged and
+        the increments go back into the buffer for the next flush.
+        """
+        with self._lock:
+            pending, self._buffer = self._buffer, {}
+        if not pending or not self.enabled:
+            return
+        try:
+            conn = self._connection()
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                conn.executemany(
+                    'INSERT INTO metric_samples (metric, labels, suffix, value) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT (metric, labels, suffix) DO UPDATE SET value = value + excluded.value',
+                    [(name, labels, suffix, amount) for (name, labels, suffix), amount in pending.items()],
+                )
+                conn.execute('COMMIT')
+            except sqlite3.Error:
+                conn.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as exc:
+            logger.warning('Could not flush metrics to %s, keeping them for the next flush: %s', self.path, exc)
+            with self._lock:
+                for key, amount in pending.items():
+                    self._buffer[key] = self._buffer.get(key, 0) + amount
+
+    def samples(self):
+        """Return all stored samples as ``{metric: {labels: {suffix: value}}}``."""
+        if not self.enabled:
+            return {}
+        stored = {}
+        for name, labels, suffix, value in self._connection().execute(
+            'SELECT metric, labels, suffix, value FROM metric_samples'
+        ):
+            stored.setdefault(name, {}).setdefault(labels, {})[suffix] = value
+        return stored
+
+    def clear(self):
+        """Delete every stored sample (for tests)."""
+        self.reset()
+        if self.enabled:
+            self._connection().execute('DELETE FROM metric_samples')
+
+    def render(self):
+        """Render the Prometheus text exposition format."""
+        self.flush()
+        stored = self.samples()
+        lines = []
+        for name, metric in self.metrics.items():
+            lines.extend(metric.render(stored.get(name, {})))
+        for collect in self.collectors:
+            for metric, documentation, series in collect():
+                lines.append(f'# HELP {metric} {documentation}')
+                lines.append(f'# TYPE {metric} gauge')
+                for labels, value in series:
+                    lines.append(f'{metric}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+def _label_key(labels):
+    return json.dumps(labels, sort_keys=True, separators=(',', ':'))
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, **extra):
+    items = {**labels, **extra}
+    if not items:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in sorted(items.items())) + '}'
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter with labels."""
+
+    def __init__(self, name, documentation):
+        self.name = name
+        self.documentation = documentation
+
+    def inc(self, amount=1, **labels):
+        registry.add(self.name, _label_key(labels), '', amount)
+
+    def render(self, series):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        for labels, values in sorted(series.items()):
+            lines.append(f"{self.name}{_format_labels(json.loads(labels))} {_format_value(values.get('', 0))}")
+        return lines
+
+
+class Histogram:
+    """Histogram with fixed buckets and labels."""
+
+    def __init__(self, name, documentation, buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        for bound in self.buckets:
+            if value <= bound:
+                registry.add(self.name, key, f'le:{bound}', 1)
+                break
+        registry.add(self.name, key, 'sum', value)
+        registry.add(self.name, key, 'count', 1)
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall time of the ``with`` block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self, series):
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        for labels, values in sorted(series.items()):
+            labels = json.loads(labels)
+            cumulative = 0
+            for bound in self.buckets:
+                cumulative += values.get(f'le:{bound}', 0)
+                lines.append(f'{self.name}_bucket{_format_labels(labels, le=bound)} {_format_value(cumulative)}')
+            count = values.get('count', 0)
+            lines.append(f"{self.name}_bucket{_format_labels(labels, le='+Inf')} {_format_value(count)}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(values.get('sum', 0))}")
+            lines.append(f'{self.name}_count{_format_labels(labels)} {_format_value(count)}')
+        return lines
+
+
+registry = MetricsRegistry()
+
+
+@receiver(setting_changed)
+def _reload_metrics_settings(setting, **kwargs):
+    if setting.startswith('METRICS_'):
+        registry.reset()
+
+
+VIEW_LATENCY = registry.register(Histogram(
+    'hirebuzz_view_latency_seconds', 'Time spent serving a request, by URL name.'
+))
+VIEW_DB_QUERIES = registry.register(Histogram(
+    'hirebuzz_view_db_queries', 'Database queries run per request, by URL name.', QUERY_COUNT_BUCKETS
+))
+GEOCODE_CACHE = registry.register(Counter(
+    'hirebuzz_geocode_cache_requests_total',
+    'Geocode lookups answered from the cache (hit), the offline gazetteer (gazetteer) or neither (miss).'
+))
+PAGE_CACHE = registry.register(Counter(
+    'hirebuzz_page_cache_requests_total', 'Anonymous page views served from the page cache, by view and result.'
+))
+GEOCODER_LATENCY = registry.register(Histogram(
+    'hirebuzz_geocoder_request_seconds', 'Latency of outbound geocoder requests, by outcome.'
+))
+RECOMMENDATION_TIME = registry.register(Histogram(
+    'hirebuzz_recommendation_seconds', 'Time spent computing recommendations, by kind.'
+))
+SAVED_SEARCH_MATCHES = registry.register(Histogram(
+    'hirebuzz_saved_search_matches', 'Profiles matched per saved search run (all or new since last run).',
+    MATCH_COUNT_BUCKETS,
+))
+# Mail is sent synchronously, so there is no outbox whose depth could be measured;
+# send results are counted instead
+EMAILS_SENT = registry.register(Counter(
+    'hirebuzz_emails_sent_total', 'Notification emails attempted, by result.'
+))
+
+
+@registry.collector
+def _export_queue_depth():
+    from exports.models import ExportJob
+
+    pending = ExportJob.objects.filter(status=ExportJob.Status.PENDING).count()
+    return [('hirebuzz_export_queue_depth', 'Export jobs waiting for the run_export_jobs worker.', [({}, pending)])]
+
+
+@registry.collector
+def _geocode_queue_depth():
+    from jobs.models import GeocodeRequest
+
+    pending = GeocodeRequest.objects.filter(status=GeocodeRequest.Status.PENDING).count()
+    return [('hirebuzz_geocode_queue_depth', 'Locations waiting for the run_geocode_queue worker.', [({}, pending)])]
@@ -0,0 +1,281 @@
+import cProfile
+import json
+import logging
+import random
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils import timezone
+
+from .instrumentation import request_metrics
+from .metrics import VIEW_DB_QUERIES, VIEW_LATENCY
+from .profiling import PROFILE_FLAG, save_profile, token_is_valid
+from .routers import PIN_COOKIE, current_routing, replica_aliases, routing_scope
+from .slow_queries import current_origin, origin_scope
+
+
+logger = logging.getLogger('hirebuzz.performance')
+
+KNOWN_METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'}
+
+
+class PerformanceMiddleware:
+    """
+    Record where each request spends its time.
+
+    Logs one JSON line per request to the ``hirebuzz.performance`` logger with
+    wall time, query count and time, cache hits and misses, template render
+    time and outbound HTTP calls, tagged with the resolved URL name and view.
+    With ``PERF_SERVER_TIMING`` the same numbers are sent in a
+    ``Server-Timing`` header for the browser's network panel.
+
+    The middleware removes itself at startup unless ``PERF_INSTRUMENTATION``
+    is enabled, so a disabled deployment pays nothing per request. Supports
+    both sync and async handling.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PERF_INSTRUMENTATION', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.server_timing = getattr(settings, 'PERF_SERVER_TIMING', False)
+        self.log_min_ms = getattr(settings, 'PERF_LOG_MIN_MS', 0)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with request_metrics() as metrics:
+            response = self.get_response(request)
+        return self.report(request, response, metrics)
+
+    async def __acall__(self, request):
+        with request_metrics() as metrics:
+            response = await self.get_response(request)
+        return self.report(request, response, metrics)
+
+    def report(self, request, response, metrics):
+        if self.server_timing:
+            response['Server-Timing'] = metrics.server_timing()
+
+        payload = metrics.as_dict()
+        if payload['total_ms'] >= self.log_min_ms:
+            match = request.resolver_match
+            payload.update({
+                'method': request.method,
+                'path': request.path,
+                'url_name': match.view_name if match else None,
+                'view': match._func_path if match else None,
+                'status': response.status_code,
+            })
+            logger.info(json.dumps(payload), extra={'performance': payload})
+        return response
+
+
+class MetricsMiddleware:
+    """
+    Feed view latency and query count histograms for the ``/metrics`` endpoint.
+
+    Requests are labelled by URL name (``unresolved`` for 404s) so the label
+    set stays bounded. Removed at startup unless ``METRICS_ENABLED`` is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with request_metrics() as metrics:
+            response = self.get_response(request)
+        return self.observe(request, response, metrics)
+
+    async def __acall__(self, request):
+        with request_metrics() as metrics:
+            response = await self.get_response(request)
+        return self.observe(request, response, metrics)
+
+    def observe(self, request, response, metrics):
+        match = request.resolver_match
+        url_name = (match.view_name if match else '') or 'unresolved'
+        method = request.method if request.method in KNOWN_METHODS else 'other'
+        VIEW_LATENCY.observe(metrics.total_ms / 1000, url_name=url_name, method=method)
+        VIEW_DB_QUERIES.observe(metrics.db_queries, url_name=url_name)
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Run cProfile over sampled or explicitly flagged requests.
+
+    Must come after ``AuthenticationMiddleware`` so the staff flag can be
+    checked. Removed at startup unless ``PROFILING_ENABLED`` is set; requests
+    that are not profiled only pay for one random number. Under async
+    handling only the event loop thread is profiled, so code an async view
+    runs through ``sync_to_async`` is missing from the capture.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def trigger(self, request, user):
+        if user is not None and token_is_valid(request.GET[PROFILE_FLAG], user):
+            return 'staff'
+        if self.sample_rate and random.random() < self.sample_rate:
+            return 'sampled'
+        return None
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        trigger = self.trigger(request, request.user if PROFILE_FLAG in request.GET else None)
+        if trigger is None:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        save_profile(profiler, self.describe(request, response, started, trigger, request.user))
+        return response
+
+    async def __acall__(self, request):
+        # request.user would query the session synchronously
+        user = await request.auser() if PROFILE_FLAG in request.GET else None
+        trigger = self.trigger(request, user)
+        if trigger is None:
+            return await self.get_response(request)
+        if user is None:
+            user = await request.auser()
+
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            response = await self.get_response(request)
+        finally:
+            profiler.disable()
+        await sync_to_async(save_profile)(profiler, self.describe(request, response, started, trigger, user))
+        return response
+
+    def describe(self, request, response, started, trigger, user):
+        total_ms = (time.perf_counter() - started) * 1000
+        match = request.resolver_match
+        return {
+            'url_name': match.view_name if match else None,
+            'view': match._func_path if match else None,
+            'path': request.path,
+            'method': request.method,
+            'status': response.status_code,
+            'total_ms': round(total_ms, 2),
+            'trigger': trigger,
+            'user': user.get_username() if user.is_authenticated else None,
+            'created_at': timezone.now().isoformat(),
+        }
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Let ``PrimaryReplicaRouter`` read from replicas during read-only views.
+
+    Views listed in ``DATABASE_REPLICA_VIEWS`` (dotted paths) read from a
+    replica unless the request carries the primary pin cookie. Any request
+    that writes sets that cookie for ``REPLICA_PIN_SECONDS``, so users see
+    their own changes despite replication lag. Removed at startup when no
+    ``DATABASE_REPLICAS`` are configured.
+
+    Supports both sync and async handling, so it does not force async views
+    back onto a thread under ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not replica_aliases():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.replica_views = set(getattr(settings, 'DATABASE_REPLICA_VIEWS', ()))
+        self.pin_seconds = getattr(settings, 'REPLICA_PIN_SECONDS', 10)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with routing_scope(pinned=PIN_COOKIE in request.COOKIES) as state:
+            response = self.get_response(request)
+        return self.pin_writes(state, response)
+
+    async def __acall__(self, request):
+        with routing_scope(pinned=PIN_COOKIE in request.COOKIES) as state:
+            response = await self.get_response(request)
+        return self.pin_writes(state, response)
+
+    def pin_writes(self, state, response):
+        if state.wrote:
+            response.set_cookie(PIN_COOKIE, '1', max_age=self.pin_seconds, httponly=True, samesite='Lax')
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = current_routing()
+        if state is not None and f'{view_func.__module__}.{view_func.__name__}' in self.replica_views:
+            state.use_replica = True
+
+
+class QueryOriginMiddleware:
+    """
+    Tell the slow query log which view a request resolved to.
+
+    Needed for async views, whose queries run in a worker thread away from the
+    view's frames. Removed at startup unless ``SLOW_QUERY_MS`` is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if getattr(settings, 'SLOW_QUERY_MS', None) is None:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with origin_scope():
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        with origin_scope():
+            return await self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        origin = current_origin()
+        if origin is not None:
+            origin.view = f'{view_func.__module__}.{view_func.__name__}'
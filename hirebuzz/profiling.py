@@ -0,0 +1,102 @@
+"""
+On-demand cProfile captures of production requests.
+
+``hirebuzz.middleware.ProfilingMiddleware`` profiles a random
+``PROFILING_SAMPLE_RATE`` fraction of requests, plus any request from a staff
+user carrying a signed ``?_profile=<token>`` flag (see ``make_profile_token``). Each capture is
+written to ``PROFILING_DIR`` as a ``.prof`` file loadable with ``pstats`` or
+snakeviz, next to a ``.json`` file describing the request. Staff browse the
+captures at ``/admin/profiling/``.
+"""
+import io
+import json
+import pstats
+import re
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.utils import timezone
+
+
+PROFILE_FLAG = '_profile'
+TOKEN_SALT = 'hirebuzz.profiling'
+PROFILE_NAME_RE = re.compile(r'^[\w-]+$')
+SORT_KEYS = ('cumulative', 'tottime', 'ncalls')
+
+
+def profiling_dir():
+    return Path(getattr(settings, 'PROFILING_DIR', settings.BASE_DIR / 'perf_profiles'))
+
+
+def make_profile_token(user):
+    """Return the signed ``?_profile=`` value that lets ``user`` profile their own requests."""
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign(str(user.pk))
+
+
+def token_is_valid(token, user):
+    """Check a ``?_profile=`` token was issued to this staff user and has not expired."""
+    if not token or not user.is_authenticated or not user.is_staff:
+        return False
+    try:
+        user_pk = signing.TimestampSigner(salt=TOKEN_SALT).unsign(
+            token, max_age=getattr(settings, 'PROFILING_TOKEN_MAX_AGE', 3600)
+        )
+    except signing.BadSignature:
+        return False
+    return user_pk == str(user.pk)
+
+
+def save_profile(profiler, info):
+    """
+    Write a finished profile and its request description to ``PROFILING_DIR``.
+
+    Args:
+        profiler (cProfile.Profile): Disabled profiler
+        info (dict): Request details (url_name, path, method, status, total_ms, ...)
+
+    Returns:
+        str: Name of the capture, used by the admin pages
+    """
+    directory = profiling_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    slug = re.sub(r'[^\w-]+', '-', info.get('url_name') or 'unresolved').strip('-')
+    name = f"{timezone.now():%Y%m%d-%H%M%S}-{slug}-{info['total_ms']:.0f}ms-{uuid.uuid4().hex[:6]}"
+    profiler.dump_stats(directory / f'{name}.prof')
+    (directory / f'{name}.json').write_text(json.dumps({**info, 'name': name}))
+    prune_profiles(getattr(settings, 'PROFILING_MAX_FILES', 200))
+    return name
+
+
+def list_profiles():
+    """Return the stored captures' descriptions, newest first."""
+    captures = []
+    for meta_path in profiling_dir().glob('*.json'):
+        try:
+            captures.append(json.loads(meta_path.read_text()))
+        except (OSError, ValueError):
+            continue
+    return sorted(captures, key=lambda capture: capture['name'], reverse=True)
+
+
+def prune_profiles(keep):
+    """Delete all but the ``keep`` newest captures."""
+    for capture in list_profiles()[keep:]:
+        for suffix in ('.prof', '.json'):
+            profile_path(capture['name'], suffix).unlink(missing_ok=True)
+
+
+def profile_path(name, suffix='.prof'):
+    """Return the file of a capture, refusing names that could leave ``PROFILING_DIR``."""
+    if not PROFILE_NAME_RE.match(name):
+        raise FileNotFoundError(name)
+    return profiling_dir() / f'{name}{suffix}'
+
+
+def render_stats(name, sort='cumulative', limit=60):
+    """Format the top functions of a capture the way ``pstats`` prints them."""
+    out = io.StringIO()
+    stats = pstats.Stats(str(profile_path(name)), stream=out)
+    stats.strip_dirs().sort_stats(sort if sort in SORT_KEYS else 'cumulative').print_stats(limit)
+    return out.getvalue()
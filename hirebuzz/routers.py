@@ -0,0 +1,102 @@
+"""
+Primary/replica database routing.
+
+Writes always go to ``default``. Reads go to a random alias from
+``DATABASE_REPLICAS`` only while ``ReplicaRoutingMiddleware`` is serving one
+of the read-only ``DATABASE_REPLICA_VIEWS`` and the user has not written
+recently; everything else (management commands, workers, other views) reads
+from the primary, so replication lag never affects code that expects to see
+its own writes.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+
+
+PRIMARY = 'default'
+
+# Set for REPLICA_PIN_SECONDS after a request that wrote; while present, reads use the primary
+PIN_COOKIE = 'hirebuzz_primary_pin'
+
+_state = ContextVar('hirebuzz_replica_routing', default=None)
+
+
+class RoutingState:
+    """Per-request routing decision."""
+
+    def __init__(self, pinned=False):
+        self.pinned = pinned
+        self.use_replica = False
+        self.wrote = False
+        self.replica = None
+
+
+def current_routing():
+    return _state.get()
+
+
+@contextmanager
+def routing_scope(pinned=False):
+    """Track replica eligibility and writes for the enclosed request."""
+    state = RoutingState(pinned=pinned)
+    token = _state.set(state)
+    try:
+        yield state
+    finally:
+        _state.reset(token)
+
+
+def replica_aliases():
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def _other_database(hints, replicas):
+    """Return the database of a hinted instance that lives outside the primary/replica set."""
+    instance = hints.get('instance')
+    db = instance._state.db if instance is not None else None
+    if db in (None, PRIMARY) or db in replicas:
+        return None
+    return db
+
+
+class PrimaryReplicaRouter:
+    """Send reads of read-only views to a replica and everything else to the primary."""
+
+    def db_for_read(self, model, **hints):
+        other = _other_database(hints, replica_aliases())
+        if other:
+            return other
+        state = _state.get()
+        if state is None or not state.use_replica or state.pinned or state.wrote:
+            return PRIMARY
+        if model._meta.app_label in getattr(settings, 'DATABASE_PRIMARY_ONLY_APPS', ()):
+            return PRIMARY
+        if state.replica is None:
+            # One replica per request, so all of its reads see the same snapshot
+            replicas = replica_aliases()
+            state.replica = random.choice(replicas) if replicas else PRIMARY
+        return state.replica
+
+    def db_for_write(self, model, **hints):
+        # Objects read from a replica are saved to the primary; explicit other
+        # databases (e.g. benchmark copies) keep their own
+        other = _other_database(hints, replica_aliases())
+        if other:
+            return other
+        state = _state.get()
+        if state is not None:
+            # Later reads in this request, and the user's next requests, see the write
+            state.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {PRIMARY, *replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication
+        return db == PRIMARY
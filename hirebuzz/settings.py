@@ -13,6 +13,10 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 from pathlib import Path
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
+from hirebuzz.db import database_settings
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -44,14 +48,22 @@ INSTALLED_APPS = [
     'jobs',
     'applications',
     'communications',
+    'exports',
+    'benchmarks',
+    'hirebuzz.apps.HirebuzzConfig',
 ]
 
 MIDDLEWARE = [
+    'hirebuzz.middleware.PerformanceMiddleware',
+    'hirebuzz.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'hirebuzz.middleware.ReplicaRoutingMiddleware',
+    'hirebuzz.middleware.QueryOriginMiddleware',
+    'hirebuzz.middleware.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -60,7 +72,7 @@ ROOT_URLCONF = 'hirebuzz.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'hirebuzz.instrumentation.InstrumentedDjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'hirebuzz/templates')],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -75,18 +87,66 @@ TEMPLATES = [
     },
 ]
 
+# Compile every template when a worker starts (hirebuzz.template_warmup), rather than on
+# the first request that uses each one. On in hirebuzz.settings_production.
+TEMPLATE_WARMUP = os.environ.get('HIREBUZZ_TEMPLATE_WARMUP', '') == '1'
+
 WSGI_APPLICATION = 'hirebuzz.wsgi.application'
 
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
+# SQLite by default; set HIREBUZZ_DB_ENGINE=postgresql and HIREBUZZ_DB_* for PostgreSQL
+# (driver: pip install -r requirements-postgresql.txt),
+# and HIREBUZZ_DB_REPLICAS for read replicas. Connections persist for HIREBUZZ_DB_CONN_MAX_AGE
+# seconds with health checks (not by default under ASGI); HIREBUZZ_DB_POOL / HIREBUZZ_DB_PGBOUNCER configure pooling
+# (see hirebuzz.db.database_settings)
+
+DATABASES, DATABASE_REPLICAS = database_settings(os.environ, BASE_DIR)
+DATABASE_ROUTERS = ['hirebuzz.routers.PrimaryReplicaRouter']
+
+# Read-only views whose queries may go to a replica (hirebuzz.middleware.ReplicaRoutingMiddleware).
+# After a request that writes, the user reads from the primary for REPLICA_PIN_SECONDS.
+DATABASE_REPLICA_VIEWS = [
+    'jobs.views.index',
+    'jobs.views.detail',
+    'jobs.views.map_view',
+    'profiles.views.index',
+    'profiles.views.view_profile',
+]
+REPLICA_PIN_SECONDS = 10
+# Sessions and auth state are read right after they are written (login, logout),
+# so they never come from a replica
+DATABASE_PRIMARY_ONLY_APPS = ['sessions', 'auth', 'contenttypes', 'admin']
+
+# Applied to every SQLite connection by hirebuzz.db.configure_sqlite. WAL lets readers
+# run alongside the single writer and busy_timeout makes concurrent writers queue instead
+# of failing; see `manage.py benchmark_sqlite_writes`. HIREBUZZ_SQLITE_TUNING=0 disables.
+SQLITE_PRAGMAS = {} if os.environ.get('HIREBUZZ_SQLITE_TUNING') == '0' else {
+    'busy_timeout': 5000,           # ms
+    'journal_mode': 'wal',
+    'synchronous': 'normal',        # durable in WAL mode except on power loss
+    'mmap_size': 128 * 1024 * 1024,
+    'cache_size': -20000,           # negative means KiB, i.e. ~20 MB per connection
+    'temp_store': 'memory',
+}
 
-DATABASES = {
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': 'hirebuzz.instrumentation.InstrumentedLocMemCache',
     }
 }
+# Seconds to keep whole pages rendered for anonymous visitors (hirebuzz.caching), 0 to
+# disable, and the cache they are kept in. Keys include the object's updated_at, so a
+# save shows up on the next request.
+PAGE_CACHE_SECONDS = int(os.environ.get('HIREBUZZ_PAGE_CACHE_SECONDS', '600'))
+PAGE_CACHE_ALIAS = 'default'
+# Seconds to keep {% cache %} template fragments, which are keyed the same way
+FRAGMENT_CACHE_SECONDS = int(os.environ.get('HIREBUZZ_FRAGMENT_CACHE_SECONDS', '86400'))
 
 
 # Password validation
@@ -124,14 +184,105 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.0/howto/static-files/
 
 STATIC_URL = 'static/'
-STATICFILES_DIRS = [
-    BASE_DIR / 'hirebuzz/static/',
-]
 
 # Media files (user uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Admin CSV exports larger than this are queued for the run_export_jobs worker
+# instead of being streamed in the request
+EXPORT_INLINE_MAX_ROWS = 10000
+
+# Geocoder backend for job and profile locations (jobs.geocoders), chosen with HIREBUZZ_GEOCODER:
+#   chained   - bundled US gazetteer first, then cached Nominatim (default)
+#   nominatim - cached Nominatim only
+#   gazetteer - offline gazetteer only; unlisted places are not found
+# HIREBUZZ_GEOCODER_URL points Nominatim at a self-hosted instance. Async views run at most
+# HIREBUZZ_GEOCODER_MAX_CONNECTIONS lookups at once per event loop. Nominatim lookups are
+# spaced to HIREBUZZ_GEOCODER_RATE_LIMIT requests per second; the public server allows 1,
+# raise it for a self-hosted instance.
+GEOCODER_RATE_LIMIT = float(os.environ.get('HIREBUZZ_GEOCODER_RATE_LIMIT', '1'))
+_NOMINATIM_GEOCODER = {
+    'BACKEND': 'jobs.geocoders.CachedBackend',
+    'OPTIONS': {
+        'backend': {
+            'BACKEND': 'jobs.geocoders.NominatimBackend',
+            'OPTIONS': {
+                'url': os.environ.get('HIREBUZZ_GEOCODER_URL', 'https://nominatim.openstreetmap.org/search'),
+                'timeout': float(os.environ.get('HIREBUZZ_GEOCODER_TIMEOUT', '10')),
+                'max_connections': int(os.environ.get('HIREBUZZ_GEOCODER_MAX_CONNECTIONS', '10')),
+                'rate': GEOCODER_RATE_LIMIT,
+            },
+        },
+    },
+}
+_GAZETTEER_GEOCODER = {'BACKEND': 'jobs.geocoders.GazetteerBackend'}
+GEOCODER_PRESETS = {
+    'chained': {
+        'BACKEND': 'jobs.geocoders.ChainedBackend',
+        'OPTIONS': {'backends': [_GAZETTEER_GEOCODER, _NOMINATIM_GEOCODER]},
+    },
+    'nominatim': _NOMINATIM_GEOCODER,
+    'gazetteer': _GAZETTEER_GEOCODER,
+}
+_geocoder_preset = os.environ.get('HIREBUZZ_GEOCODER', 'chained')
+if _geocoder_preset not in GEOCODER_PRESETS:
+    raise ImproperlyConfigured(f"HIREBUZZ_GEOCODER must be one of {', '.join(GEOCODER_PRESETS)}")
+GEOCODER = GEOCODER_PRESETS[_geocoder_preset]
+# Batch geocoding (geocode_jobs): worker threads; requests are spaced to GEOCODER_RATE_LIMIT
+GEOCODER_BATCH_CONCURRENCY = int(os.environ.get('HIREBUZZ_GEOCODER_CONCURRENCY', '4'))
+# Queue a geocode request when a job or profile is saved with a new location; the
+# run_geocode_queue worker fills in the coordinates
+GEOCODE_ON_SAVE = os.environ.get('HIREBUZZ_GEOCODE_ON_SAVE', '1') == '1'
+
+# Per-request performance logging (hirebuzz.middleware.PerformanceMiddleware).
+# Each request logs wall, query, cache, template and outbound HTTP timings to the
+# hirebuzz.performance logger; PERF_SERVER_TIMING also sends a Server-Timing header.
+PERF_INSTRUMENTATION = os.environ.get('HIREBUZZ_PERF_INSTRUMENTATION', '') == '1'
+PERF_SERVER_TIMING = os.environ.get('HIREBUZZ_PERF_SERVER_TIMING', '') == '1'
+PERF_LOG_MIN_MS = float(os.environ.get('HIREBUZZ_PERF_LOG_MIN_MS', '0'))
+
+# Prometheus metrics served at /metrics (hirebuzz.metrics). Worker processes share
+# counters through the METRICS_DB SQLite file; set METRICS_TOKEN for bearer-token
+# scraping, otherwise only staff users may read the endpoint. A background thread in
+# each process writes buffered counts every METRICS_FLUSH_INTERVAL seconds; 0 leaves
+# them for scrapes and process exit.
+METRICS_ENABLED = os.environ.get('HIREBUZZ_METRICS', '') == '1'
+METRICS_DB = os.environ.get('HIREBUZZ_METRICS_DB', str(BASE_DIR / 'metrics.sqlite3'))
+METRICS_TOKEN = os.environ.get('HIREBUZZ_METRICS_TOKEN', '')
+METRICS_FLUSH_INTERVAL = 1.0
+
+# Slow query log (hirebuzz.slow_queries). Queries taking at least SLOW_QUERY_MS are
+# logged to hirebuzz.slow_queries with the view and source line that ran them;
+# SLOW_QUERY_EXPLAIN adds SQLite's EXPLAIN QUERY PLAN. Unset disables the log.
+SLOW_QUERY_MS = float(os.environ['HIREBUZZ_SLOW_QUERY_MS']) if os.environ.get('HIREBUZZ_SLOW_QUERY_MS') else None
+SLOW_QUERY_EXPLAIN = os.environ.get('HIREBUZZ_SLOW_QUERY_EXPLAIN', '') == '1'
+
+# Request profiling (hirebuzz.middleware.ProfilingMiddleware). When enabled, a
+# PROFILING_SAMPLE_RATE fraction of requests, and staff requests carrying the signed
+# ?_profile= flag from /admin/profiling/, are run under cProfile and saved to PROFILING_DIR.
+PROFILING_ENABLED = os.environ.get('HIREBUZZ_PROFILING', '') == '1'
+PROFILING_SAMPLE_RATE = float(os.environ.get('HIREBUZZ_PROFILING_SAMPLE_RATE', '0'))
+PROFILING_DIR = Path(os.environ.get('HIREBUZZ_PROFILING_DIR', str(BASE_DIR / 'perf_profiles')))
+PROFILING_TOKEN_MAX_AGE = 3600
+PROFILING_MAX_FILES = 200
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'hirebuzz': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -0,0 +1,44 @@
+"""
+Production settings for hirebuzz.
+
+Use with ``DJANGO_SETTINGS_MODULE=hirebuzz.settings_production``. Everything
+in ``hirebuzz.settings`` applies, except that debug is off, the secret key
+(required) and allowed hosts come from the environment, and templates are compiled
+once per worker: the cached loader is configured explicitly and every
+template is compiled at worker start (``TEMPLATE_WARMUP``).
+"""
+import os
+
+from django.core.exceptions import ImproperlyConfigured
+
+from hirebuzz.settings import *  # noqa: F401,F403
+from hirebuzz.settings import TEMPLATES as DEVELOPMENT_TEMPLATES
+
+
+DEBUG = os.environ.get('HIREBUZZ_DEBUG', '') == '1'
+
+# Never the development key: it also signs sessions and profiling links
+SECRET_KEY = os.environ.get('HIREBUZZ_SECRET_KEY', '')
+if not SECRET_KEY:
+    raise ImproperlyConfigured('Set HIREBUZZ_SECRET_KEY to use the production settings.')
+
+ALLOWED_HOSTS = [host.strip() for host in os.environ.get('HIREBUZZ_ALLOWED_HOSTS', '').split(',') if host.strip()]
+
+# Same backend and context processors, with the loaders spelled out instead of APP_DIRS
+TEMPLATES = [
+    {
+        **DEVELOPMENT_TEMPLATES[0],
+        'APP_DIRS': False,
+        'OPTIONS': {
+            **DEVELOPMENT_TEMPLATES[0]['OPTIONS'],
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
+        },
+    },
+]
+
+TEMPLATE_WARMUP = os.environ.get('HIREBUZZ_TEMPLATE_WARMUP', '1') == '1'
@@ -0,0 +1,208 @@
+"""
+Slow query log.
+
+``log_slow_queries`` is added to every database connection's execute
+wrappers when ``SLOW_QUERY_MS`` is set. Queries slower than the threshold are
+logged to the ``hirebuzz.slow_queries`` logger as ``SLOW_QUERY {json}`` lines
+with the view and the project source line that issued them, and for SQLite
+SELECTs optionally the ``EXPLAIN QUERY PLAN`` output. The
+``slow_query_report`` command aggregates those lines into a top-N report.
+
+Async views run their queries in a worker thread, so their frames are not on
+the query's stack; ``QueryOriginMiddleware`` records the resolved view for
+them instead.
+"""
+import json
+import logging
+import re
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db.backends.sqlite3.base import SQLiteCursorWrapper
+
+
+logger = logging.getLogger('hirebuzz.slow_queries')
+
+LOG_MARKER = 'SLOW_QUERY '
+
+_origin = ContextVar('hirebuzz_query_origin', default=None)
+
+# Request plumbing that wraps views; never reported as a query's source line
+INFRASTRUCTURE_MODULES = {
+    'hirebuzz.instrumentation', 'hirebuzz.metrics', 'hirebuzz.middleware', 'hirebuzz.slow_queries',
+}
+
+
+def normalize_sql(sql):
+    """Replace literals in a statement so repeated lookups group together."""
+    sql = re.sub(r"'(?:[^']|'')*'", '?', sql)
+    sql = re.sub(r'\b\d+(\.\d+)?\b', '?', sql)
+    return re.sub(r'\(\?(, \?)*\)', '(...)', sql)
+
+
+def _project_frames():
+    """Yield ``(module, filename, lineno, function)`` for project code on the stack, innermost first."""
+    base_dir = str(settings.BASE_DIR)
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        module = frame.f_globals.get('__name__', '')
+        if (
+            filename.startswith(base_dir)
+            and 'site-packages' not in filename
+            and module not in INFRASTRUCTURE_MODULES
+        ):
+            yield module, filename, frame.f_lineno, frame.f_code.co_name
+        frame = frame.f_back
+
+
+class QueryOrigin:
+    """The view serving the current request, as a dotted path."""
+
+    def __init__(self):
+        self.view = None
+
+
+def current_origin():
+    return _origin.get()
+
+
+@contextmanager
+def origin_scope():
+    """Hold the view recorded for the enclosed request."""
+    origin = QueryOrigin()
+    token = _origin.set(origin)
+    try:
+        yield origin
+    finally:
+        _origin.reset(token)
+
+
+def query_origin():
+    """
+    Find where the running query came from.
+
+    Returns:
+        tuple: (view, location) where ``view`` is the outermost function of a
+            ``views`` module on the stack and ``location`` is the innermost
+            project source line (for lazy querysets, the line that evaluated
+            them, often the view's ``render`` call), both None when not found;
+            the view falls back to the one recorded by ``QueryOriginMiddleware``
+    """
+    view = location = None
+    base_dir = str(settings.BASE_DIR).rstrip('/') + '/'
+    for module, filename, lineno, function in _project_frames():
+        if location is None:
+            location = f'{filename.removeprefix(base_dir)}:{lineno} in {function}'
+        if module.endswith('views'):
+            view = f'{module}.{function}'
+    origin = _origin.get()
+    if view is None and origin is not None:
+        view = origin.view
+    return view, location
+
+
+def explain_query_plan(connection, sql, params):
+    """Return SQLite's query plan lines for a SELECT, or None when unavailable."""
+    if connection.vendor != 'sqlite' or not sql.lstrip().upper().startswith('SELECT'):
+        return None
+    try:
+        # A raw cursor bypasses the execute wrappers, so the plan is not logged itself
+        cursor = connection.connection.cursor(factory=SQLiteCursorWrapper)
+        try:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            return [row[-1] for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+    except Exception:
+        return None
+
+
+def log_slow_queries(execute, sql, params, many, context):
+    """Execute wrapper logging statements slower than ``SLOW_QUERY_MS``."""
+    threshold_ms = getattr(settings, 'SLOW_QUERY_MS', None)
+    if threshold_ms is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms >= threshold_ms:
+            view, location = query_origin()
+            entry = {
+                'ms': round(elapsed_ms, 2),
+                'alias': context['connection'].alias,
+                'view': view,
+                'location': location,
+                'sql': sql,
+                'many': many,
+            }
+            if getattr(settings, 'SLOW_QUERY_EXPLAIN', False) and not many:
+                entry['plan'] = explain_query_plan(context['connection'], sql, params)
+            logger.warning(LOG_MARKER + json.dumps(entry, default=str), extra={'slow_query': entry})
+
+
+def install_slow_query_log(sender, connection, **kwargs):
+    """``connection_created`` receiver adding the wrapper to new connections."""
+    if getattr(settings, 'SLOW_QUERY_MS', None) is None:
+        return
+    if log_slow_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(log_slow_queries)
+
+
+def parse_log_lines(lines):
+    """Yield the entries of ``SLOW_QUERY`` lines found in arbitrary log output."""
+    for line in lines:
+        position = line.find(LOG_MARKER)
+        if position == -1:
+            continue
+        try:
+            yield json.loads(line[position + len(LOG_MARKER):])
+        except ValueError:
+            continue
+
+
+def summarize(entries, group_by='sql', top=20):
+    """
+    Aggregate slow query entries.
+
+    Args:
+        entries: Iterable of logged entries
+        group_by (str): 'sql' (normalized statement), 'view' or 'location'
+        top (int): Number of groups to return, by total time
+
+    Returns:
+        list: Dicts with count, total/avg/max ms, the views and locations seen,
+            an example statement and whether its plan scanned a table
+    """
+    groups = {}
+    for entry in entries:
+        if group_by == 'sql':
+            key = normalize_sql(entry['sql'])
+        else:
+            key = entry.get(group_by) or '(unknown)'
+        group = groups.setdefault(key, {
+            'key': key, 'count': 0, 'total_ms': 0.0, 'max_ms': 0.0,
+            'views': set(), 'locations': set(), 'sql': entry['sql'], 'plan': None,
+        })
+        group['count'] += 1
+        group['total_ms'] += entry['ms']
+        group['max_ms'] = max(group['max_ms'], entry['ms'])
+        group['views'].add(entry.get('view') or '(unknown)')
+        group['locations'].add(entry.get('location') or '(unknown)')
+        if entry.get('plan') and not group['plan']:
+            group['plan'] = entry['plan']
+
+    ranked = sorted(groups.values(), key=lambda group: group['total_ms'], reverse=True)[:top]
+    for group in ranked:
+        group['avg_ms'] = group['total_ms'] / group['count']
+        group['views'] = sorted(group['views'])
+        group['locations'] = sorted(group['locations'])
+        group['full_scan'] = any(
+            step.startswith('SCAN') and 'USING' not in step for step in group['plan'] or []
+        )
+    return ranked
@@ -0,0 +1,78 @@
+"""
+Compile every Django template before a worker serves its first request.
+
+With the cached template loader each template is parsed once per process,
+on the first request that needs it. ``warm_templates`` parses them all up
+front, so those first requests cost the same as any other. It runs at
+worker start (``hirebuzz.wsgi`` and ``hirebuzz.asgi``) when
+``TEMPLATE_WARMUP`` is on, and as the ``warm_templates`` command, which
+doubles as a check that every template compiles.
+"""
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template import TemplateSyntaxError, engines
+from django.template.backends.django import DjangoTemplates
+
+
+logger = logging.getLogger(__name__)
+
+
+def _loader_dirs(loaders):
+    for loader in loaders:
+        # The cached loader wraps the loaders that actually read files
+        yield from _loader_dirs(getattr(loader, 'loaders', []))
+        if hasattr(loader, 'get_dirs'):
+            yield from loader.get_dirs()
+
+
+def template_names(engine):
+    """
+    List the names of all templates a Django template engine can load.
+
+    Args:
+        engine (django.template.Engine): The engine to search
+
+    Returns:
+        list: Sorted template names, e.g. ``'jobs/index.html'``
+    """
+    names = set()
+    for directory in _loader_dirs(engine.template_loaders):
+        directory = Path(directory)
+        if directory.is_dir():
+            names.update(path.relative_to(directory).as_posix() for path in directory.rglob('*') if path.is_file())
+    return sorted(names)
+
+
+def warm_templates():
+    """
+    Compile all templates of every Django template backend.
+
+    Returns:
+        tuple: (templates compiled, {template name: error message})
+    """
+    compiled, errors = 0, {}
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for name in template_names(backend.engine):
+            try:
+                backend.engine.get_template(name)
+            except (TemplateSyntaxError, UnicodeDecodeError) as exc:
+                errors[name] = str(exc)
+            else:
+                compiled += 1
+    return compiled, errors
+
+
+def warm_templates_on_start():
+    """Warm the template cache at worker start when ``TEMPLATE_WARMUP`` is on."""
+    if not settings.TEMPLATE_WARMUP:
+        return
+    started = time.perf_counter()
+    compiled, errors = warm_templates()
+    for name, error in errors.items():
+        logger.error('Template %s does not compile: %s', name, error)
+    logger.info('Compiled %d templates in %.0f ms', compiled, (time.perf_counter() - started) * 1000)
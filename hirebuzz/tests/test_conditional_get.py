@@ -0,0 +1,115 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import http_date
+
+from accounts.models import UserProfile
+from jobs.models import Job
+from profiles.models import Profile
+
+
+User = get_user_model()
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        UserProfile.objects.create(user=cls.recruiter, user_type='recruiter')
+        cls.seeker = User.objects.create_user('sam', 'sam@example.com', 'password123')
+        UserProfile.objects.create(user=cls.seeker, user_type='job_seeker')
+        cls.job = Job.objects.create(
+            title='Engineer', company='Acme', location='Atlanta, GA', description='Build APIs',
+            requirements='Python', skills_required='Python', recruiter=cls.recruiter,
+            latitude=33.749, longitude=-84.388,
+        )
+        cls.profile = Profile.objects.create(
+            user=cls.seeker, headline='Engineer', skills='Python', education='BS', work_experience='Acme',
+            location='Atlanta, GA',
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_unchanged_job_page_is_not_rendered_again(self):
+        url = reverse('jobs:detail', args=[self.job.pk])
+        response = self.client.get(url)
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        with self.assertNumQueries(1):
+            # Only the version lookup
+            revalidated = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.content, b'')
+
+        by_date = self.client.get(url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(by_date.status_code, 304)
+
+        self.job.description = 'Build services'
+        self.job.save()
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertContains(changed, 'Build services')
+        self.assertNotEqual(changed['ETag'], response['ETag'])
+
+    def test_listing_etag_changes_when_jobs_are_added_or_removed(self):
+        url = reverse('jobs:index')
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # Filters are part of the ETag
+        self.assertEqual(self.client.get(url, {'search': 'Engineer'}, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+        other = Job.objects.create(
+            title='Analyst', company='Acme', location='Remote', description='Reports', requirements='SQL',
+            recruiter=self.recruiter,
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertContains(response, 'Analyst')
+
+        other.delete()
+        self.assertNotEqual(self.client.get(url)['ETag'], response['ETag'])
+
+    def test_listing_sends_no_last_modified(self):
+        url = reverse('jobs:index')
+        response = self.client.get(url)
+        self.assertFalse(response.has_header('Last-Modified'))
+
+        # Closing a job takes it out of the listing without a newer date to compare
+        Job.objects.filter(pk=self.job.pk).update(status='closed')
+        stale = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 60))
+        self.assertEqual(stale.status_code, 200)
+        self.assertNotContains(stale, 'Build APIs')
+
+    def test_signed_in_validators_are_private_to_the_session(self):
+        url = reverse('profiles:view', args=[self.seeker.pk])
+        anonymous = self.client.get(url)
+        self.assertTrue(anonymous.has_header('ETag'))
+
+        self.client.force_login(self.recruiter)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=anonymous['ETag'])
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('Last-Modified'))
+        self.assertIn('private', response['Cache-Control'])
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+
+        self.client.logout()
+        self.client.force_login(self.recruiter)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 200)
+
+    def test_map_revalidates_on_job_and_profile_changes(self):
+        self.client.force_login(self.seeker)
+        url = reverse('jobs:map')
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.profile.commute_radius = 10
+        self.profile.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_redirects_and_missing_pages_get_no_validators(self):
+        self.assertFalse(self.client.get(reverse('jobs:map')).has_header('ETag'))
+        self.assertFalse(self.client.get(reverse('jobs:detail', args=[self.job.pk + 100])).has_header('ETag'))
@@ -0,0 +1,46 @@
+import tempfile
+from pathlib import Path
+
+from django.db import connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, override_settings
+
+from hirebuzz.db import sqlite_pragma_statements
+
+
+class SqlitePragmaTests(SimpleTestCase):
+    def open_database(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        wrapper = DatabaseWrapper({**connection.settings_dict, 'NAME': str(Path(tmp.name) / 'db.sqlite3')})
+        self.addCleanup(wrapper.close)
+        wrapper.ensure_connection()
+        return wrapper
+
+    def pragma(self, wrapper, name):
+        return wrapper.connection.execute(f'PRAGMA {name}').fetchone()[0]
+
+    @override_settings(SQLITE_PRAGMAS={
+        'journal_mode': 'wal', 'synchronous': 'normal', 'busy_timeout': 2500,
+        'cache_size': -8000, 'temp_store': 'memory', 'mmap_size': 1048576,
+    })
+    def test_new_connections_get_configured_pragmas(self):
+        wrapper = self.open_database()
+
+        self.assertEqual(self.pragma(wrapper, 'journal_mode'), 'wal')
+        self.assertEqual(self.pragma(wrapper, 'synchronous'), 1)
+        self.assertEqual(self.pragma(wrapper, 'busy_timeout'), 2500)
+        self.assertEqual(self.pragma(wrapper, 'cache_size'), -8000)
+        self.assertEqual(self.pragma(wrapper, 'temp_store'), 2)
+        self.assertEqual(self.pragma(wrapper, 'mmap_size'), 1048576)
+
+    @override_settings(SQLITE_PRAGMAS={})
+    def test_empty_setting_keeps_sqlite_defaults(self):
+        wrapper = self.open_database()
+
+        self.assertEqual(self.pragma(wrapper, 'journal_mode'), 'delete')
+
+    def test_busy_timeout_is_applied_first(self):
+        statements = sqlite_pragma_statements({'journal_mode': 'wal', 'busy_timeout': 5000})
+
+        self.assertEqual(statements, ['PRAGMA busy_timeout = 5000', 'PRAGMA journal_mode = wal'])
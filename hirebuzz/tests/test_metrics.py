@@ -0,0 +1,139 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from hirebuzz.metrics import GEOCODE_CACHE, Counter, Histogram, registry
+from jobs.utils import geocode_location
+
+
+User = get_user_model()
+
+METRICS_DIR = tempfile.mkdtemp()
+
+
+def _increment_in_child(times):
+    counter = Counter('hirebuzz_test_total', 'Test counter.')
+    for _ in range(times):
+        counter.inc(worker='any')
+    registry.flush()
+
+
+@override_settings(
+    METRICS_ENABLED=True,
+    METRICS_DB=os.path.join(METRICS_DIR, 'metrics.sqlite3'),
+    METRICS_FLUSH_INTERVAL=0,
+    METRICS_TOKEN='',
+)
+class MetricsEndpointTests(TestCase):
+    def setUp(self):
+        registry.clear()
+        cache.clear()
+        self.staff = User.objects.create_user('ops', 'ops@example.com', 'password123', is_staff=True)
+
+    def _scrape(self, **headers):
+        return self.client.get(reverse('metrics'), **headers)
+
+    def test_view_latency_and_queries_are_labelled_by_url_name(self):
+        self.client.get(reverse('jobs:index'))
+        self.client.get(reverse('jobs:index'))
+        self.client.force_login(self.staff)
+
+        body = self._scrape().content.decode()
+
+        self.assertIn('hirebuzz_view_latency_seconds_count{method="GET",url_name="jobs:index"} 2', body)
+        self.assertIn('hirebuzz_view_db_queries_bucket{le="+Inf",url_name="jobs:index"} 2', body)
+        self.assertIn('hirebuzz_export_queue_depth 0', body)
+
+    @override_settings(GEOCODER=settings.GEOCODER_PRESETS['nominatim'])
+    @mock.patch('jobs.geocoders.requests.get')
+    def test_geocode_cache_hits_and_geocoder_latency(self, get):
+        get.return_value.json.return_value = [{'lat': '33.749', 'lon': '-84.388'}]
+
+        geocode_location('Atlanta, GA')
+        geocode_location('  atlanta,   GA ')
+
+        self.assertEqual(get.call_count, 1)
+        body = registry.render()
+        self.assertIn('hirebuzz_geocode_cache_requests_total{result="hit"} 1', body)
+        self.assertIn('hirebuzz_geocode_cache_requests_total{result="miss"} 1', body)
+        self.assertIn('hirebuzz_geocoder_request_seconds_count{outcome="found"} 1', body)
+
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram('hirebuzz_test_seconds', 'Test histogram.', buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5):
+            histogram.observe(value, kind='x')
+
+        registry.flush()
+        lines = histogram.render(registry.samples()['hirebuzz_test_seconds'])
+
+        self.assertIn('hirebuzz_test_seconds_bucket{kind="x",le="0.1"} 1', lines)
+        self.assertIn('hirebuzz_test_seconds_bucket{kind="x",le="1.0"} 2', lines)
+        self.assertIn('hirebuzz_test_seconds_bucket{kind="x",le="+Inf"} 3', lines)
+        self.assertIn('hirebuzz_test_seconds_sum{kind="x"} 5.55', lines)
+
+    def test_worker_processes_share_counters(self):
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=_increment_in_child, args=(50,)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+
+        self.assertEqual([worker.exitcode for worker in workers], [0, 0, 0])
+        samples = registry.samples()['hirebuzz_test_total']
+        self.assertEqual(samples['{"worker":"any"}'][''], 150)
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_token_is_required_when_configured(self):
+        self.assertEqual(self._scrape().status_code, 403)
+        self.assertEqual(self._scrape(HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+        self.assertEqual(self._scrape(HTTP_AUTHORIZATION='Bearer s3cret').status_code, 200)
+
+    def test_only_staff_are_served_without_token(self):
+        self.assertEqual(self._scrape(REMOTE_ADDR='203.0.113.5').status_code, 403)
+        # Behind a reverse proxy every request comes from a local address
+        self.assertEqual(self._scrape(REMOTE_ADDR='127.0.0.1').status_code, 403)
+
+        self.client.force_login(self.staff)
+        self.assertEqual(self._scrape().status_code, 200)
+
+    def test_unwritable_metrics_file_does_not_fail_requests(self):
+        with override_settings(METRICS_DB=os.path.join(METRICS_DIR, 'missing', 'metrics.sqlite3')):
+            self.assertEqual(self.client.get(reverse('jobs:index')).status_code, 200)
+            with self.assertLogs('hirebuzz.metrics', 'WARNING'):
+                registry.flush()
+            # The samples wait in the buffer for a flush that works
+            self.assertTrue(registry._buffer)
+
+    def test_requests_leave_flushing_to_the_background_thread(self):
+        flushed_by = []
+        flush = registry.flush
+
+        def record_thread():
+            flushed_by.append(threading.current_thread().name)
+            flush()
+
+        with override_settings(METRICS_FLUSH_INTERVAL=0.05), mock.patch.object(registry, 'flush', record_thread):
+            self.client.get(reverse('jobs:index'))
+            for _ in range(100):
+                if 'hirebuzz_view_latency_seconds' in registry.samples():
+                    break
+                time.sleep(0.02)
+
+        self.assertIn('hirebuzz_view_latency_seconds', registry.samples())
+        self.assertEqual(set(flushed_by), {'metrics-flush'})
+
+    @override_settings(METRICS_ENABLED=False)
+    def test_disabled_metrics_are_not_served(self):
+        GEOCODE_CACHE.inc(result='hit')
+
+        self.assertEqual(self._scrape().status_code, 404)
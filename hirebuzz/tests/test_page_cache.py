@@ -0,0 +1,116 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from accounts.models import UserProfile
+from hirebuzz.caching import viewer_role
+from jobs.models import Job
+from profiles.models import Profile
+
+
+User = get_user_model()
+
+
+class PageCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        UserProfile.objects.create(user=cls.recruiter, user_type='recruiter')
+        cls.seeker = User.objects.create_user('sam', 'sam@example.com', 'password123')
+        UserProfile.objects.create(user=cls.seeker, user_type='job_seeker')
+        cls.job = Job.objects.create(
+            title='Engineer', company='Acme', location='Remote', description='Build APIs', requirements='Python',
+            skills_required='Python, Django', recruiter=cls.recruiter,
+        )
+        cls.profile = Profile.objects.create(
+            user=cls.seeker, headline='Engineer', skills='Python, SQL', education='BS', work_experience='Acme',
+            phone='4045550123', show_phone=False,
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def test_anonymous_job_pages_are_served_from_the_cache_until_saved(self):
+        url = reverse('jobs:detail', args=[self.job.pk])
+        self.assertContains(self.client.get(url), 'Build APIs')
+
+        with self.assertNumQueries(1):
+            # Only the version lookup
+            self.assertContains(self.client.get(url), 'Build APIs')
+
+        self.job.description = 'Build services'
+        self.job.save()
+        response = self.client.get(url)
+        self.assertContains(response, 'Build services')
+        self.assertNotContains(response, 'Build APIs')
+
+    def test_signed_in_users_get_fresh_pages_with_cached_fragments(self):
+        self.client.force_login(self.recruiter)
+        url = reverse('jobs:detail', args=[self.job.pk])
+        self.client.get(url)
+        # Edits that skip save() keep the cached fragment until the next save
+        Job.objects.filter(pk=self.job.pk).update(description='Build services')
+
+        response = self.client.get(url)
+        self.assertContains(response, 'Build APIs')
+        self.assertContains(response, 'Find Candidates')
+
+        Job.objects.get(pk=self.job.pk).save()
+        self.assertContains(self.client.get(url), 'Build services')
+
+    def test_missing_or_inactive_jobs_are_not_cached(self):
+        self.job.status = 'closed'
+        self.job.save()
+
+        for _ in range(2):
+            self.assertEqual(self.client.get(reverse('jobs:detail', args=[self.job.pk])).status_code, 404)
+
+    def test_profile_fragments_follow_privacy_settings(self):
+        url = reverse('profiles:view', args=[self.seeker.pk])
+        self.assertNotContains(self.client.get(url), '4045550123')
+
+        self.profile.show_phone = True
+        self.profile.save()
+        self.assertContains(self.client.get(url), '4045550123')
+        self.client.force_login(self.recruiter)
+        self.assertContains(self.client.get(url), '4045550123')
+
+    def test_profile_pages_follow_account_name_changes(self):
+        url = reverse('profiles:view', args=[self.seeker.pk])
+        self.client.get(url)
+        # edit_user_info saves only the User
+        User.objects.filter(pk=self.seeker.pk).update(first_name='Samantha', last_name='Jones')
+
+        self.assertContains(self.client.get(url), 'Samantha Jones')
+
+    def test_unused_query_parameters_share_the_cached_page(self):
+        url = reverse('jobs:detail', args=[self.job.pk])
+        self.client.get(url, {'utm_source': 'mail'})
+
+        with self.assertNumQueries(1):
+            self.assertContains(self.client.get(url, {'utm_source': 'feed', 'x': '1'}), 'Build APIs')
+
+    def test_private_profiles_are_never_cached_for_anonymous_visitors(self):
+        url = reverse('profiles:view', args=[self.seeker.pk])
+        self.client.get(url)
+        Profile.objects.filter(pk=self.profile.pk).update(is_public=False)
+
+        response = self.client.get(url)
+
+        self.assertRedirects(response, reverse('profiles:index'))
+
+    @override_settings(PAGE_CACHE_SECONDS=0)
+    def test_page_cache_can_be_turned_off(self):
+        url = reverse('jobs:detail', args=[self.job.pk])
+        self.client.get(url)
+        Job.objects.filter(pk=self.job.pk).update(title='Staff Engineer')
+
+        self.assertContains(self.client.get(url), 'Staff Engineer')
+
+    def test_viewer_role(self):
+        self.assertEqual(viewer_role(AnonymousUser()), 'anonymous')
+        self.assertEqual(viewer_role(self.seeker, owner=self.seeker), 'owner')
+        self.assertEqual(viewer_role(self.recruiter, owner=self.seeker), 'recruiter')
+        self.assertEqual(viewer_role(User(username='staff', is_staff=True)), 'staff')
@@ -0,0 +1,86 @@
+import json
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from hirebuzz.instrumentation import finish_request_metrics, start_request_metrics
+from jobs.utils import geocode_location
+
+
+@override_settings(PERF_INSTRUMENTATION=True, PERF_SERVER_TIMING=True, PERF_LOG_MIN_MS=0)
+class PerformanceMiddlewareTests(TestCase):
+    def test_logs_request_breakdown_and_sets_server_timing(self):
+        with self.assertLogs('hirebuzz.performance', level='INFO') as logs:
+            response = self.client.get(reverse('jobs:index'))
+
+        payload = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(payload['url_name'], 'jobs:index')
+        self.assertEqual(payload['view'], 'jobs.views.index')
+        self.assertEqual(payload['status'], 200)
+        self.assertGreater(payload['db_queries'], 0)
+        self.assertGreater(payload['template_ms'], 0)
+        self.assertGreaterEqual(payload['total_ms'], payload['template_ms'])
+        self.assertEqual(logs.records[-1].performance, payload)
+        self.assertIn('db;dur=', response['Server-Timing'])
+        self.assertIn('total;dur=', response['Server-Timing'])
+
+    async def test_async_requests_are_measured(self):
+        with self.assertLogs('hirebuzz.performance', level='INFO') as logs:
+            response = await self.async_client.get(reverse('jobs:index'))
+
+        payload = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(payload['url_name'], 'jobs:index')
+        # Queries run by sync_to_async in a worker thread still count
+        self.assertGreater(payload['db_queries'], 0)
+        self.assertIn('db;dur=', response['Server-Timing'])
+
+    @override_settings(PERF_SERVER_TIMING=False, PERF_LOG_MIN_MS=60000)
+    def test_fast_requests_below_threshold_are_not_logged(self):
+        with self.assertNoLogs('hirebuzz.performance', level='INFO'):
+            response = self.client.get(reverse('jobs:index'))
+
+        self.assertNotIn('Server-Timing', response)
+
+    @override_settings(PERF_INSTRUMENTATION=False)
+    def test_disabled_middleware_adds_nothing(self):
+        with self.assertNoLogs('hirebuzz.performance', level='INFO'):
+            response = self.client.get(reverse('jobs:index'))
+
+        self.assertNotIn('Server-Timing', response)
+
+
+class InstrumentationHookTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.metrics, self.token = start_request_metrics()
+
+    def tearDown(self):
+        finish_request_metrics(self.token)
+
+    def test_cache_hits_and_misses_are_counted(self):
+        cache.get('missing')
+        cache.set('present', 1)
+        cache.get('present')
+        cache.get_many(['present', 'absent'])
+
+        self.assertEqual(self.metrics.cache_hits, 2)
+        self.assertEqual(self.metrics.cache_misses, 2)
+
+    def test_cached_falsy_values_count_as_hits(self):
+        cache.set('zero', 0)
+
+        self.assertEqual(cache.get('zero', 'default'), 0)
+        self.assertEqual(cache.get('nothing', 'default'), 'default')
+        self.assertEqual((self.metrics.cache_hits, self.metrics.cache_misses), (1, 1))
+
+    @override_settings(GEOCODER=settings.GEOCODER_PRESETS['nominatim'])
+    @mock.patch('jobs.geocoders.requests.get')
+    def test_geocoder_calls_are_counted_as_outbound_http(self, get):
+        get.return_value.json.return_value = [{'lat': '33.749', 'lon': '-84.388'}]
+
+        self.assertEqual(geocode_location('Atlanta, GA'), (33.749, -84.388))
+        self.assertEqual(self.metrics.http_calls, 1)
+        self.assertEqual(self.metrics.db_queries, 0)
@@ -0,0 +1,118 @@
+import shutil
+import tempfile
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from hirebuzz.profiling import PROFILE_FLAG, list_profiles, make_profile_token, token_is_valid
+
+
+User = get_user_model()
+
+
+class ProfilingTestCase(TestCase):
+    def setUp(self):
+        self.profile_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.profile_dir, ignore_errors=True)
+        settings_override = override_settings(
+            PROFILING_ENABLED=True, PROFILING_SAMPLE_RATE=0.0, PROFILING_DIR=self.profile_dir
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.staff = User.objects.create_user(username='ops', password='pass123', is_staff=True)
+        self.seeker = User.objects.create_user(username='seeker', password='pass123')
+
+
+class ProfilingMiddlewareTests(ProfilingTestCase):
+    def test_staff_with_signed_flag_is_profiled(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(reverse('jobs:index'), {PROFILE_FLAG: make_profile_token(self.staff)})
+
+        self.assertEqual(response.status_code, 200)
+        [capture] = list_profiles()
+        self.assertEqual(capture['url_name'], 'jobs:index')
+        self.assertEqual(capture['trigger'], 'staff')
+        self.assertEqual(capture['user'], 'ops')
+        self.assertGreater(capture['total_ms'], 0)
+        self.assertIn('jobs-index', capture['name'])
+        self.assertTrue((self.profile_dir / f"{capture['name']}.prof").exists())
+
+    async def test_async_requests_are_profiled(self):
+        await self.async_client.aforce_login(self.staff)
+        response = await self.async_client.get(reverse('jobs:index'), {PROFILE_FLAG: make_profile_token(self.staff)})
+
+        self.assertEqual(response.status_code, 200)
+        [capture] = list_profiles()
+        self.assertEqual(capture['trigger'], 'staff')
+        self.assertEqual(capture['user'], 'ops')
+
+    def test_flag_is_ignored_for_non_staff_and_forged_tokens(self):
+        self.client.force_login(self.seeker)
+        self.client.get(reverse('jobs:index'), {PROFILE_FLAG: make_profile_token(self.seeker)})
+        self.client.force_login(self.staff)
+        self.client.get(reverse('jobs:index'), {PROFILE_FLAG: f'{self.staff.pk}:forged:signature'})
+
+        self.assertEqual(list_profiles(), [])
+
+    def test_sampled_requests_are_profiled(self):
+        with override_settings(PROFILING_SAMPLE_RATE=1.0):
+            self.client.get(reverse('jobs:index'))
+
+        [capture] = list_profiles()
+        self.assertEqual(capture['trigger'], 'sampled')
+        self.assertIsNone(capture['user'])
+
+    def test_old_captures_are_pruned(self):
+        with override_settings(PROFILING_SAMPLE_RATE=1.0, PROFILING_MAX_FILES=2):
+            for _ in range(3):
+                self.client.get(reverse('jobs:index'))
+
+        self.assertEqual(len(list_profiles()), 2)
+        self.assertEqual(len(list(self.profile_dir.glob('*.prof'))), 2)
+
+
+class ProfileAdminPageTests(ProfilingTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.staff)
+        self.client.get(reverse('jobs:index'), {PROFILE_FLAG: make_profile_token(self.staff)})
+        [self.capture] = list_profiles()
+
+    def test_list_detail_and_download(self):
+        response = self.client.get(reverse('profile_list'))
+        self.assertContains(response, 'jobs:index')
+        self.assertContains(response, reverse('profile_detail', args=[self.capture['name']]))
+
+        response = self.client.get(reverse('profile_detail', args=[self.capture['name']]), {'sort': 'tottime'})
+        self.assertContains(response, 'function calls')
+
+        response = self.client.get(reverse('profile_download', args=[self.capture['name']]))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('attachment', response['Content-Disposition'])
+
+    def test_path_form_redirects_with_signed_flag(self):
+        response = self.client.get(reverse('profile_list'), {'path': '/jobs/?search=python'})
+
+        target = urlparse(response['Location'])
+        self.assertEqual(target.path, '/jobs/')
+        query = parse_qs(target.query)
+        self.assertEqual(query['search'], ['python'])
+        self.assertTrue(token_is_valid(query[PROFILE_FLAG][0], self.staff))
+
+    def test_path_form_never_sends_the_token_off_site(self):
+        for path in ('//evil.com/', '/\\evil.com/', 'https://evil.com/', '/\t/evil.com/'):
+            with self.subTest(path=path):
+                response = self.client.get(reverse('profile_list'), {'path': path})
+
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn(PROFILE_FLAG, response.content.decode())
+
+    def test_unknown_capture_is_404_and_non_staff_are_redirected(self):
+        self.assertEqual(self.client.get(reverse('profile_detail', args=['missing'])).status_code, 404)
+
+        self.client.force_login(self.seeker)
+        response = self.client.get(reverse('profile_list'))
+        self.assertEqual(response.status_code, 302)
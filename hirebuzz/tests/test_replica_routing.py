@@ -0,0 +1,175 @@
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+
+import django
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, connections, router
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from hirebuzz.db import database_settings
+from hirebuzz.routers import PIN_COOKIE, routing_scope
+from jobs.models import Job
+
+
+User = get_user_model()
+
+
+class DatabaseSettingsTests(SimpleTestCase):
+    def test_sqlite_default_with_file_replicas(self):
+        databases, replicas = database_settings({'HIREBUZZ_DB_REPLICAS': '/tmp/a.sqlite3, /tmp/b.sqlite3'}, Path('/app'))
+
+        self.assertEqual(databases['default']['NAME'], '/app/db.sqlite3')
+        self.assertEqual(replicas, ['replica_1', 'replica_2'])
+        self.assertEqual(databases['replica_2']['NAME'], '/tmp/b.sqlite3')
+        self.assertEqual(databases['replica_1']['TEST'], {'MIRROR': 'default'})
+
+    def test_postgresql_primary_and_replica_hosts(self):
+        databases, replicas = database_settings({
+            'HIREBUZZ_DB_ENGINE': 'postgresql', 'HIREBUZZ_DB_NAME': 'hirebuzz', 'HIREBUZZ_DB_USER': 'app',
+            'HIREBUZZ_DB_HOST': 'db-primary', 'HIREBUZZ_DB_PORT': '5432',
+            'HIREBUZZ_DB_REPLICAS': 'db-replica-1,db-replica-2:6432',
+        }, Path('/app'))
+
+        self.assertEqual(databases['default']['ENGINE'], 'django.db.backends.postgresql')
+        self.assertEqual(databases['default']['HOST'], 'db-primary')
+        self.assertEqual((databases['replica_1']['HOST'], databases['replica_1']['PORT']), ('db-replica-1', '5432'))
+        self.assertEqual((databases['replica_2']['HOST'], databases['replica_2']['PORT']), ('db-replica-2', '6432'))
+        self.assertEqual(databases['replica_2']['USER'], 'app')
+
+    def test_persistent_connections_with_health_checks(self):
+        databases, _ = database_settings({'HIREBUZZ_DB_CONN_MAX_AGE': '300'}, Path('/app'))
+
+        self.assertEqual(databases['default']['CONN_MAX_AGE'], 300)
+        self.assertTrue(databases['default']['CONN_HEALTH_CHECKS'])
+
+    def test_asgi_workers_close_connections_by_default(self):
+        databases, _ = database_settings({'HIREBUZZ_ASGI': '1'}, Path('/app'))
+        self.assertEqual(databases['default']['CONN_MAX_AGE'], 0)
+
+        databases, _ = database_settings({'HIREBUZZ_ASGI': '1', 'HIREBUZZ_DB_CONN_MAX_AGE': '30'}, Path('/app'))
+        self.assertEqual(databases['default']['CONN_MAX_AGE'], 30)
+        self.assertEqual(database_settings({}, Path('/app'))[0]['default']['CONN_MAX_AGE'], 60)
+
+    def test_pgbouncer_disables_server_side_cursors_and_prepared_statements(self):
+        databases, _ = database_settings({
+            'HIREBUZZ_DB_ENGINE': 'postgresql', 'HIREBUZZ_DB_PGBOUNCER': '1', 'HIREBUZZ_DB_REPLICAS': 'replica',
+        }, Path('/app'))
+
+        for alias in ('default', 'replica_1'):
+            self.assertTrue(databases[alias]['DISABLE_SERVER_SIDE_CURSORS'])
+            self.assertIsNone(databases[alias]['OPTIONS']['prepare_threshold'])
+
+    def test_pool_requires_django_5_1(self):
+        environ = {'HIREBUZZ_DB_ENGINE': 'postgresql', 'HIREBUZZ_DB_POOL': '1'}
+        if django.VERSION < (5, 1):
+            with self.assertRaises(ImproperlyConfigured):
+                database_settings(environ, Path('/app'))
+        else:
+            databases, _ = database_settings(environ, Path('/app'))
+            self.assertEqual(databases['default']['CONN_MAX_AGE'], 0)
+            self.assertIn('pool', databases['default']['OPTIONS'])
+
+    def test_unknown_engine_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            database_settings({'HIREBUZZ_DB_ENGINE': 'oracle'}, Path('/app'))
+
+
+@override_settings(DATABASE_REPLICAS=['replica_1'])
+class RouterTests(SimpleTestCase):
+    def test_reads_use_primary_outside_replica_views(self):
+        self.assertEqual(router.db_for_read(Job), 'default')
+        with routing_scope() as state:
+            self.assertEqual(router.db_for_read(Job), 'default')
+            state.use_replica = True
+            self.assertEqual(router.db_for_read(Job), 'replica_1')
+            self.assertEqual(router.db_for_read(User), 'default')
+
+    def test_write_pins_later_reads_to_primary(self):
+        with routing_scope() as state:
+            state.use_replica = True
+            self.assertEqual(router.db_for_write(Job), 'default')
+            self.assertEqual(router.db_for_read(Job), 'default')
+            self.assertTrue(state.wrote)
+
+    def test_only_primary_is_migrated(self):
+        self.assertTrue(router.allow_migrate('default', 'jobs'))
+        self.assertFalse(router.allow_migrate('replica_1', 'jobs'))
+
+
+@override_settings(DATABASE_REPLICAS=['replica_1'], REPLICA_PIN_SECONDS=10)
+class ReplicaRoutingMiddlewareTests(TestCase):
+    """Run the read-only views against a second SQLite file standing in for a lagging replica."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Copy the migrated schema before TestCase opens its transaction, which would block the backup
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.template = Path(cls.tmp.name) / 'template.sqlite3'
+        connection.ensure_connection()
+        target = sqlite3.connect(cls.template)
+        connection.connection.backup(target)
+        target.close()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.tmp.cleanup()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user(username='recruiter', password='pass123')
+
+    def setUp(self):
+        replica_path = Path(self.tmp.name) / 'replica.sqlite3'
+        shutil.copyfile(self.template, replica_path)
+        connections['replica_1'] = DatabaseWrapper(
+            {**connection.settings_dict, 'NAME': str(replica_path)}, alias='replica_1'
+        )
+        self.addCleanup(self.remove_replica)
+        # Replicated rows, plus a posting only the replica has, so responses show which database they came from
+        User(pk=self.recruiter.pk, username='recruiter').save(using='replica_1')
+        Job.objects.using('replica_1').create(
+            title='Replica Posting', company='Acme', location='Remote', description='d', requirements='r',
+            recruiter_id=self.recruiter.pk,
+        )
+
+    def remove_replica(self):
+        connections['replica_1'].close()
+        del connections['replica_1']
+
+    def test_read_only_views_read_from_the_replica(self):
+        response = self.client.get(reverse('jobs:index'))
+
+        self.assertContains(response, 'Replica Posting')
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_users_read_their_own_writes_from_the_primary(self):
+        self.client.force_login(self.recruiter)
+        response = self.client.post(reverse('jobs:post_job'), {
+            'title': 'Fresh Posting', 'company': 'Acme', 'location': 'Remote', 'employment_type': 'full_time',
+            'experience_level': 'entry', 'work_type': 'remote', 'description': 'd', 'requirements': 'r',
+            'status': 'active',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.cookies[PIN_COOKIE]['max-age'], 10)
+
+        response = self.client.get(reverse('jobs:index'))
+        self.assertContains(response, 'Fresh Posting')
+        self.assertNotContains(response, 'Replica Posting')
+
+        # Once the pin expires, reads go back to the (still lagging) replica
+        del self.client.cookies[PIN_COOKIE]
+        response = self.client.get(reverse('jobs:index'))
+        self.assertContains(response, 'Replica Posting')
+        self.assertNotContains(response, 'Fresh Posting')
+
+    async def test_async_views_are_routed_under_asgi(self):
+        response = await self.async_client.get(reverse('jobs:index'))
+
+        self.assertContains(response, 'Replica Posting')
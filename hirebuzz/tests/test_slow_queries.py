@@ -0,0 +1,94 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from hirebuzz.slow_queries import install_slow_query_log, log_slow_queries, parse_log_lines, summarize
+
+
+@override_settings(SLOW_QUERY_MS=0, SLOW_QUERY_EXPLAIN=True)
+class SlowQueryLogTests(TestCase):
+    def get_logged(self, url, params=None):
+        with self.assertLogs('hirebuzz.slow_queries', level='WARNING') as logs:
+            with connection.execute_wrapper(log_slow_queries):
+                self.client.get(url, params)
+        return list(parse_log_lines(logs.output))
+
+    def test_logs_view_location_and_query_plan(self):
+        entries = self.get_logged(reverse('profiles:index'), {'skills': 'python'})
+
+        search = [entry for entry in entries if 'LIKE' in entry['sql'] and 'profiles_profile' in entry['sql']]
+        self.assertTrue(search)
+        self.assertEqual(search[0]['view'], 'profiles.views.index')
+        self.assertTrue(search[0]['location'].startswith('profiles/views.py:'))
+        self.assertTrue(any(step.startswith('SCAN') for step in search[0]['plan']))
+
+    def test_async_views_are_named_by_the_middleware(self):
+        entries = self.get_logged(reverse('jobs:index'), {'search': 'python'})
+
+        search = [entry for entry in entries if 'LIKE' in entry['sql'] and 'jobs_job' in entry['sql']]
+        self.assertTrue(search)
+        self.assertEqual(search[0]['view'], 'jobs.views.index')
+        self.assertTrue(any(step.startswith('SCAN') for step in search[0]['plan']))
+
+    @override_settings(SLOW_QUERY_MS=60000)
+    def test_fast_queries_are_not_logged(self):
+        with self.assertNoLogs('hirebuzz.slow_queries', level='WARNING'):
+            with connection.execute_wrapper(log_slow_queries):
+                self.client.get(reverse('jobs:index'))
+
+    def test_connection_created_installs_wrapper_once(self):
+        self.addCleanup(lambda: log_slow_queries in connection.execute_wrappers
+                        and connection.execute_wrappers.remove(log_slow_queries))
+        install_slow_query_log(sender=None, connection=connection)
+        install_slow_query_log(sender=None, connection=connection)
+
+        self.assertEqual(connection.execute_wrappers.count(log_slow_queries), 1)
+
+    @override_settings(SLOW_QUERY_MS=None)
+    def test_disabled_log_installs_nothing(self):
+        install_slow_query_log(sender=None, connection=connection)
+
+        self.assertNotIn(log_slow_queries, connection.execute_wrappers)
+
+
+class SlowQueryReportTests(TestCase):
+    entries = [
+        {'ms': 40.0, 'view': 'jobs.views.index', 'location': 'jobs/views.py:70 in index',
+         'sql': "SELECT * FROM jobs_job WHERE title LIKE '%a%'", 'plan': ['SCAN jobs_job']},
+        {'ms': 60.0, 'view': 'jobs.views.index', 'location': 'jobs/views.py:70 in index',
+         'sql': "SELECT * FROM jobs_job WHERE title LIKE '%b%'", 'plan': ['SCAN jobs_job']},
+        {'ms': 70.0, 'view': 'profiles.views.index', 'location': 'profiles/views.py:60 in index',
+         'sql': 'SELECT * FROM profiles_profile WHERE id = 3',
+         'plan': ['SEARCH profiles_profile USING INTEGER PRIMARY KEY (rowid=?)']},
+    ]
+
+    def test_summarize_groups_normalized_statements(self):
+        groups = summarize(self.entries)
+
+        self.assertEqual(len(groups), 2)
+        self.assertEqual(groups[0]['count'], 2)
+        self.assertEqual(groups[0]['total_ms'], 100.0)
+        self.assertEqual(groups[0]['max_ms'], 60.0)
+        self.assertTrue(groups[0]['full_scan'])
+        self.assertFalse(groups[1]['full_scan'])
+
+    def test_command_reports_top_entries_from_log_files(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.log', delete=False) as log:
+            log.write('unrelated line\n')
+            for entry in self.entries:
+                log.write(f'WARNING hirebuzz.slow_queries SLOW_QUERY {json.dumps(entry)}\n')
+
+        out = StringIO()
+        call_command('slow_query_report', log.name, '--top', '1', '--full-scans', stdout=out)
+        output = out.getvalue()
+
+        self.assertIn('3 slow queries, showing top 1', output)
+        self.assertIn('2x  total 100.0 ms', output)
+        self.assertIn('FULL SCAN', output)
+        self.assertIn('jobs.views.index', output)
+        self.assertNotIn('profiles_profile', output)
@@ -0,0 +1,101 @@
+import importlib
+import os
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.template import engines
+from django.test import SimpleTestCase, override_settings
+
+from hirebuzz.template_warmup import template_names, warm_templates, warm_templates_on_start
+
+
+def _cached_templates(**options):
+    base = settings.TEMPLATES[0]
+    return [{
+        **base, 'APP_DIRS': False,
+        'OPTIONS': {
+            **base['OPTIONS'],
+            'loaders': [('django.template.loaders.cached.Loader', [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ])],
+            **options,
+        },
+    }]
+
+
+def _engine():
+    return engines.all()[0].engine
+
+
+@override_settings(TEMPLATES=_cached_templates())
+class TemplateWarmupTests(SimpleTestCase):
+    def test_lists_project_and_app_templates(self):
+        names = template_names(_engine())
+
+        for name in ('base.html', 'jobs/index.html', 'jobs/map.html', 'admin/base.html'):
+            self.assertIn(name, names)
+
+    def test_fills_the_cached_loader(self):
+        compiled, errors = warm_templates()
+
+        self.assertEqual(errors, {})
+        loader = _engine().template_loaders[0]
+        self.assertEqual(compiled, len(template_names(_engine())))
+        self.assertIn('jobs/index.html', loader.get_template_cache)
+
+    def test_worker_start_only_warms_when_enabled(self):
+        loader = _engine().template_loaders[0]
+        loader.reset()
+        with override_settings(TEMPLATE_WARMUP=False):
+            warm_templates_on_start()
+        self.assertEqual(loader.get_template_cache, {})
+
+        with override_settings(TEMPLATE_WARMUP=True), self.assertLogs('hirebuzz.template_warmup', 'INFO'):
+            warm_templates_on_start()
+        self.assertNotEqual(loader.get_template_cache, {})
+
+    def test_command_reports_templates_that_do_not_compile(self):
+        out = StringIO()
+        call_command('warm_templates', stdout=out)
+        self.assertIn('Compiled', out.getvalue())
+
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, 'broken.html').write_text('{% if %}')
+            templates = _cached_templates()
+            templates[0]['DIRS'] = [directory]
+            with override_settings(TEMPLATES=templates):
+                err = StringIO()
+                with self.assertRaisesMessage(CommandError, '1 template(s) failed to compile'):
+                    call_command('warm_templates', stdout=StringIO(), stderr=err)
+        self.assertIn('broken.html', err.getvalue())
+
+
+class ProductionSettingsTests(SimpleTestCase):
+    def _import_production_settings(self):
+        sys.modules.pop('hirebuzz.settings_production', None)
+        self.addCleanup(sys.modules.pop, 'hirebuzz.settings_production', None)
+        return importlib.import_module('hirebuzz.settings_production')
+
+    def test_production_profile_requires_a_secret_key(self):
+        with mock.patch.dict(os.environ, {'HIREBUZZ_SECRET_KEY': ''}), \
+                self.assertRaisesMessage(ImproperlyConfigured, 'HIREBUZZ_SECRET_KEY'):
+            self._import_production_settings()
+
+    def test_production_profile_uses_the_cached_loader_and_warms_it(self):
+        with mock.patch.dict(os.environ, {'HIREBUZZ_SECRET_KEY': 'not-the-development-key'}):
+            production = self._import_production_settings()
+        self.assertEqual(production.SECRET_KEY, 'not-the-development-key')
+
+        self.assertFalse(production.DEBUG)
+        self.assertTrue(production.TEMPLATE_WARMUP)
+        config = production.TEMPLATES[0]
+        self.assertFalse(config['APP_DIRS'])
+        self.assertEqual(config['OPTIONS']['loaders'][0][0], 'django.template.loaders.cached.Loader')
+        self.assertEqual(config['OPTIONS']['context_processors'], settings.TEMPLATES[0]['OPTIONS']['context_processors'])
@@ -19,7 +19,12 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from . import views
+
 urlpatterns = [
+    path('admin/profiling/', views.profile_list, name='profile_list'),
+    path('admin/profiling/<str:name>/', views.profile_detail, name='profile_detail'),
+    path('admin/profiling/<str:name>/download/', views.profile_download, name='profile_download'),
     path('admin/', admin.site.urls),
     path('', include('home.urls')),
     path('profiles/', include('profiles.urls')),
@@ -27,6 +32,8 @@ urlpatterns = [
     path('applications/', include('applications.urls')),
     path('communications/', include('communications.urls')),
     path('accounts/', include('accounts.urls')),
+    path('exports/', include('exports.urls')),
+    path('metrics', views.metrics, name='metrics'),
 ]
 
 # Serve media files during development
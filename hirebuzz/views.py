@@ -0,0 +1,86 @@
+import hmac
+import json
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib import admin
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseForbidden, HttpResponseNotFound
+from django.shortcuts import redirect, render
+from django.utils.http import url_has_allowed_host_and_scheme
+
+from .metrics import registry
+from .profiling import PROFILE_FLAG, SORT_KEYS, list_profiles, make_profile_token, profile_path, render_stats
+
+
+def metrics(request):
+    """
+    Serve Prometheus metrics in the text exposition format.
+
+    Scrapers authenticate with ``Authorization: Bearer <METRICS_TOKEN>``. When
+    no token is configured, only staff users are served; client addresses are
+    not trusted, since behind a reverse proxy every request looks local.
+    """
+    if not getattr(settings, 'METRICS_ENABLED', False):
+        return HttpResponseNotFound('Metrics are disabled.')
+
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    if token:
+        supplied = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+        allowed = hmac.compare_digest(supplied, token)
+    else:
+        allowed = request.user.is_staff
+    if not allowed:
+        return HttpResponseForbidden('Not allowed to read metrics.')
+
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+@staff_member_required
+def profile_list(request):
+    """List the captured request profiles and hand out a signed profiling link."""
+    target = request.GET.get('path', '').strip()
+    # Only same-site paths get the token; '//host' and '/\host' point browsers elsewhere
+    if target.startswith('/') and url_has_allowed_host_and_scheme(
+        target, allowed_hosts={request.get_host()}, require_https=request.is_secure()
+    ):
+        separator = '&' if '?' in target else '?'
+        return redirect(f'{target}{separator}{urlencode({PROFILE_FLAG: make_profile_token(request.user)})}')
+
+    return render(request, 'admin/profiling/list.html', {
+        **admin.site.each_context(request),
+        'title': 'Request profiles',
+        'profiles': list_profiles(),
+        'profiling_enabled': getattr(settings, 'PROFILING_ENABLED', False),
+        'sample_rate': getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0),
+    })
+
+
+@staff_member_required
+def profile_detail(request, name):
+    """Show the hottest functions of one capture."""
+    sort = request.GET.get('sort', 'cumulative')
+    try:
+        meta = json.loads(profile_path(name, '.json').read_text())
+        stats = render_stats(name, sort=sort)
+    except (OSError, ValueError):
+        raise Http404('Profile not found.')
+
+    return render(request, 'admin/profiling/detail.html', {
+        **admin.site.each_context(request),
+        'title': f"Profile of {meta.get('url_name') or meta.get('path')}",
+        'profile': meta,
+        'stats': stats,
+        'sort': sort,
+        'sort_keys': SORT_KEYS,
+    })
+
+
+@staff_member_required
+def profile_download(request, name):
+    """Download the raw ``.prof`` file for snakeviz or ``pstats``."""
+    try:
+        handle = profile_path(name).open('rb')
+    except OSError:
+        raise Http404('Profile not found.')
+    return FileResponse(handle, as_attachment=True, filename=f'{name}.prof')
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hirebuzz.settings')
 
 application = get_wsgi_application()
+
+# Imported once the app registry is ready
+from hirebuzz.template_warmup import warm_templates_on_start  # noqa: E402
+
+warm_templates_on_start()
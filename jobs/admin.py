@@ -1,8 +1,41 @@
-from django.contrib import admin
-from django.http import HttpResponse
-from django.utils import timezone
-import csv
-from .models import Job
+from django.conf import settings
+from django.contrib import admin, messages
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
+
+from exports.admin import queue_export, queue_export_action
+from exports.utils import streaming_csv_response
+from .forms import JobImportForm
+from .geocode_queue import enqueue_geocoding
+from .importers import detect_feed_format, import_jobs, iter_feed_records
+from .models import GeocodeRequest, Job
+
+
+JOB_EXPORT_HEADER = [
+    'Title', 'Company', 'Location', 'Employment Type', 'Experience Level',
+    'Work Type', 'Status', 'Recruiter', 'Salary Min', 'Salary Max',
+    'Visa Sponsorship', 'Application Deadline', 'Created At', 'Updated At'
+]
+
+
+def job_export_row(job):
+    return [
+        job.title,
+        job.company,
+        job.location,
+        job.employment_type,
+        job.experience_level,
+        job.work_type,
+        job.status,
+        job.recruiter.username if job.recruiter else 'N/A',
+        job.salary_min,
+        job.salary_max,
+        job.visa_sponsorship,
+        job.application_deadline.strftime('%Y-%m-%d') if job.application_deadline else 'N/A',
+        job.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+        job.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+    ]
 
 
 @admin.register(Job)
@@ -12,6 +45,7 @@ class JobAdmin(admin.ModelAdmin):
     search_fields = ('title', 'company', 'location', 'description', 'requirements', 'recruiter__username')
     readonly_fields = ('created_at', 'updated_at')
     date_hierarchy = 'created_at'
+    change_list_template = 'admin/jobs/job/change_list.html'
     
     fieldsets = (
         ('Basic Information', {
@@ -37,7 +71,11 @@ class JobAdmin(admin.ModelAdmin):
         })
     )
     
-    actions = ['activate_jobs', 'pause_jobs', 'close_jobs', 'export_jobs_csv']
+    actions = [
+        'activate_jobs', 'pause_jobs', 'close_jobs', 'export_jobs_csv',
+        queue_export_action('jobs', 'csv', 'Queue background CSV export of selected jobs'),
+        queue_export_action('jobs', 'jsonl', 'Queue background JSON Lines export of selected jobs'),
+    ]
     
     @admin.action(description='Activate selected jobs')
     def activate_jobs(self, request, queryset):
@@ -56,35 +94,74 @@ class JobAdmin(admin.ModelAdmin):
     
     @admin.action(description='Export selected jobs to CSV')
     def export_jobs_csv(self, request, queryset):
-        """Export selected jobs to CSV file."""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="jobs_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow([
-            'Title', 'Company', 'Location', 'Employment Type', 'Experience Level', 
-            'Work Type', 'Status', 'Recruiter', 'Salary Min', 'Salary Max', 
-            'Visa Sponsorship', 'Application Deadline', 'Created At', 'Updated At'
-        ])
-        
-        for job in queryset:
-            writer.writerow([
-                job.title,
-                job.company,
-                job.location,
-                job.employment_type,
-                job.experience_level,
-                job.work_type,
-                job.status,
-                job.recruiter.username if job.recruiter else 'N/A',
-                job.salary_min,
-                job.salary_max,
-                job.visa_sponsorship,
-                job.application_deadline.strftime('%Y-%m-%d') if job.application_deadline else 'N/A',
-                job.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                job.updated_at.strftime('%Y-%m-%d %H:%M:%S')
-            ])
-        
-        return response
+        """Stream selected jobs to a CSV file, or queue a background export for large selections."""
+        if queryset.count() > settings.EXPORT_INLINE_MAX_ROWS:
+            return queue_export(self, request, queryset, 'jobs', 'csv')
+        return streaming_csv_response(
+            queryset, 'jobs_export', JOB_EXPORT_HEADER, job_export_row, select_related=('recruiter',)
+        )
+
+    def get_urls(self):
+        urls = super().get_urls()
+        custom_urls = [
+            path('import/', self.admin_site.admin_view(self.import_jobs_view), name='jobs_job_import'),
+        ]
+        return custom_urls + urls
+
+    def import_jobs_view(self, request):
+        """Upload a job feed and upsert it in batches."""
+        if not self.has_add_permission(request):
+            return redirect('admin:jobs_job_changelist')
+
+        if request.method == 'POST':
+            form = JobImportForm(request.POST, request.FILES)
+            if form.is_valid():
+                feed = form.cleaned_data['feed']
+                try:
+                    stats = import_jobs(
+                        iter_feed_records(feed.file, detect_feed_format(feed.name)),
+                        recruiter=form.cleaned_data['recruiter'] or request.user,
+                    )
+                except ValueError as e:
+                    # Batches before the bad row are already saved
+                    form.add_error('feed', f'Could not read feed: {e}. Rows before the error were imported.')
+                else:
+                    self.message_user(
+                        request,
+                        f"Created {stats['created']}, updated {stats['updated']}, "
+                        f"skipped {stats['invalid']} invalid row(s). "
+                        f"{len(stats['needs_geocoding'])} posting(s) are waiting for geocoding."
+                    )
+                    for error in stats['errors'][:10]:
+                        self.message_user(request, f"Row {error['row']}: {error['errors']}", messages.WARNING)
+                    return redirect('admin:jobs_job_changelist')
+        else:
+            form = JobImportForm()
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'form': form,
+            'title': 'Import jobs',
+        }
+        return TemplateResponse(request, 'admin/jobs/job/import_jobs.html', context)
+
+
+@admin.register(GeocodeRequest)
+class GeocodeRequestAdmin(admin.ModelAdmin):
+    list_display = ('id', 'target', 'object_id', 'location', 'status', 'attempts', 'created_at', 'updated_at')
+    list_filter = ('status', 'target')
+    search_fields = ('location',)
+    readonly_fields = ('target', 'object_id', 'location', 'status', 'batch', 'attempts', 'error', 'created_at', 'updated_at')
+    actions = ['requeue_requests']
 
+    def has_add_permission(self, request):
+        return False
 
+    @admin.action(description='Re-queue selected geocode requests')
+    def requeue_requests(self, request, queryset):
+        requests = list(queryset.exclude(status=GeocodeRequest.Status.PENDING))
+        for target in GeocodeRequest.Target.values:
+            enqueue_geocoding(target, {req.object_id: req.location for req in requests if req.target == target})
+        GeocodeRequest.objects.filter(pk__in=[req.pk for req in requests]).delete()
+        self.message_user(request, f"Re-queued {len(requests)} geocode request(s).")
@@ -1,4 +1,5 @@
 from django import forms
+from django.contrib.auth.models import User
 from .models import Job
 
 
@@ -237,4 +238,17 @@ class JobSearchForm(forms.Form):
                 "Minimum salary cannot be greater than maximum salary."
             )
 
-        return cleaned_data
\ No newline at end of file
+        return cleaned_data
+
+
+class JobImportForm(forms.Form):
+    """Admin form for uploading a CSV or JSON Lines job feed."""
+
+    feed = forms.FileField(
+        help_text="CSV with a header row or JSON Lines; columns match Job field names plus optional external_id and recruiter"
+    )
+    recruiter = forms.ModelChoiceField(
+        queryset=User.objects.filter(user_profile__user_type='recruiter').order_by('username'),
+        required=False,
+        help_text="Owner for new postings without a recruiter column (defaults to you)"
+    )
@@ -0,0 +1,151 @@
+"""
+Offline geocoding of common US locations.
+
+``data/us_places.csv`` lists the US states (plus Washington DC) with their
+centroids and the larger cities and tech hubs with their coordinates.
+It is loaded once per process into flat ``array('d')`` columns, with a
+dict from normalized name to row. A lookup is a string cleanup and one dict
+probe, and repeated strings are served from an LRU cache.
+
+Accepted spellings include "Atlanta, GA", "atlanta georgia", "Atlanta, GA
+30303, USA", "St. Louis, MO", "Washington, D.C.", a bare state name or
+abbreviation, and a bare city name (the largest city of that name wins).
+A bare "New York" is the city. Other bare names shared by a state and a
+city, like "Washington", are misses and left to the remote geocoder.
+"""
+import csv
+import re
+from array import array
+from functools import lru_cache
+from pathlib import Path
+
+
+DATA_FILE = Path(__file__).resolve().parent / 'data' / 'us_places.csv'
+
+# Whole-string aliases, applied after cleanup
+ALIASES = {
+    'nyc': 'new york ny',
+    'district of columbia': 'washington dc',
+}
+
+# Bare names shared by a state and a listed city that mean the city; the rest are misses
+BARE_CITY_NAMES = {'new york'}
+
+# Abbreviations expanded when they start a city name ("St. Louis" -> "saint louis")
+CITY_PREFIXES = {'st': 'saint', 'ft': 'fort', 'mt': 'mount'}
+
+COUNTRY_SUFFIXES = ('united states of america', 'united states', 'usa', 'us')
+
+_PUNCTUATION = re.compile(r"[,;:()/]|\s-\s")
+_ZIP_CODE = re.compile(r'\b\d{5}(?:-\d{4})?\b')
+
+
+def clean_location(location_string):
+    """Lower-case a location and strip punctuation, ZIP codes and a trailing country."""
+    text = _ZIP_CODE.sub(' ', location_string.casefold().replace('.', '').replace("'", ''))
+    text = ' '.join(_PUNCTUATION.sub(' ', text).split())
+    for suffix in COUNTRY_SUFFIXES:
+        if text.endswith(' ' + suffix):
+            text = text[:-len(suffix) - 1]
+            break
+    return ALIASES.get(text, text)
+
+
+def _city_key(words):
+    if words and words[0] in CITY_PREFIXES:
+        words = [CITY_PREFIXES[words[0]], *words[1:]]
+    return ' '.join(words)
+
+
+class Gazetteer:
+    """Array-backed lookup of place names to coordinates."""
+
+    def __init__(self, rows):
+        self.labels = []
+        self.kinds = []
+        self.menu = []
+        self.latitudes = array('d')
+        self.longitudes = array('d')
+        self._states = {}
+        self._index = {}
+        for kind, name, state, latitude, longitude, menu in rows:
+            row = len(self.labels)
+            self.kinds.append(kind)
+            self.menu.append(menu == '1')
+            self.latitudes.append(float(latitude))
+            self.longitudes.append(float(longitude))
+            if kind == 'state':
+                self.labels.append(name)
+                self._states[clean_location(name)] = state
+                self._states[state.casefold()] = state
+                self._index[('', state)] = row
+            else:
+                self.labels.append(f'{name}, {state}')
+                city = _city_key(clean_location(name).split())
+                self._index.setdefault((city, state), row)
+                # A bare city name resolves to the first (largest) city listed with it
+                self._index.setdefault((city, None), row)
+        self.lookup = lru_cache(maxsize=4096)(self._lookup)
+
+    @classmethod
+    def from_csv(cls, path):
+        with open(path, newline='', encoding='utf-8') as data:
+            reader = csv.reader(data)
+            next(reader)
+            return cls(list(reader))
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _find(self, location_string):
+        text = clean_location(location_string)
+        if not text:
+            return None
+        if text in self._states:
+            city = self._index.get((text, None))
+            if city is not None:
+                return city if text in BARE_CITY_NAMES else None
+            return self._index[('', self._states[text])]
+        words = text.split()
+        # "City, State" with a state name of up to three words or an abbreviation
+        for size in (3, 2, 1):
+            if len(words) > size:
+                state = self._states.get(' '.join(words[-size:]))
+                if state is not None:
+                    return self._index.get((_city_key(words[:-size]), state))
+        return self._index.get((_city_key(words), None))
+
+    def _lookup(self, location_string):
+        row = self._find(location_string)
+        if row is None:
+            return None
+        return self.latitudes[row], self.longitudes[row]
+
+    def location_choices(self):
+        """Dropdown choices: states (with Washington DC) in file order, then the listed cities A-Z."""
+        states = [label for label, kind in zip(self.labels, self.kinds) if kind == 'state']
+        cities = sorted(
+            label for label, kind, listed in zip(self.labels, self.kinds, self.menu) if kind == 'city' and listed
+        )
+        return [(label, label) for label in states + cities]
+
+
+@lru_cache(maxsize=None)
+def get_gazetteer():
+    """Return the bundled gazetteer, loading it on first use."""
+    return Gazetteer.from_csv(DATA_FILE)
+
+
+def gazetteer_lookup(location_string):
+    """
+    Resolve a location without any network I/O.
+
+    Args:
+        location_string (str): Location string like "Atlanta, GA" or "Texas"
+
+    Returns:
+        tuple: (latitude, longitude), or None if the location is not listed
+    """
+    if not location_string:
+        return None
+    return get_gazetteer().lookup(location_string)
@@ -0,0 +1,195 @@
+"""
+Durable geocode work queue for job and profile locations.
+
+Saving a job or profile whose location changed queues a ``GeocodeRequest``
+in the same transaction (see ``jobs.signals``), so the save itself never
+waits for the geocoder. The ``run_geocode_queue`` worker claims pending
+requests in batches, looks up each distinct location once with
+``geocode_locations`` and writes the coordinates back with conditional
+UPDATEs, one per distinct location in the batch.
+"""
+import logging
+import uuid
+from datetime import timedelta
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from jobs.geocoders import normalize_location
+from jobs.utils import _skip_geocoding, geocode_locations
+
+
+logger = logging.getLogger(__name__)
+
+# Requests claimed per worker batch
+GEOCODE_BATCH_SIZE = 100
+
+# Running requests not finished after this many seconds are claimed again,
+# e.g. after the worker holding them crashed
+GEOCODE_CLAIM_TIMEOUT = 600
+
+# Model behind each GeocodeRequest target
+TARGET_MODELS = {
+    'job': 'jobs.Job',
+    'profile': 'profiles.Profile',
+}
+
+
+def target_for(instance):
+    """Return the ``GeocodeRequest.Target`` value for a model instance, or None."""
+    label = instance._meta.label
+    for target, model_label in TARGET_MODELS.items():
+        if model_label == label:
+            return target
+    return None
+
+
+def enqueue_geocoding(target, locations):
+    """
+    Queue locations for geocoding, replacing the objects' pending requests.
+
+    Args:
+        target (str): One of the ``GeocodeRequest.Target`` values
+        locations (dict): Object id to location string
+
+    Returns:
+        int: Number of requests queued
+    """
+    from jobs.models import GeocodeRequest
+
+    if not locations:
+        return 0
+    # Callers saving the objects in a transaction get the requests in the same one
+    with transaction.atomic(savepoint=False):
+        GeocodeRequest.objects.filter(
+            target=target, object_id__in=list(locations), status=GeocodeRequest.Status.PENDING
+        ).delete()
+        GeocodeRequest.objects.bulk_create([
+            GeocodeRequest(target=target, object_id=object_id, location=location)
+            for object_id, location in locations.items()
+        ])
+    return len(locations)
+
+
+def claim_geocode_batch(batch_size=GEOCODE_BATCH_SIZE, timeout=GEOCODE_CLAIM_TIMEOUT):
+    """
+    Atomically claim up to ``batch_size`` of the oldest pending requests.
+
+    The claim is a conditional UPDATE tagging rows with a batch id, so
+    several workers can poll the queue without geocoding a request twice.
+    Requests claimed more than ``timeout`` seconds ago and still running
+    are claimed again.
+
+    Returns:
+        list: The claimed requests, now marked as running
+    """
+    from jobs.models import GeocodeRequest
+
+    now = timezone.now()
+    claimable = GeocodeRequest.objects.filter(
+        Q(status=GeocodeRequest.Status.PENDING)
+        | Q(status=GeocodeRequest.Status.RUNNING, updated_at__lt=now - timedelta(seconds=timeout))
+    )
+    ids = list(claimable.order_by('created_at').values_list('pk', flat=True)[:batch_size])
+    if not ids:
+        return []
+    batch = uuid.uuid4()
+    # Repeating the filter keeps a request another worker claimed meanwhile out of this batch
+    claimable.filter(pk__in=ids).update(
+        status=GeocodeRequest.Status.RUNNING, batch=batch, attempts=F('attempts') + 1, updated_at=now
+    )
+    return list(GeocodeRequest.objects.filter(batch=batch))
+
+
+def process_geocode_batch(requests, concurrency=None, rate=None):
+    """
+    Geocode claimed requests and save the coordinates on their objects.
+
+    Objects whose location changed again after the request was queued are
+    left alone; their newer request carries the current location. A
+    location that becomes "Remote", or cannot be geocoded, clears the
+    object's coordinates. The write only applies while the object still has
+    the location and coordinates read here, so a move or a dropped pin
+    saved during the lookup is kept.
+
+    Args:
+        requests (list): Running ``GeocodeRequest`` rows
+        concurrency (int): Worker threads for the lookups
+        rate (float): Geocoder requests per second, 0 for no limit
+
+    Returns:
+        tuple: (objects geocoded, requests failed)
+    """
+    from jobs.models import GeocodeRequest
+
+    coordinates = geocode_locations(
+        [request.location for request in requests if not _skip_geocoding(request.location)],
+        concurrency=concurrency, rate=rate,
+    )
+    done, failed, geocoded = [], [], 0
+    now = timezone.now()
+    for target, model_label in TARGET_MODELS.items():
+        batch = [request for request in requests if request.target == target]
+        if not batch:
+            continue
+        model = apps.get_model(model_label)
+        objects = model.objects.only('pk', 'location', 'latitude', 'longitude').in_bulk(
+            [request.object_id for request in batch]
+        )
+        # (location, coordinates read, new coordinates) -> object ids
+        writes = {}
+        for request in batch:
+            obj = objects.get(request.object_id)
+            if obj is None or normalize_location(obj.location) != normalize_location(request.location):
+                done.append(request.pk)
+                continue
+            skipped = _skip_geocoding(request.location)
+            lat, lon = (None, None) if skipped else coordinates[request.location]
+            if lat is None and not skipped:
+                # The coordinates are cleared anyway; they belong to an older location
+                failed.append(request.pk)
+            else:
+                done.append(request.pk)
+            key = (obj.location, obj.latitude, obj.longitude, lat, lon)
+            writes.setdefault(key, []).append(obj.pk)
+        for (location, read_lat, read_lon, lat, lon), ids in writes.items():
+            written = model.objects.filter(
+                pk__in=ids, location=location, latitude=read_lat, longitude=read_lon
+            ).update(latitude=lat, longitude=lon, updated_at=now)
+            if lat is not None:
+                geocoded += written
+
+    with transaction.atomic():
+        GeocodeRequest.objects.filter(pk__in=done).delete()
+        GeocodeRequest.objects.filter(pk__in=failed).update(
+            status=GeocodeRequest.Status.FAILED, error='Location could not be geocoded', updated_at=now,
+        )
+    return geocoded, len(failed)
+
+
+def run_geocode_queue(batch_size=GEOCODE_BATCH_SIZE, concurrency=None, rate=None):
+    """
+    Process pending geocode requests until the queue is empty.
+
+    Args:
+        batch_size (int): Requests claimed per batch
+        concurrency (int): Worker threads for the lookups
+        rate (float): Geocoder requests per second, 0 for no limit
+
+    Returns:
+        tuple: (requests processed, objects geocoded, requests failed)
+    """
+    processed = geocoded = failed = 0
+    while True:
+        requests = claim_geocode_batch(batch_size)
+        if not requests:
+            return processed, geocoded, failed
+        batch_geocoded, batch_failed = process_geocode_batch(requests, concurrency=concurrency, rate=rate)
+        logger.info(
+            'Geocoded %d of %d queued location(s), %d failed', batch_geocoded, len(requests), batch_failed
+        )
+        processed += len(requests)
+        geocoded += batch_geocoded
+        failed += batch_failed
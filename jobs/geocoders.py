@@ -0,0 +1,301 @@
+"""
+Geocoder backends.
+
+``settings.GEOCODER`` names a backend class and its options, in the same
+shape as ``CACHES``. Composite backends take the configuration of the
+backends they wrap:
+
+- ``NominatimBackend``: a Nominatim search API, public or self-hosted
+- ``GazetteerBackend``: the bundled offline gazetteer (``jobs.gazetteer``)
+- ``ChainedBackend``: asks each backend in turn until one finds the place
+- ``CachedBackend``: keeps another backend's answers in the Django cache
+
+Every backend answers ``geocode(location)`` (and ``ageocode`` for async
+views) with ``((latitude, longitude), found)``, where ``found`` is None
+when the lookup itself failed so callers know not to cache the miss.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+import weakref
+
+import httpx
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from hirebuzz.instrumentation import track_http
+from hirebuzz.metrics import GEOCODE_CACHE, GEOCODER_LATENCY
+from .gazetteer import gazetteer_lookup
+
+
+logger = logging.getLogger(__name__)
+
+NOMINATIM_URL = 'https://nominatim.openstreetmap.org/search'
+
+# Seconds to keep geocoder answers: found coordinates rarely change, misses may be typos
+GEOCODE_CACHE_TIMEOUT = 60 * 60 * 24 * 30
+GEOCODE_MISS_CACHE_TIMEOUT = 60 * 60 * 24
+
+NOT_FOUND = ((None, None), False)
+FAILED = ((None, None), None)
+
+
+def normalize_location(location_string):
+    """Collapse whitespace and case so spellings of one place share a cache entry."""
+    return ' '.join((location_string or '').split()).casefold()
+
+
+class GeocoderBackend:
+    """Base class; subclasses implement ``geocode`` and may override ``ageocode``."""
+
+    def geocode(self, location_string, limiter=None):
+        """
+        Look up a location.
+
+        Args:
+            location_string (str): Location string like "Atlanta, GA"
+            limiter (TokenBucket): Optional rate limit for network requests
+
+        Returns:
+            tuple: ((latitude, longitude), found)
+        """
+        raise NotImplementedError
+
+    async def ageocode(self, location_string):
+        return await sync_to_async(self.geocode, thread_sensitive=False)(location_string)
+
+
+class NominatimBackend(GeocoderBackend):
+    """
+    Nominatim's search API.
+
+    Lookups are spaced to ``rate`` requests per second across threads and
+    event loops; the public server allows 1, so raise it only for a
+    self-hosted instance. A lookup given its own ``limiter`` (batch
+    geocoding) uses that instead.
+
+    Async lookups share one ``httpx`` client per event loop, which keeps
+    connections open between lookups. Under WSGI every request runs on a new
+    event loop, so the client only lives as long as its loop. At most
+    ``max_connections`` lookups run at once per event loop.
+    """
+
+    def __init__(self, url=NOMINATIM_URL, timeout=10, max_connections=10, rate=None,
+                 user_agent='HireBuzz/1.0 (Job Board Application)', service='nominatim'):
+        from .utils import TokenBucket
+
+        self.url = url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.limiter = TokenBucket(rate)
+        self.headers = {'User-Agent': user_agent}
+        self.service = service
+        # Held weakly, so a finished loop takes its semaphore and client with it
+        self._slots = weakref.WeakKeyDictionary()
+        self._clients = weakref.WeakKeyDictionary()
+        self._ssl_context = None
+
+    @staticmethod
+    def _params(location_string):
+        return {
+            'q': location_string,
+            'format': 'json',
+            'limit': 1,
+            'addressdetails': 1
+        }
+
+    @staticmethod
+    def _parse(data):
+        if data and len(data) > 0:
+            result = data[0]
+            return (float(result['lat']), float(result['lon'])), True
+        return NOT_FOUND
+
+    def geocode(self, location_string, limiter=None):
+        (limiter or self.limiter).acquire()
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            with track_http(self.service):
+                response = requests.get(
+                    self.url, params=self._params(location_string), headers=self.headers, timeout=self.timeout,
+                )
+            response.raise_for_status()
+            coordinates, found = self._parse(response.json())
+            outcome = 'found' if found else 'not_found'
+            return coordinates, found
+        except (requests.RequestException, ValueError, KeyError, IndexError) as e:
+            logger.warning("Geocoding error for '%s': %s", location_string, e)
+        finally:
+            GEOCODER_LATENCY.observe(time.perf_counter() - started, outcome=outcome)
+        return FAILED
+
+    def _slot(self):
+        """Return the semaphore capping concurrent lookups on the running event loop."""
+        loop = asyncio.get_running_loop()
+        slots = self._slots.get(loop)
+        if slots is None:
+            slots = self._slots[loop] = asyncio.Semaphore(self.max_connections)
+        return slots
+
+    def _client(self):
+        """Return the ``httpx`` client shared by lookups on the running event loop."""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            if self._ssl_context is None:
+                # Building the SSL context is the expensive part of a new client
+                self._ssl_context = httpx.create_ssl_context()
+            client = self._clients[loop] = httpx.AsyncClient(
+                headers=self.headers, timeout=self.timeout, verify=self._ssl_context,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        return client
+
+    async def ageocode(self, location_string):
+        started = time.perf_counter()
+        outcome = 'error'
+        try:
+            async with self._slot():
+                await self.limiter.aacquire()
+                with track_http(self.service):
+                    response = await self._client().get(self.url, params=self._params(location_string))
+            response.raise_for_status()
+            coordinates, found = self._parse(response.json())
+            outcome = 'found' if found else 'not_found'
+            return coordinates, found
+        except (httpx.HTTPError, ValueError, KeyError, IndexError) as e:
+            logger.warning("Geocoding error for '%s': %s", location_string, e)
+        finally:
+            GEOCODER_LATENCY.observe(time.perf_counter() - started, outcome=outcome)
+        return FAILED
+
+
+class GazetteerBackend(GeocoderBackend):
+    """Common US cities and states from the bundled gazetteer, with no network I/O."""
+
+    def geocode(self, location_string, limiter=None):
+        coordinates = gazetteer_lookup(location_string)
+        if coordinates is None:
+            return NOT_FOUND
+        GEOCODE_CACHE.inc(result='gazetteer')
+        return coordinates, True
+
+    async def ageocode(self, location_string):
+        # A dictionary lookup; not worth a thread
+        return self.geocode(location_string)
+
+
+class ChainedBackend(GeocoderBackend):
+    """
+    Ask each backend in order and return the first place found.
+
+    A miss is only reported as a failure (not cacheable) when some backend
+    failed and none found the place.
+    """
+
+    def __init__(self, backends):
+        self.backends = [load_backend(config) for config in backends]
+
+    def _combine(self, results):
+        failed = False
+        for coordinates, found in results:
+            if found:
+                return coordinates, True
+            failed = failed or found is None
+        return FAILED if failed else NOT_FOUND
+
+    def geocode(self, location_string, limiter=None):
+        def results():
+            for backend in self.backends:
+                yield backend.geocode(location_string, limiter=limiter)
+        return self._combine(results())
+
+    async def ageocode(self, location_string):
+        results = []
+        for backend in self.backends:
+            results.append(await backend.ageocode(location_string))
+            if results[-1][1]:
+                break
+        return self._combine(results)
+
+
+class CachedBackend(GeocoderBackend):
+    """
+    Keep another backend's answers in a Django cache.
+
+    Found places are kept for ``timeout`` seconds and misses for
+    ``miss_timeout``; failed lookups are not cached, so the next call retries.
+    """
+
+    def __init__(self, backend, timeout=GEOCODE_CACHE_TIMEOUT, miss_timeout=GEOCODE_MISS_CACHE_TIMEOUT,
+                 cache_alias='default', key_prefix='geocode:'):
+        self.backend = load_backend(backend)
+        self.timeout = timeout
+        self.miss_timeout = miss_timeout
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+
+    def cache_key(self, location_string):
+        normalized = normalize_location(location_string)
+        return self.key_prefix + hashlib.md5(normalized.encode('utf-8')).hexdigest()
+
+    def _hit(self, cached):
+        GEOCODE_CACHE.inc(result='hit')
+        coordinates = tuple(cached)
+        return coordinates, coordinates[0] is not None
+
+    def geocode(self, location_string, limiter=None):
+        cache = caches[self.cache_alias]
+        key = self.cache_key(location_string)
+        cached = cache.get(key)
+        if cached is not None:
+            return self._hit(cached)
+        GEOCODE_CACHE.inc(result='miss')
+
+        coordinates, found = self.backend.geocode(location_string, limiter=limiter)
+        if found is not None:
+            cache.set(key, list(coordinates), self.timeout if found else self.miss_timeout)
+        return coordinates, found
+
+    async def ageocode(self, location_string):
+        cache = caches[self.cache_alias]
+        key = self.cache_key(location_string)
+        cached = await cache.aget(key)
+        if cached is not None:
+            return self._hit(cached)
+        GEOCODE_CACHE.inc(result='miss')
+
+        coordinates, found = await self.backend.ageocode(location_string)
+        if found is not None:
+            await cache.aset(key, list(coordinates), self.timeout if found else self.miss_timeout)
+        return coordinates, found
+
+
+def load_backend(config):
+    """Build a backend from a ``{'BACKEND': dotted path, 'OPTIONS': {...}}`` dict."""
+    return import_string(config['BACKEND'])(**config.get('OPTIONS', {}))
+
+
+_geocoder = None
+
+
+def get_geocoder():
+    """Return the backend configured by ``settings.GEOCODER``, built on first use."""
+    global _geocoder
+    if _geocoder is None:
+        _geocoder = load_backend(settings.GEOCODER)
+    return _geocoder
+
+
+@receiver(setting_changed)
+def _reset_geocoder(setting, **kwargs):
+    global _geocoder
+    if setting == 'GEOCODER':
+        _geocoder = None
@@ -0,0 +1,222 @@
+import csv
+import io
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from .forms import JobForm
+from .geocode_queue import enqueue_geocoding
+from .models import Job
+from .utils import _skip_geocoding
+
+
+# Rows validated and written per transaction
+IMPORT_BATCH_SIZE = 1000
+
+
+def iter_feed_records(stream, feed_format):
+    """
+    Read a job feed one record at a time.
+
+    Args:
+        stream: Binary or text file object
+        feed_format (str): 'csv' or 'jsonl'
+
+    Yields:
+        dict: One record per feed row
+
+    Raises:
+        ValueError: If the format is unsupported or the feed cannot be parsed
+    """
+    if feed_format not in ('csv', 'jsonl'):
+        raise ValueError(f"Unsupported feed format '{feed_format}'")
+    if isinstance(stream, io.TextIOBase):
+        text = stream
+    else:
+        text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+    try:
+        if feed_format == 'csv':
+            for record in csv.DictReader(text):
+                yield record
+        else:
+            for line in text:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError('each line must be a JSON object')
+                yield record
+    except (csv.Error, ValueError) as e:
+        # Covers UnicodeDecodeError and JSONDecodeError, both ValueErrors
+        raise ValueError(f'Malformed {feed_format} feed: {e}') from e
+
+
+def detect_feed_format(filename):
+    """Guess the feed format from a file name ('csv' unless it looks like JSON Lines)."""
+    return 'jsonl' if filename.lower().endswith(('.jsonl', '.ndjson', '.json')) else 'csv'
+
+
+def _provided(record):
+    """Return the record's non-empty values; empty cells count as not given."""
+    return {key: value for key, value in record.items() if value not in (None, '')}
+
+
+class JobFeedValidator:
+    """
+    Validate feed records with ``JobForm``.
+
+    New postings start from the model defaults, updates from the stored row,
+    so columns missing from a record keep their current value.
+    """
+
+    def __init__(self):
+        self.defaults = {}
+        for name in JobForm.Meta.fields:
+            model_field = Job._meta.get_field(name)
+            if model_field.has_default():
+                self.defaults[name] = model_field.get_default()
+
+    def validate(self, record, current=None):
+        """
+        Validate a record and build an unsaved Job from it.
+
+        Args:
+            record (dict): Feed record keyed by Job field names
+            current (dict): Stored values of the posting the record updates
+
+        Returns:
+            tuple: (Job or None, errors dict)
+        """
+        provided = _provided(record)
+        if current is None:
+            data = dict(self.defaults)
+        else:
+            data = {name: current[name] for name in JobForm.Meta.fields if current[name] is not None}
+            if 'location' in provided and provided['location'] != current['location']:
+                # Stored coordinates belong to the old location
+                data.pop('latitude', None)
+                data.pop('longitude', None)
+        data.update(provided)
+        if isinstance(data.get('visa_sponsorship'), str):
+            data['visa_sponsorship'] = data['visa_sponsorship'].strip().lower() in ('1', 'true', 'yes', 'y')
+
+        form = JobForm(data=data)
+        if form.is_valid():
+            return form.instance, {}
+        return None, form.errors.get_json_data()
+
+
+def import_jobs(records, recruiter=None, batch_size=IMPORT_BATCH_SIZE):
+    """
+    Upsert job postings from feed records in batches.
+
+    Records with an ``external_id`` update the matching posting, everything
+    else is created. Each batch is validated with ``JobForm`` rules, then
+    written with one ``bulk_create`` and a ``bulk_update`` per set of given
+    columns in a transaction.
+    Updates only write the columns a record gives a value for, and records
+    naming an unknown ``recruiter`` are reported as invalid rows.
+    Coordinates are kept when an update leaves the location unchanged;
+    postings without coordinates are queued for the ``run_geocode_queue``
+    worker in the same transaction.
+
+    Args:
+        records: Iterable of feed record dicts
+        recruiter: Default User for new postings without a ``recruiter`` username
+        batch_size (int): Records per transaction
+
+    Returns:
+        dict: Counts for created, updated and invalid rows, the ids of postings
+            that still need geocoding, and up to 50 row errors
+    """
+    validator = JobFeedValidator()
+    stats = {'created': 0, 'updated': 0, 'invalid': 0, 'needs_geocoding': [], 'errors': []}
+    row_number = 0
+
+    records = iter(records)
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+
+        usernames = {record.get('recruiter') for record in batch if record.get('recruiter')}
+        recruiters = {user.username: user for user in User.objects.filter(username__in=usernames)} if usernames else {}
+        external_ids = {str(record['external_id']) for record in batch if record.get('external_id')}
+        existing = {
+            row['external_id']: row
+            for row in Job.objects.filter(external_id__in=external_ids).order_by().values(
+                'id', 'external_id', *JobForm.Meta.fields
+            )
+        } if external_ids else {}
+
+        to_create = []
+        to_create_by_external_id = {}
+        to_update = {}
+        now = timezone.now()
+        for record in batch:
+            row_number += 1
+            external_id = str(record['external_id']) if record.get('external_id') else None
+            current = existing.get(external_id)
+            job, errors = validator.validate(record, current)
+            username = record.get('recruiter')
+            job_recruiter = recruiters.get(username) if username else recruiter
+            if job is not None and username and job_recruiter is None:
+                errors = {'recruiter': [{'message': f"Unknown recruiter '{username}'."}]}
+                job = None
+            elif job is not None and current is None and job_recruiter is None:
+                errors = {'recruiter': [{'message': 'No recruiter given and no default recruiter.'}]}
+                job = None
+            if job is None:
+                stats['invalid'] += 1
+                if len(stats['errors']) < 50:
+                    stats['errors'].append({'row': row_number, 'errors': errors})
+                continue
+
+            job.external_id = external_id
+            if current is None:
+                job.recruiter = job_recruiter
+                if external_id:
+                    # Later rows for the same posting win
+                    to_create_by_external_id[external_id] = job
+                else:
+                    to_create.append(job)
+                continue
+
+            job.pk = current['id']
+            job.updated_at = now
+            provided = _provided(record)
+            fields = [name for name in JobForm.Meta.fields if name in provided]
+            if 'location' in provided:
+                fields += ['latitude', 'longitude']
+            if username:
+                job.recruiter = job_recruiter
+                fields.append('recruiter')
+            # Later rows for the same posting win
+            to_update[external_id] = (job, tuple(dict.fromkeys(fields + ['updated_at'])))
+
+        to_create.extend(to_create_by_external_id.values())
+        with transaction.atomic():
+            created = Job.objects.bulk_create(to_create, batch_size=batch_size)
+            by_fields = {}
+            for job, fields in to_update.values():
+                by_fields.setdefault(fields, []).append(job)
+            for fields, jobs in by_fields.items():
+                Job.objects.bulk_update(jobs, fields, batch_size=batch_size)
+            needs_geocoding = {
+                job.pk: job.location for job in list(created) + [job for job, _ in to_update.values()]
+                if job.pk and not job.has_coordinates() and not _skip_geocoding(job.location)
+            }
+            if settings.GEOCODE_ON_SAVE:
+                enqueue_geocoding('job', needs_geocoding)
+
+        stats['created'] += len(created)
+        stats['updated'] += len(to_update)
+        stats['needs_geocoding'].extend(needs_geocoding)
+
+    return stats
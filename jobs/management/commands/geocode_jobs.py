@@ -1,15 +1,47 @@
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
 from jobs.utils import geocode_job_locations
 
 
 class Command(BaseCommand):
     help = 'Geocode all jobs that don\'t have coordinates yet'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=settings.GEOCODER_BATCH_CONCURRENCY,
+            help=f'Concurrent geocoder lookups (default: {settings.GEOCODER_BATCH_CONCURRENCY})'
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=settings.GEOCODER_RATE_LIMIT,
+            help=f'Geocoder requests per second, 0 for no limit (default: {settings.GEOCODER_RATE_LIMIT:g})'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many jobs and distinct locations need geocoding'
+        )
+
     def handle(self, *args, **options):
+        if options['concurrency'] < 1:
+            raise CommandError('--concurrency must be at least 1')
+        if options['rate'] < 0:
+            raise CommandError('--rate cannot be negative')
         self.stdout.write('Starting to geocode job locations...')
         
         try:
-            geocoded_count = geocode_job_locations()
+            geocoded_count = geocode_job_locations(
+                concurrency=options['concurrency'],
+                rate=options['rate'],
+                dry_run=options['dry_run'],
+                log=self.stdout.write,
+            )
+            if options['dry_run']:
+                self.stdout.write('Dry run: nothing was geocoded or saved')
+                return
             self.stdout.write(
                 self.style.SUCCESS(f'Successfully geocoded {geocoded_count} jobs')
             )
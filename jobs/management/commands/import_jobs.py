@@ -0,0 +1,67 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.importers import IMPORT_BATCH_SIZE, detect_feed_format, import_jobs, iter_feed_records
+
+
+class Command(BaseCommand):
+    help = 'Import or update job postings from a CSV or JSON Lines feed keyed on external_id'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='Path to the feed file')
+        parser.add_argument(
+            '--format',
+            choices=['csv', 'jsonl'],
+            help='Feed format (default: detected from the file extension)'
+        )
+        parser.add_argument(
+            '--recruiter',
+            help='Username to own new postings whose row has no recruiter column'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help=f'Rows validated and written per transaction (default: {IMPORT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--geocode',
+            action='store_true',
+            help='Drain the geocode queue once the import finishes instead of leaving it to the worker'
+        )
+
+    def handle(self, *args, **options):
+        recruiter = None
+        if options['recruiter']:
+            try:
+                recruiter = User.objects.get(username=options['recruiter'])
+            except User.DoesNotExist:
+                raise CommandError(f"Recruiter '{options['recruiter']}' does not exist")
+
+        feed_format = options['format'] or detect_feed_format(options['path'])
+        self.stdout.write(f"Importing jobs from {options['path']} ({feed_format})...")
+
+        try:
+            with open(options['path'], 'rb') as feed:
+                stats = import_jobs(
+                    iter_feed_records(feed, feed_format),
+                    recruiter=recruiter,
+                    batch_size=options['batch_size'],
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(f'Could not read feed: {e}')
+
+        for error in stats['errors']:
+            self.stdout.write(self.style.WARNING(f"Row {error['row']}: {error['errors']}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {stats['created']}, updated {stats['updated']}, skipped {stats['invalid']} invalid row(s)"
+        ))
+
+        pending = len(stats['needs_geocoding'])
+        if pending and options['geocode']:
+            from jobs.geocode_queue import run_geocode_queue
+            self.stdout.write(f'Geocoding {pending} posting(s)...')
+            processed, geocoded, failed = run_geocode_queue()
+            self.stdout.write(f'Geocoded {geocoded} of {processed} queued location(s), {failed} failed')
+        elif pending:
+            self.stdout.write(f'{pending} posting(s) queued for geocoding by "python manage.py run_geocode_queue".')
@@ -0,0 +1,62 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.geocode_queue import GEOCODE_BATCH_SIZE, run_geocode_queue
+
+
+class Command(BaseCommand):
+    help = 'Geocode job and profile locations queued when they were saved'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process the pending requests and exit instead of polling'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Seconds to wait between queue checks when idle (default: 5)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=GEOCODE_BATCH_SIZE,
+            help=f'Requests claimed per batch (default: {GEOCODE_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=settings.GEOCODER_BATCH_CONCURRENCY,
+            help=f'Concurrent geocoder lookups (default: {settings.GEOCODER_BATCH_CONCURRENCY})'
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=settings.GEOCODER_RATE_LIMIT,
+            help=f'Geocoder requests per second, 0 for no limit (default: {settings.GEOCODER_RATE_LIMIT:g})'
+        )
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--batch-size and --concurrency must be at least 1')
+        if options['rate'] < 0:
+            raise CommandError('--rate cannot be negative')
+        self.stdout.write('Waiting for geocode requests...' if not options['once'] else 'Processing pending geocode requests...')
+
+        while True:
+            processed, geocoded, failed = run_geocode_queue(
+                options['batch_size'], concurrency=options['concurrency'], rate=options['rate']
+            )
+            if processed:
+                message = f'Geocoded {geocoded} of {processed} queued location(s)'
+                if failed:
+                    self.stdout.write(self.style.WARNING(f'{message}, {failed} failed'))
+                else:
+                    self.stdout.write(self.style.SUCCESS(message))
+            if options['once']:
+                break
+            time.sleep(options['poll_interval'])
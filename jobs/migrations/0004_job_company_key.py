@@ -0,0 +1,34 @@
+# Generated by Django 5.0.14 on 2026-10-19 05:09
+
+from django.db import migrations, models
+
+from accounts.utils import normalize_company
+
+
+def backfill_company_keys(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    batch = []
+    for obj in Job.objects.only('id', 'company').iterator(chunk_size=1000):
+        obj.company_key = normalize_company(obj.company)
+        batch.append(obj)
+        if len(batch) >= 1000:
+            Job.objects.bulk_update(batch, ['company_key'])
+            batch = []
+    if batch:
+        Job.objects.bulk_update(batch, ['company_key'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_job_latitude_job_longitude'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='company_key',
+            field=models.CharField(blank=True, db_index=True, editable=False, help_text='Normalized company name used for indexed company lookups', max_length=200),
+        ),
+        migrations.RunPython(backfill_company_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-19 05:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_company_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='external_id',
+            field=models.CharField(blank=True, help_text='Identifier of this posting in an imported job feed (optional)', max_length=100, null=True, unique=True),
+        ),
+    ]
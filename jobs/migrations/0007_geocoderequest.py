@@ -0,0 +1,36 @@
+# Generated by Django 5.0.14 on 2026-10-19 06:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_job_job_active_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodeRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target', models.CharField(choices=[('job', 'Job'), ('profile', 'Profile')], max_length=10)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('location', models.CharField(max_length=100)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('failed', 'Failed')], default='pending', max_length=10)),
+                ('batch', models.UUIDField(blank=True, help_text='Worker batch that claimed this request', null=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['created_at'],
+                'indexes': [models.Index(condition=models.Q(('status', 'pending')), fields=['created_at'], name='geocode_request_pending_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='geocoderequest',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('target', 'object_id'), name='geocode_request_pending_uniq'),
+        ),
+    ]
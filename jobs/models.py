@@ -1,9 +1,34 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
 from django.urls import reverse
 
+from accounts.utils import CompanyKeyQuerySet, normalize_company
 
-class Job(models.Model):
+
+class GeocodedLocationMixin:
+    """
+    Remember the ``location`` and coordinates a model was loaded with.
+
+    The geocode-on-save hook (``jobs.signals``) compares them with the saved
+    values to tell whether the location changed, and whether new coordinates
+    came with it (e.g. a pin dropped on the posting form).
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.remember_location()
+        return instance
+
+    def remember_location(self):
+        # Deferred fields are missing from __dict__ and read as unknown (None)
+        self._loaded_location = (
+            self.__dict__.get('location'), self.__dict__.get('latitude'), self.__dict__.get('longitude')
+        )
+
+
+class Job(GeocodedLocationMixin, models.Model):
     """Job posting model for recruiters to post and manage job openings."""
 
     EMPLOYMENT_TYPE_CHOICES = [
@@ -42,6 +67,13 @@ class Job(models.Model):
         max_length=200,
         help_text="Company name"
     )
+    company_key = models.CharField(
+        max_length=200,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Normalized company name used for indexed company lookups"
+    )
     location = models.CharField(
         max_length=100,
         help_text="Job location (e.g., 'Atlanta, GA' or 'Remote')"
@@ -139,17 +171,61 @@ class Job(models.Model):
         blank=True,
         help_text="External application URL (optional)"
     )
+    external_id = models.CharField(
+        max_length=100,
+        unique=True,
+        null=True,
+        blank=True,
+        help_text="Identifier of this posting in an imported job feed (optional)"
+    )
 
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    company_key_source = 'company'
+    objects = CompanyKeyQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Job board and recommendations only list active jobs, newest first,
+            # with optional equality filters from the search form
+            models.Index(fields=['-created_at'], condition=Q(status='active'), name='job_active_created_idx'),
+            models.Index(
+                fields=['work_type', '-created_at'], condition=Q(status='active'), name='job_active_work_type_idx'
+            ),
+            models.Index(
+                fields=['employment_type', '-created_at'], condition=Q(status='active'), name='job_active_employment_idx'
+            ),
+            models.Index(
+                fields=['experience_level', '-created_at'], condition=Q(status='active'), name='job_active_experience_idx'
+            ),
+            # "My jobs" listing
+            models.Index(fields=['recruiter', '-created_at'], name='job_recruiter_created_idx'),
+            # Map and commute filter read geocoded active jobs; geocode_jobs looks for the rest
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(status='active', latitude__isnull=False, longitude__isnull=False),
+                name='job_active_geocoded_idx',
+            ),
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(latitude__isnull=True, longitude__isnull=True),
+                name='job_missing_coords_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.title} at {self.company}"
 
+    def save(self, *args, **kwargs):
+        self.company_key = normalize_company(self.company)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'company' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'company_key'}
+        super().save(*args, **kwargs)
+
     def get_absolute_url(self):
         return reverse('jobs:detail', kwargs={'pk': self.pk})
 
@@ -189,4 +265,49 @@ class Job(models.Model):
         """Return coordinates as a tuple if available."""
         if self.has_coordinates():
             return (float(self.latitude), float(self.longitude))
-        return None
\ No newline at end of file
+        return None
+
+
+class GeocodeRequest(models.Model):
+    """
+    A location waiting to be geocoded by the ``run_geocode_queue`` worker.
+
+    Saving a job or profile with a new location queues one request for it.
+    A newer save replaces the object's pending request rather than adding a
+    second one, and finished requests are deleted.
+    """
+
+    class Target(models.TextChoices):
+        JOB = 'job', 'Job'
+        PROFILE = 'profile', 'Profile'
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        RUNNING = 'running', 'Running'
+        FAILED = 'failed', 'Failed'
+
+    target = models.CharField(max_length=10, choices=Target.choices)
+    object_id = models.PositiveBigIntegerField()
+    location = models.CharField(max_length=100)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.PENDING)
+    batch = models.UUIDField(null=True, blank=True, help_text="Worker batch that claimed this request")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['created_at']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['target', 'object_id'],
+                condition=Q(status='pending'),
+                name='geocode_request_pending_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['created_at'], condition=Q(status='pending'), name='geocode_request_pending_idx'),
+        ]
+
+    def __str__(self):
+        return f"Geocode {self.get_target_display().lower()} #{self.object_id}: {self.location}"
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from jobs.geocode_queue import enqueue_geocoding, target_for
+from jobs.models import Job
+from jobs.utils import _skip_geocoding
+from profiles.models import Profile
+
+
+def needs_geocoding(instance, created, update_fields):
+    """
+    Decide whether a saved job or profile should be queued for geocoding.
+
+    New objects are queued when they have a location but no coordinates.
+    Existing objects are queued when their location changed, unless new
+    coordinates were saved along with it.
+    """
+    if update_fields is not None and 'location' not in update_fields:
+        return False
+    has_coordinates = instance.latitude is not None and instance.longitude is not None
+    loaded = getattr(instance, '_loaded_location', None)
+    if created or loaded is None:
+        return not has_coordinates and not _skip_geocoding(instance.location)
+    location, latitude, longitude = loaded
+    if instance.location == location:
+        return False
+    moved = (instance.latitude, instance.longitude) != (latitude, longitude)
+    return not (has_coordinates and moved)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_save, sender=Profile)
+def queue_geocoding(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    if needs_geocoding(instance, created, update_fields):
+        if instance.latitude is not None or instance.longitude is not None:
+            # Coordinates of the old location (e.g. posted back by the form) are wrong now
+            sender.objects.filter(pk=instance.pk).update(latitude=None, longitude=None)
+            instance.latitude = instance.longitude = None
+        if settings.GEOCODE_ON_SAVE and not _skip_geocoding(instance.location):
+            enqueue_geocoding(target_for(instance), {instance.pk: instance.location})
+    instance.remember_location()
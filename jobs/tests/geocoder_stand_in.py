@@ -0,0 +1,147 @@
+"""
+A local stand-in for Nominatim's search API.
+
+``GeocoderStandIn`` serves canned responses from a threaded HTTP server on
+127.0.0.1, optionally sleeping before each answer to imitate the real
+service's latency. Tests and benchmarks point the geocoder backend at it
+(see ``backend_config``), so geocoding code paths run end to end, over real
+sockets, without network access and with repeatable timings.
+
+Responses are keyed by location string (matched ignoring case and extra
+whitespace). A value is either the JSON body to return, in Nominatim's
+``format=json`` shape, or ``{"status": <code>}`` to answer with that HTTP
+status. Unknown locations get ``[]``, Nominatim's "not found".
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from jobs.geocoders import normalize_location
+
+
+# Canned answers for the cities used by the load data generator
+DEFAULT_RESPONSES = Path(__file__).resolve().parent / 'data' / 'nominatim_responses.json'
+
+
+def load_responses(path=DEFAULT_RESPONSES):
+    with open(path, encoding='utf-8') as data:
+        return json.load(data)
+
+
+class GeocoderStandIn:
+    """
+    Replay geocoder responses from a local HTTP server.
+
+    Args:
+        responses (dict): Location string to response (default: the bundled file)
+        latency (float): Seconds to wait before answering each request
+
+    Attributes:
+        queries (list): Location strings received, in arrival order
+    """
+
+    def __init__(self, responses=None, latency=0.0):
+        if responses is None:
+            responses = load_responses()
+        self.responses = {normalize_location(location): body for location, body in responses.items()}
+        self.latency = latency
+        self.queries = []
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_port}/search'
+        self._thread = None
+
+    def _handler_class(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query).get('q', [''])[0]
+                with stand_in._lock:
+                    stand_in.queries.append(query)
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                body = stand_in.responses.get(normalize_location(query), [])
+                if isinstance(body, dict) and 'status' in body:
+                    self.send_response(body['status'])
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def backend_config(self, gazetteer=False, cached=True):
+        """
+        A ``settings.GEOCODER`` value sending lookups to this server.
+
+        Args:
+            gazetteer (bool): Try the offline gazetteer first, like the default
+                ``chained`` preset
+            cached (bool): Keep answers in the Django cache, like production
+        """
+        config = {'BACKEND': 'jobs.geocoders.NominatimBackend', 'OPTIONS': {'url': self.url, 'timeout': 5}}
+        if cached:
+            config = {'BACKEND': 'jobs.geocoders.CachedBackend', 'OPTIONS': {'backend': config}}
+        if gazetteer:
+            config = {
+                'BACKEND': 'jobs.geocoders.ChainedBackend',
+                'OPTIONS': {'backends': [{'BACKEND': 'jobs.geocoders.GazetteerBackend'}, config]},
+            }
+        return config
+
+
+class GeocoderStandInMixin:
+    """
+    Test case mixin serving ``geocoder_responses`` from a ``GeocoderStandIn``.
+
+    The configured backend is the cached stand-in, behind the gazetteer when
+    ``geocoder_gazetteer`` is set. Each test starts with an empty cache and
+    request log.
+    """
+
+    geocoder_responses = None
+    geocoder_latency = 0.0
+    geocoder_gazetteer = False
+
+    @classmethod
+    def setUpClass(cls):
+        cls.geocoder = GeocoderStandIn(cls.geocoder_responses, latency=cls.geocoder_latency).start()
+        cls.addClassCleanup(cls.geocoder.stop)
+        cls.enterClassContext(override_settings(GEOCODER=cls.geocoder.backend_config(gazetteer=cls.geocoder_gazetteer)))
+        super().setUpClass()
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.geocoder.queries.clear()
@@ -0,0 +1,126 @@
+import asyncio
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from accounts.models import UserProfile
+from jobs.models import Job
+from jobs.tests.geocoder_stand_in import GeocoderStandInMixin
+from jobs.utils import ageocode_location
+from profiles.models import Profile
+
+
+User = get_user_model()
+
+# Coordinates the stand-in geocoder knows about; "City N" resolves to (N, 0)
+PLACES = {
+    'Atlanta, GA': [{'lat': '33.749', 'lon': '-84.388'}],
+    'Decatur, GA': [{'lat': '33.7748', 'lon': '-84.2963'}],
+    'Seattle, WA': [{'lat': '47.6062', 'lon': '-122.3321'}],
+    'Broken': {'status': 500},
+    **{f'City {n}': [{'lat': str(n), 'lon': '0'}] for n in range(50)},
+}
+
+
+class StandInGeocoderMixin(GeocoderStandInMixin):
+    geocoder_responses = PLACES
+
+
+class AsyncGeocodeTests(StandInGeocoderMixin, SimpleTestCase):
+    async def test_found_locations_are_cached(self):
+        self.assertEqual(await ageocode_location('Atlanta, GA'), (33.749, -84.388))
+        self.assertEqual(await ageocode_location('  atlanta,   GA '), (33.749, -84.388))
+
+        self.assertEqual(self.geocoder.queries, ['Atlanta, GA'])
+
+    async def test_failures_are_retried_but_misses_are_cached(self):
+        with self.assertLogs('jobs.geocoders', 'WARNING'):
+            self.assertEqual(await ageocode_location('Broken'), (None, None))
+            self.assertEqual(await ageocode_location('Broken'), (None, None))
+        self.assertEqual(await ageocode_location('Atlantis'), (None, None))
+        self.assertEqual(await ageocode_location('Atlantis'), (None, None))
+        self.assertEqual(await ageocode_location('Remote'), (None, None))
+
+        self.assertEqual(self.geocoder.queries, ['Broken', 'Broken', 'Atlantis'])
+
+
+class ConcurrentGeocodeTests(StandInGeocoderMixin, SimpleTestCase):
+    geocoder_latency = 0.2
+
+    async def test_lookups_overlap(self):
+        started = time.perf_counter()
+        results = await asyncio.gather(*(ageocode_location(f'City {n}') for n in range(50)))
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(results, [(float(n), 0.0) for n in range(50)])
+        self.assertEqual(len(self.geocoder.queries), 50)
+        # Fifty serial lookups would take ten seconds
+        self.assertLess(elapsed, 3)
+
+
+class AsyncGeocodeViewTests(StandInGeocoderMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        UserProfile.objects.create(user=cls.recruiter, user_type='recruiter')
+        cls.seeker = User.objects.create_user('sam', 'sam@example.com', 'password123')
+        UserProfile.objects.create(user=cls.seeker, user_type='job_seeker')
+        Profile.objects.create(user=cls.seeker, headline='Engineer', skills='Python', location='Atlanta, GA')
+        cls.near = cls._job('Near Posting', 'Decatur, GA', 33.7748, -84.2963)
+        cls.far = cls._job('Far Posting', 'Seattle, WA', 47.6062, -122.3321)
+
+    @classmethod
+    def _job(cls, title, location, lat=None, lon=None):
+        return Job.objects.create(
+            title=title, company='Acme', location=location, description='d', requirements='r',
+            recruiter=cls.recruiter, latitude=lat, longitude=lon,
+        )
+
+    async def test_geocode_job_saves_coordinates(self):
+        job = await Job.objects.acreate(
+            title='New Posting', company='Acme', location='Atlanta, GA', description='d', requirements='r',
+            recruiter=self.recruiter,
+        )
+
+        response = await self.async_client.post(reverse('jobs:geocode_job', args=[job.pk]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['latitude'], 33.749)
+        await job.arefresh_from_db()
+        self.assertAlmostEqual(float(job.latitude), 33.749)
+
+    async def test_geocode_job_reports_unknown_locations(self):
+        job = await Job.objects.acreate(
+            title='Lost Posting', company='Acme', location='Atlantis', description='d', requirements='r',
+            recruiter=self.recruiter,
+        )
+
+        response = await self.async_client.post(reverse('jobs:geocode_job', args=[job.pk]))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual((await self.async_client.post(reverse('jobs:geocode_job', args=[0]))).status_code, 404)
+
+    def test_map_centres_on_the_geocoded_profile_location(self):
+        self.client.force_login(self.seeker)
+
+        response = self.client.get(reverse('jobs:map'))
+
+        self.assertEqual(response.context['user_lat'], 33.749)
+        self.assertEqual(response.context['jobs_count'], 2)
+        self.assertEqual(self.geocoder.queries, ['Atlanta, GA'])
+
+    def test_map_requires_login(self):
+        response = self.client.get(reverse('jobs:map'))
+
+        self.assertRedirects(response, f"{settings.LOGIN_URL}?next={reverse('jobs:map')}", fetch_redirect_response=False)
+
+    def test_commute_filter_keeps_jobs_within_the_radius(self):
+        self.client.force_login(self.seeker)
+
+        response = self.client.get(reverse('jobs:index'), {'enable_commute_filter': 'on', 'commute_radius': 25})
+
+        self.assertTrue(response.context['commute_filter_applied'])
+        self.assertEqual(list(response.context['jobs']), [self.near])
@@ -0,0 +1,133 @@
+import threading
+import time
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from jobs.geocoders import GeocoderBackend, get_geocoder
+from jobs.models import Job
+from jobs.utils import TokenBucket, geocode_job_locations, geocode_locations
+
+
+User = get_user_model()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class RecordingGeocoder(GeocoderBackend):
+    """Geocoder backend that records lookups and optionally waits."""
+
+    def __init__(self, delay=0, unknown=()):
+        self.delay = delay
+        self.unknown = set(unknown)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def geocode(self, location_string, limiter=None):
+        if limiter is not None:
+            limiter.acquire()
+        with self._lock:
+            self.calls.append(location_string)
+        time.sleep(self.delay)
+        if location_string in self.unknown:
+            return (None, None), False
+        return (33.749, -84.388), True
+
+
+def recording_geocoder(**options):
+    """A cached ``RecordingGeocoder`` configuration; the instance is ``get_geocoder().backend``."""
+    return {
+        'BACKEND': 'jobs.geocoders.CachedBackend',
+        'OPTIONS': {'backend': {'BACKEND': f'{__name__}.RecordingGeocoder', 'OPTIONS': options}},
+    }
+
+
+class TokenBucketTests(SimpleTestCase):
+    def test_requests_are_spaced_by_the_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(2, clock=clock, sleep=clock.sleep)
+
+        for _ in range(5):
+            bucket.acquire()
+
+        # The first request goes out at once, the next four wait half a second each
+        self.assertAlmostEqual(clock.now, 2.0)
+
+    def test_zero_rate_never_waits(self):
+        clock = FakeClock()
+        bucket = TokenBucket(0, clock=clock, sleep=clock.sleep)
+
+        for _ in range(100):
+            bucket.acquire()
+
+        self.assertEqual(clock.now, 0)
+
+
+@override_settings(GEOCODER=recording_geocoder())
+class GeocodeLocationsTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        get_geocoder().backend.calls.clear()
+
+    def test_duplicates_are_looked_up_once(self):
+        remote = get_geocoder().backend
+        result = geocode_locations(['Atlanta, GA', ' atlanta,  ga', 'Austin, TX', 'Atlanta, GA'], rate=0)
+
+        self.assertEqual(sorted(remote.calls), ['Atlanta, GA', 'Austin, TX'])
+        self.assertEqual(result[' atlanta,  ga'], (33.749, -84.388))
+
+    def test_lookups_run_concurrently(self):
+        started = time.perf_counter()
+        with self.settings(GEOCODER=recording_geocoder(delay=0.2)):
+            remote = get_geocoder().backend
+            geocode_locations([f'City {n}' for n in range(8)], concurrency=8, rate=0)
+
+        self.assertEqual(len(remote.calls), 8)
+        self.assertLess(time.perf_counter() - started, 1)
+
+
+@override_settings(GEOCODER=recording_geocoder(unknown=['Atlantis']))
+class GeocodeJobLocationsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        for title, location in [('A', 'Atlanta, GA'), ('B', 'atlanta, GA'), ('C', 'Atlantis'), ('D', 'Remote')]:
+            Job.objects.create(
+                title=title, company='Acme', location=location, description='d', requirements='r',
+                recruiter=recruiter,
+            )
+
+    def setUp(self):
+        cache.clear()
+        get_geocoder().backend.calls.clear()
+
+    def test_distinct_locations_are_geocoded_once_and_bulk_updated(self):
+        remote = get_geocoder().backend
+        with self.assertNumQueries(2):
+            count = geocode_job_locations(rate=0, log=lambda message: None)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(sorted(call.casefold() for call in remote.calls), ['atlanta, ga', 'atlantis'])
+        self.assertEqual(Job.objects.filter(latitude__isnull=False).count(), 2)
+        self.assertFalse(Job.objects.get(title='C').has_coordinates())
+
+    def test_dry_run_command_reports_without_geocoding(self):
+        out = StringIO()
+        remote = get_geocoder().backend
+        call_command('geocode_jobs', '--dry-run', stdout=out)
+
+        self.assertIn('3 job(s) need coordinates across 2 distinct location(s)', out.getvalue())
+        self.assertEqual(remote.calls, [])
+        self.assertFalse(Job.objects.filter(latitude__isnull=False).exists())
@@ -0,0 +1,64 @@
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from jobs.gazetteer import clean_location, gazetteer_lookup, get_gazetteer
+from jobs.tests.geocoder_stand_in import GeocoderStandInMixin
+from jobs.utils import geocode_location
+
+
+ATLANTA = (33.749, -84.388)
+
+
+class GazetteerLookupTests(SimpleTestCase):
+    def test_city_spellings_resolve_to_the_same_place(self):
+        for spelling in ['Atlanta, GA', 'atlanta georgia', '  Atlanta ,  Ga ', 'Atlanta, GA 30303, USA', 'Atlanta']:
+            with self.subTest(spelling=spelling):
+                self.assertEqual(gazetteer_lookup(spelling), ATLANTA)
+
+    def test_abbreviated_prefixes_and_dc(self):
+        self.assertEqual(gazetteer_lookup('St. Louis, MO'), gazetteer_lookup('Saint Louis, Missouri'))
+        self.assertEqual(gazetteer_lookup('Washington, D.C.'), gazetteer_lookup('Washington DC'))
+        # Washington the state or the city
+        self.assertIsNone(gazetteer_lookup('Washington'))
+
+    def test_states_and_ambiguous_cities(self):
+        self.assertEqual(gazetteer_lookup('GA'), gazetteer_lookup('Georgia'))
+        self.assertEqual(gazetteer_lookup('Portland'), gazetteer_lookup('Portland, OR'))
+        self.assertEqual(gazetteer_lookup('New York'), gazetteer_lookup('New York, NY'))
+        self.assertEqual(gazetteer_lookup('New York'), (40.7128, -74.006))
+        self.assertNotEqual(gazetteer_lookup('NY'), gazetteer_lookup('New York'))
+        self.assertNotEqual(gazetteer_lookup('Portland, ME'), gazetteer_lookup('Portland, OR'))
+
+    def test_unknown_places_are_misses(self):
+        for location in ['Smallville, KS', 'Atlanta, TX', 'Remote', '', None]:
+            with self.subTest(location=location):
+                self.assertIsNone(gazetteer_lookup(location))
+
+    def test_clean_location(self):
+        self.assertEqual(clean_location('Ft. Worth, TX 76102-1234, United States'), 'ft worth tx')
+
+
+class GazetteerGeocodeTests(GeocoderStandInMixin, SimpleTestCase):
+    geocoder_responses = {'Smallville, KS': [{'lat': '35.0', 'lon': '-80.0'}]}
+    geocoder_gazetteer = True
+
+    def test_listed_locations_never_reach_the_geocoder(self):
+        self.assertEqual(geocode_location('Atlanta, GA'), ATLANTA)
+
+        self.assertEqual(self.geocoder.queries, [])
+
+    def test_misses_fall_back_to_the_geocoder(self):
+        self.assertEqual(geocode_location('Smallville, KS'), (35.0, -80.0))
+
+        self.assertEqual(self.geocoder.queries, ['Smallville, KS'])
+
+
+class LocationChoicesTests(TestCase):
+    def test_profile_search_offers_states_and_listed_cities(self):
+        response = self.client.get(reverse('profiles:index'))
+
+        choices = response.context['location_choices']
+        self.assertEqual(choices[:3], [('', 'All Locations'), ('Remote', 'Remote'), ('Alabama', 'Alabama')])
+        self.assertIn(('Washington DC', 'Washington DC'), choices)
+        self.assertIn(('Atlanta, GA', 'Atlanta, GA'), choices)
+        self.assertEqual(len(get_gazetteer().location_choices()), 70)
@@ -0,0 +1,183 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from jobs.geocode_queue import claim_geocode_batch, process_geocode_batch, run_geocode_queue
+from jobs.models import GeocodeRequest, Job
+from jobs.tests.geocoder_stand_in import GeocoderStandInMixin
+from profiles.models import Profile
+
+
+User = get_user_model()
+
+PLACES = {
+    'Atlanta, GA': [{'lat': '33.749', 'lon': '-84.388'}],
+    'Seattle, WA': [{'lat': '47.6062', 'lon': '-122.3321'}],
+}
+
+
+class GeocodeQueueTests(GeocoderStandInMixin, TestCase):
+    geocoder_responses = PLACES
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+        cls.seeker = User.objects.create_user('sam', 'sam@example.com', 'password123')
+
+    def _job(self, location='Atlanta, GA', **fields):
+        return Job.objects.create(
+            title='Engineer', company='Acme', location=location, description='d', requirements='r',
+            recruiter=self.recruiter, **fields,
+        )
+
+    def _queued(self):
+        return list(GeocodeRequest.objects.values_list('target', 'location', 'status'))
+
+    def test_new_jobs_without_coordinates_are_queued(self):
+        self._job()
+        self._job('Seattle, WA', latitude=Decimal('47.6'), longitude=Decimal('-122.3'))
+        self._job('Remote')
+
+        self.assertEqual(self._queued(), [('job', 'Atlanta, GA', 'pending')])
+        self.assertEqual(self.geocoder.queries, [])
+
+    def test_location_changes_are_queued_once(self):
+        job = self._job('Remote')
+        job = Job.objects.get(pk=job.pk)
+        job.title = 'Senior Engineer'
+        job.save()
+        self.assertEqual(self._queued(), [])
+
+        job.location = 'Atlanta, GA'
+        job.save()
+        job.location = 'Seattle, WA'
+        job.save()
+
+        self.assertEqual(self._queued(), [('job', 'Seattle, WA', 'pending')])
+
+    def test_a_new_pin_with_the_new_location_is_kept(self):
+        job = Job.objects.get(pk=self._job('Seattle, WA', latitude=Decimal('47.6'), longitude=Decimal('-122.3')).pk)
+
+        job.location = 'Atlanta, GA'
+        job.latitude, job.longitude = Decimal('33.75'), Decimal('-84.39')
+        job.save()
+
+        self.assertEqual(self._queued(), [])
+
+    def test_worker_geocodes_jobs_and_profiles_in_one_batch(self):
+        first, second = self._job(), self._job(' atlanta,  ga')
+        profile = Profile.objects.create(user=self.seeker, headline='Engineer', skills='Python', location='Seattle, WA')
+
+        with self.assertNumQueries(11):
+            # Claim (select, update, fetch), load jobs and update them once per distinct
+            # location (two spellings here), load and update the profile, then delete the
+            # finished requests inside a savepoint pair
+            geocoded, failed = process_geocode_batch(claim_geocode_batch(), rate=0)
+
+        self.assertEqual((geocoded, failed), (3, 0))
+        self.assertEqual(sorted(query.casefold() for query in self.geocoder.queries), ['atlanta, ga', 'seattle, wa'])
+        for obj in (first, second, profile):
+            obj.refresh_from_db()
+        self.assertEqual(first.get_coordinates(), (33.749, -84.388))
+        self.assertEqual(second.get_coordinates(), (33.749, -84.388))
+        self.assertEqual(profile.get_coordinates(), (47.6062, -122.3321))
+        self.assertFalse(GeocodeRequest.objects.exists())
+
+    def test_stale_requests_are_dropped_and_misses_marked_failed(self):
+        job = self._job('Atlantis')
+        claimed = claim_geocode_batch()
+        # The location changes while the worker holds the old request
+        Job.objects.filter(pk=job.pk).update(location='Seattle, WA')
+        self._job('Smallville, KS')
+
+        self.assertEqual(process_geocode_batch(claimed, rate=0), (0, 0))
+        self.assertEqual(process_geocode_batch(claim_geocode_batch(), rate=0), (0, 1))
+        failed = GeocodeRequest.objects.get()
+        self.assertEqual((failed.location, failed.status, failed.attempts), ('Smallville, KS', 'failed', 1))
+
+    def test_moving_to_remote_clears_coordinates(self):
+        job = Job.objects.get(pk=self._job(latitude=Decimal('33.7'), longitude=Decimal('-84.3')).pk)
+        job.location = 'Remote'
+        job.save()
+
+        self.assertEqual(self._queued(), [])
+        job.refresh_from_db()
+        self.assertFalse(job.has_coordinates())
+
+    def test_a_move_clears_the_old_coordinates_until_geocoded(self):
+        profile = Profile.objects.create(
+            user=self.seeker, headline='Engineer', skills='Python', location='Atlanta, GA',
+            latitude=Decimal('33.749'), longitude=Decimal('-84.388'),
+        )
+        profile = Profile.objects.get(pk=profile.pk)
+        profile.location = 'Smallville, KS'
+        profile.save()
+
+        profile.refresh_from_db()
+        self.assertFalse(profile.has_coordinates())
+        self.assertEqual(run_geocode_queue(rate=0), (1, 0, 1))
+        self.assertEqual(self._queued(), [('profile', 'Smallville, KS', 'failed')])
+        profile.refresh_from_db()
+        self.assertFalse(profile.has_coordinates())
+
+    def test_changes_saved_after_the_objects_are_read_are_kept(self):
+        moved, pinned = self._job(), self._job()
+        read = QuerySet.in_bulk
+
+        def read_then_change(queryset, *args, **kwargs):
+            objects = read(queryset, *args, **kwargs)
+            # Saved by someone else before the worker writes its result
+            Job.objects.filter(pk=moved.pk).update(location='Seattle, WA')
+            Job.objects.filter(pk=pinned.pk).update(latitude=Decimal('33.8'), longitude=Decimal('-84.4'))
+            return objects
+
+        with mock.patch.object(QuerySet, 'in_bulk', autospec=True, side_effect=read_then_change):
+            self.assertEqual(process_geocode_batch(claim_geocode_batch(), rate=0), (0, 0))
+
+        moved.refresh_from_db()
+        pinned.refresh_from_db()
+        self.assertFalse(moved.has_coordinates())
+        self.assertEqual(pinned.get_coordinates(), (33.8, -84.4))
+        self.assertFalse(GeocodeRequest.objects.exists())
+
+    def test_failed_requests_clear_coordinates_saved_meanwhile(self):
+        job = self._job('Smallville, KS')
+        # e.g. written by an older code path that skipped the signal
+        Job.objects.filter(pk=job.pk).update(latitude=Decimal('33.7'), longitude=Decimal('-84.3'))
+
+        self.assertEqual(process_geocode_batch(claim_geocode_batch(), rate=0), (0, 1))
+        job.refresh_from_db()
+        self.assertFalse(job.has_coordinates())
+
+    def test_requests_abandoned_by_a_crashed_worker_are_claimed_again(self):
+        self._job()
+        self.assertEqual(len(claim_geocode_batch()), 1)
+        self.assertEqual(claim_geocode_batch(), [])
+
+        GeocodeRequest.objects.update(updated_at=timezone.now() - timedelta(hours=1))
+        reclaimed = claim_geocode_batch()
+
+        self.assertEqual([request.attempts for request in reclaimed], [2])
+        self.assertEqual(process_geocode_batch(reclaimed, rate=0), (1, 0))
+
+    def test_command_drains_the_queue(self):
+        self._job()
+        out = StringIO()
+
+        call_command('run_geocode_queue', '--once', '--rate', '0', stdout=out)
+
+        self.assertIn('Geocoded 1 of 1 queued location(s)', out.getvalue())
+        self.assertFalse(Job.objects.filter(latitude__isnull=True).exists())
+
+    @override_settings(GEOCODE_ON_SAVE=False)
+    def test_queueing_can_be_turned_off(self):
+        self._job()
+
+        self.assertFalse(GeocodeRequest.objects.exists())
@@ -0,0 +1,110 @@
+import asyncio
+import time
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+from jobs.geocoders import (
+    FAILED, NOT_FOUND, CachedBackend, ChainedBackend, GazetteerBackend, NominatimBackend, get_geocoder,
+)
+from jobs.tests.geocoder_stand_in import GeocoderStandIn, GeocoderStandInMixin
+
+
+RESPONSES = {
+    'Smallville, KS': [{'lat': '39.0', 'lon': '-95.0'}],
+    'Broken': {'status': 503},
+}
+
+
+class StandInTests(SimpleTestCase):
+    def test_bundled_responses_cover_the_load_data_cities(self):
+        from accounts.load_data import CITIES
+
+        with GeocoderStandIn() as stand_in:
+            backend = NominatimBackend(url=stand_in.url, timeout=5)
+            for location, lat, lon, _ in CITIES:
+                with self.subTest(location=location):
+                    coordinates, found = backend.geocode(location)
+                    self.assertTrue(found)
+                    self.assertAlmostEqual(coordinates[0], lat, places=2)
+                    self.assertAlmostEqual(coordinates[1], lon, places=2)
+
+    def test_errors_and_unknown_places(self):
+        with GeocoderStandIn(RESPONSES) as stand_in:
+            backend = NominatimBackend(url=stand_in.url, timeout=5)
+
+            with self.assertLogs('jobs.geocoders', 'WARNING'):
+                self.assertEqual(backend.geocode('Broken'), FAILED)
+            self.assertEqual(backend.geocode('Atlantis'), NOT_FOUND)
+            self.assertEqual(stand_in.queries, ['Broken', 'Atlantis'])
+
+    async def test_async_lookups_share_a_client_per_event_loop(self):
+        with GeocoderStandIn(RESPONSES) as stand_in:
+            backend = NominatimBackend(url=stand_in.url, timeout=5)
+            async with backend._client() as client:
+                self.assertEqual(await backend.ageocode('Smallville, KS'), ((39.0, -95.0), True))
+                self.assertEqual(await backend.ageocode('Atlantis'), NOT_FOUND)
+                self.assertIs(backend._client(), client)
+
+    async def test_async_lookups_are_rate_limited(self):
+        with GeocoderStandIn(RESPONSES) as stand_in:
+            backend = NominatimBackend(url=stand_in.url, timeout=5, rate=20)
+            async with backend._client():
+                started = time.perf_counter()
+                await asyncio.gather(*(backend.ageocode('Smallville, KS') for _ in range(5)))
+                elapsed = time.perf_counter() - started
+
+        # The first lookup goes out at once, the next four wait 50 ms each
+        self.assertGreaterEqual(elapsed, 0.19)
+        self.assertEqual(len(stand_in.queries), 5)
+
+
+class CachedChainTests(GeocoderStandInMixin, SimpleTestCase):
+    geocoder_responses = RESPONSES
+    geocoder_gazetteer = True
+
+    def test_configuration_builds_the_backend_tree(self):
+        chain = get_geocoder()
+
+        self.assertIsInstance(chain, ChainedBackend)
+        self.assertIsInstance(chain.backends[0], GazetteerBackend)
+        self.assertIsInstance(chain.backends[1], CachedBackend)
+        self.assertEqual(chain.backends[1].backend.url, self.geocoder.url)
+
+    def test_answers_come_from_the_first_backend_that_finds_the_place(self):
+        chain = get_geocoder()
+
+        self.assertEqual(chain.geocode('Atlanta, GA'), ((33.749, -84.388), True))
+        self.assertEqual(chain.geocode('Smallville, KS'), ((39.0, -95.0), True))
+        self.assertEqual(chain.geocode('smallville,  ks'), ((39.0, -95.0), True))
+        self.assertEqual(self.geocoder.queries, ['Smallville, KS'])
+
+    def test_failures_are_not_cached(self):
+        chain = get_geocoder()
+
+        with self.assertLogs('jobs.geocoders', 'WARNING'):
+            self.assertEqual(chain.geocode('Broken'), FAILED)
+            self.assertEqual(chain.geocode('Broken'), FAILED)
+        self.assertEqual(chain.geocode('Atlantis'), NOT_FOUND)
+        self.assertEqual(chain.geocode('Atlantis'), NOT_FOUND)
+        self.assertEqual(self.geocoder.queries, ['Broken', 'Broken', 'Atlantis'])
+
+    async def test_async_lookups_share_the_cache(self):
+        chain = get_geocoder()
+
+        self.assertEqual(await chain.ageocode('Smallville, KS'), ((39.0, -95.0), True))
+        self.assertEqual(chain.geocode('Smallville, KS'), ((39.0, -95.0), True))
+        self.assertEqual(self.geocoder.queries, ['Smallville, KS'])
+
+
+class GeocoderSettingTests(SimpleTestCase):
+    def test_default_preset_is_the_gazetteer_then_cached_nominatim(self):
+        self.assertEqual(settings.GEOCODER_PRESETS['chained']['OPTIONS']['backends'][1],
+                         settings.GEOCODER_PRESETS['nominatim'])
+
+    def test_changing_the_setting_rebuilds_the_backend(self):
+        with override_settings(GEOCODER=settings.GEOCODER_PRESETS['gazetteer']):
+            self.assertIsInstance(get_geocoder(), GazetteerBackend)
+            self.assertEqual(get_geocoder().geocode('Smallville, KS'), NOT_FOUND)
+        with override_settings(GEOCODER=settings.GEOCODER_PRESETS['nominatim']):
+            self.assertIsInstance(get_geocoder(), CachedBackend)
@@ -0,0 +1,145 @@
+import csv
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from jobs.importers import import_jobs, iter_feed_records
+from jobs.models import GeocodeRequest, Job
+
+
+User = get_user_model()
+
+CSV_FEED = """external_id,title,company,location,description,requirements,skills_required,visa_sponsorship
+ext-1,Backend Engineer,Acme Corp,"Atlanta, GA",Build APIs,Python,"Python, Django",yes
+ext-2,Data Analyst,Acme Corp,Remote,Crunch numbers,SQL,SQL,no
+,Frontend Engineer,Globex,"Austin, TX",Build UIs,React,React,
+ext-3,,Acme Corp,"Atlanta, GA",Missing title,Python,,
+"""
+
+
+class JobImportTests(TestCase):
+    def setUp(self):
+        self.recruiter = User.objects.create_user('rita', 'rita@example.com', 'password123')
+
+    def _import_csv(self, feed, **kwargs):
+        records = iter_feed_records(io.BytesIO(feed.encode()), 'csv')
+        return import_jobs(records, recruiter=self.recruiter, **kwargs)
+
+    def test_import_creates_valid_rows_and_reports_invalid(self):
+        stats = self._import_csv(CSV_FEED)
+
+        self.assertEqual(stats['created'], 3)
+        self.assertEqual(stats['invalid'], 1)
+        self.assertEqual(stats['errors'][0]['row'], 4)
+        job = Job.objects.get(external_id='ext-1')
+        self.assertTrue(job.visa_sponsorship)
+        self.assertEqual(job.status, 'active')
+        self.assertEqual(job.company_key, 'acme corp')
+        self.assertEqual(job.recruiter, self.recruiter)
+        # Remote postings are never queued for geocoding
+        self.assertEqual(len(stats['needs_geocoding']), 2)
+        self.assertEqual(GeocodeRequest.objects.filter(target='job').count(), 2)
+
+    def test_reimport_updates_by_external_id_and_keeps_coordinates(self):
+        self._import_csv(CSV_FEED)
+        Job.objects.filter(external_id='ext-1').update(latitude=33.7490, longitude=-84.3880)
+
+        stats = self._import_csv(CSV_FEED.replace('Build APIs', 'Build better APIs'))
+
+        self.assertEqual(stats['updated'], 2)
+        self.assertEqual(Job.objects.filter(external_id='ext-1').count(), 1)
+        job = Job.objects.get(external_id='ext-1')
+        self.assertEqual(job.description, 'Build better APIs')
+        self.assertTrue(job.has_coordinates())
+
+    def test_update_only_writes_given_columns(self):
+        self._import_csv(CSV_FEED)
+        other = User.objects.create_user('otto', 'otto@example.com', 'password123')
+        Job.objects.filter(external_id='ext-1').update(status='closed', benefits='Dental', recruiter=other)
+
+        stats = import_jobs([{'external_id': 'ext-1', 'description': 'Build better APIs'}], recruiter=self.recruiter)
+
+        self.assertEqual(stats['updated'], 1)
+        job = Job.objects.get(external_id='ext-1')
+        self.assertEqual(job.description, 'Build better APIs')
+        self.assertEqual(job.title, 'Backend Engineer')
+        self.assertEqual(job.status, 'closed')
+        self.assertEqual(job.benefits, 'Dental')
+        self.assertEqual(job.recruiter, other)
+
+    def test_update_keeps_company_key_in_sync(self):
+        self._import_csv(CSV_FEED)
+
+        import_jobs([{'external_id': 'ext-1', 'company': '  Globex  Corporation '}], recruiter=self.recruiter)
+
+        self.assertEqual(Job.objects.get(external_id='ext-1').company_key, 'globex corporation')
+
+    def test_unknown_recruiter_is_a_row_error(self):
+        stats = import_jobs([{
+            'external_id': 'j-1', 'title': 'SRE', 'company': 'Initech', 'location': 'Remote',
+            'description': 'Keep it up', 'requirements': 'Linux', 'recruiter': 'nobody',
+        }], recruiter=self.recruiter)
+
+        self.assertEqual(stats['created'], 0)
+        self.assertEqual(stats['invalid'], 1)
+        self.assertIn('recruiter', stats['errors'][0]['errors'])
+        self.assertFalse(Job.objects.filter(external_id='j-1').exists())
+
+    def test_batches_use_bulk_queries(self):
+        feed = 'external_id,title,company,location,description,requirements\n' + ''.join(
+            f'ext-{i},Job {i},Acme,"Atlanta, GA",Build,Python\n' for i in range(50)
+        )
+
+        with self.assertNumQueries(6 * 5):
+            # Per batch: existing lookup, a bulk insert and the geocode queue's delete and
+            # insert inside a savepoint pair
+            stats = self._import_csv(feed, batch_size=10)
+
+        self.assertEqual(stats['created'], 50)
+
+    def test_command_reads_json_lines(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as feed:
+            feed.write(json.dumps({
+                'external_id': 'j-1', 'title': 'SRE', 'company': 'Initech', 'location': 'Remote',
+                'description': 'Keep it up', 'requirements': 'Linux', 'recruiter': 'rita',
+            }) + '\n')
+        self.addCleanup(os.remove, feed.name)
+
+        call_command('import_jobs', feed.name, stdout=io.StringIO())
+
+        self.assertTrue(Job.objects.filter(external_id='j-1', recruiter=self.recruiter).exists())
+
+    def test_admin_upload(self):
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password123')
+        self.client.force_login(admin_user)
+
+        response = self.client.post(reverse('admin:jobs_job_import'), {
+            'feed': SimpleUploadedFile('feed.csv', CSV_FEED.encode(), content_type='text/csv'),
+        })
+
+        self.assertRedirects(response, reverse('admin:jobs_job_changelist'))
+        self.assertEqual(Job.objects.filter(recruiter=admin_user).count(), 3)
+
+    def test_admin_upload_of_unreadable_feed_shows_form_error(self):
+        admin_user = User.objects.create_superuser('admin', 'admin@example.com', 'password123')
+        self.client.force_login(admin_user)
+
+        response = self.client.post(reverse('admin:jobs_job_import'), {
+            'feed': SimpleUploadedFile('feed.csv', b'title,company\n\xff\xfe,Acme\n', content_type='text/csv'),
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Could not read feed', str(response.context['form'].errors['feed']))
+
+    def test_malformed_csv_raises_value_error(self):
+        feed = 'title,description\nSRE,' + 'x' * (csv.field_size_limit() + 1) + '\n'
+
+        with self.assertRaises(ValueError):
+            list(iter_feed_records(io.StringIO(feed), 'csv'))
@@ -1,83 +1,223 @@
-import requests
+import asyncio
 import json
 import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
 from django.db.models import Q
+from django.utils import timezone
+
+from hirebuzz.metrics import RECOMMENDATION_TIME
+from jobs.geocoders import get_geocoder, normalize_location
+
 
+def _skip_geocoding(location_string):
+    return not location_string or location_string.lower() in ['remote', 'anywhere']
 
-def geocode_location(location_string):
+
+def geocode_location(location_string, limiter=None):
     """
     Convert a location string to latitude and longitude coordinates.
-    Uses OpenStreetMap Nominatim API (free, no API key required).
+    Uses the backend configured by ``settings.GEOCODER`` (``jobs.geocoders``):
+    by default common US cities and states come from the offline gazetteer
+    and anything else from OpenStreetMap Nominatim API (free, no API key
+    required), with answers cached per normalized location.
     
     Args:
         location_string (str): Location string like "Atlanta, GA" or "New York, NY"
+        limiter (TokenBucket): Optional rate limit applied to network requests
+            only, so cache hits are never delayed
     
     Returns:
         tuple: (latitude, longitude) or (None, None) if geocoding fails
     """
-    if not location_string or location_string.lower() in ['remote', 'anywhere']:
+    if _skip_geocoding(location_string):
         return None, None
-    
-    try:
-        # Use OpenStreetMap Nominatim API (free)
-        url = "https://nominatim.openstreetmap.org/search"
-        params = {
-            'q': location_string,
-            'format': 'json',
-            'limit': 1,
-            'addressdetails': 1
-        }
-        headers = {
-            'User-Agent': 'HireBuzz/1.0 (Job Board Application)'
-        }
-        
-        response = requests.get(url, params=params, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if data and len(data) > 0:
-            result = data[0]
-            lat = float(result['lat'])
-            lon = float(result['lon'])
-            return lat, lon
-            
-    except (requests.RequestException, ValueError, KeyError, IndexError) as e:
-        print(f"Geocoding error for '{location_string}': {e}")
-    
-    return None, None
+    coordinates, _ = get_geocoder().geocode(location_string, limiter=limiter)
+    return coordinates
 
 
-def geocode_job_locations():
+async def ageocode_location(location_string):
     """
-    Geocode all jobs that don't have coordinates yet.
-    This is a utility function to populate existing jobs with coordinates.
+    Async version of ``geocode_location`` for async views.
+
+    Goes through the same backend, but network lookups wait without holding
+    a thread, so one ASGI worker can have many of them in flight.
+
+    Args:
+        location_string (str): Location string like "Atlanta, GA" or "New York, NY"
+
+    Returns:
+        tuple: (latitude, longitude) or (None, None) if geocoding fails
+    """
+    if _skip_geocoding(location_string):
+        return None, None
+    coordinates, _ = await get_geocoder().ageocode(location_string)
+    return coordinates
+
+
+def location_coordinates(obj):
+    """
+    Coordinates of a job or profile location.
+
+    Uses the coordinates saved by the geocode queue when present and only
+    asks the geocoder otherwise (e.g. while the object's request is pending).
+
+    Args:
+        obj: Job or Profile instance
+
+    Returns:
+        tuple: (latitude, longitude) or (None, None) if geocoding fails
+    """
+    coordinates = obj.get_coordinates()
+    if coordinates is not None:
+        return coordinates
+    return geocode_location(obj.location)
+
+
+async def alocation_coordinates(obj):
+    """Async version of ``location_coordinates`` for async views."""
+    coordinates = obj.get_coordinates()
+    if coordinates is not None:
+        return coordinates
+    return await ageocode_location(obj.location)
+
+
+class TokenBucket:
     """
+    Thread-safe token bucket allowing ``rate`` requests per second.
+
+    Up to ``capacity`` requests may go out back to back after an idle spell;
+    after that ``acquire`` blocks until the next token is due, and
+    ``aacquire`` waits for it on the event loop. A ``rate`` of None or 0
+    means no limit.
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """Take a token if one is available, otherwise return the seconds until the next one."""
+        with self._lock:
+            now = self._clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        if not self.rate:
+            return
+        # Sleep outside the lock so other workers can queue behind the next token
+        while wait := self._take():
+            self._sleep(wait)
+
+    async def aacquire(self):
+        if not self.rate:
+            return
+        while wait := self._take():
+            await asyncio.sleep(wait)
+
+
+def geocode_locations(locations, concurrency=None, rate=None):
+    """
+    Geocode several location strings, each distinct location only once.
+
+    Strings that differ only in case or spacing are looked up together.
+    Lookups run on a pool of ``concurrency`` threads, and requests that miss
+    the cache share one ``rate`` limit.
+
+    Args:
+        locations (iterable): Location strings
+        concurrency (int): Worker threads (default ``GEOCODER_BATCH_CONCURRENCY``)
+        rate (float): Geocoder requests per second, 0 for no limit
+            (default ``GEOCODER_RATE_LIMIT``)
+
+    Returns:
+        dict: Each input string mapped to (latitude, longitude), which are
+            None when it could not be geocoded
+    """
+    if concurrency is None:
+        concurrency = settings.GEOCODER_BATCH_CONCURRENCY
+    if rate is None:
+        rate = settings.GEOCODER_RATE_LIMIT
+    unique = {}
+    for location in locations:
+        unique.setdefault(normalize_location(location), location)
+
+    limiter = TokenBucket(rate)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        resolved = dict(zip(unique, pool.map(lambda location: geocode_location(location, limiter), unique.values())))
+    return {location: resolved[normalize_location(location)] for location in locations}
+
+
+def jobs_needing_coordinates():
+    """Jobs without coordinates whose location can be geocoded."""
     from jobs.models import Job
-    
-    jobs_without_coords = Job.objects.filter(
+
+    return Job.objects.filter(
         latitude__isnull=True,
         longitude__isnull=True
     ).exclude(
         Q(location__isnull=True) | Q(location='') | Q(location__in=['Remote', 'remote', 'Anywhere', 'anywhere'])
     )
-    
-    geocoded_count = 0
-    
-    for job in jobs_without_coords:
-        lat, lon = geocode_location(job.location)
+
+
+def geocode_job_locations(concurrency=None, rate=None, dry_run=False, batch_size=500, log=print):
+    """
+    Geocode all jobs that don't have coordinates yet.
+    This is a utility function to populate existing jobs with coordinates.
+
+    Distinct locations are geocoded once each (see ``geocode_locations``)
+    and coordinates are written back with ``bulk_update``.
+
+    Args:
+        concurrency (int): Worker threads for the lookups
+        rate (float): Geocoder requests per second, 0 for no limit
+        dry_run (bool): Only report the jobs and distinct locations to geocode;
+            nothing is looked up or saved
+        batch_size (int): Rows per UPDATE statement
+        log (callable): Receives progress messages
+
+    Returns:
+        int: Number of jobs given coordinates
+    """
+    from jobs.models import Job
+
+    jobs = list(jobs_needing_coordinates().only('id', 'title', 'location'))
+    locations = {}
+    for job in jobs:
+        locations.setdefault(normalize_location(job.location), job.location)
+    log(f"{len(jobs)} job(s) need coordinates across {len(locations)} distinct location(s)")
+    if dry_run or not jobs:
+        return 0
+
+    coordinates = geocode_locations([job.location for job in jobs], concurrency=concurrency, rate=rate)
+    now = timezone.now()
+    geocoded = []
+    for job in jobs:
+        lat, lon = coordinates[job.location]
         if lat is not None and lon is not None:
             job.latitude = lat
             job.longitude = lon
-            job.save()
-            geocoded_count += 1
-            print(f"Geocoded: {job.title} at {job.location} -> ({lat}, {lon})")
-        else:
-            print(f"Failed to geocode: {job.title} at {job.location}")
-    
-    print(f"Successfully geocoded {geocoded_count} jobs")
-    return geocoded_count
+            job.updated_at = now
+            geocoded.append(job)
+    Job.objects.bulk_update(geocoded, ['latitude', 'longitude', 'updated_at'], batch_size=batch_size)
+
+    failed = sorted({job.location for job in jobs if coordinates[job.location][0] is None})
+    for location in failed:
+        log(f"Failed to geocode: {location}")
+    return len(geocoded)
 
 
 def calculate_distance(lat1, lon1, lat2, lon2):
@@ -190,6 +330,7 @@ def calculate_skill_match_score(profile_skills, job_skills):
     }
 
 
+@RECOMMENDATION_TIME.time(kind='jobs')
 def get_job_recommendations(user_profile, limit=20):
     """
     Get personalized job recommendations for a job seeker based on their skills.
@@ -238,6 +379,7 @@ def get_job_recommendations(user_profile, limit=20):
     return recommendations[:limit]
 
 
+@RECOMMENDATION_TIME.time(kind='candidates')
 def get_candidate_recommendations(job, limit=20):
     """
     Get candidate recommendations for a recruiter's job posting based on skill matching.
@@ -262,7 +404,7 @@ def get_candidate_recommendations(job, limit=20):
     candidates = Profile.objects.filter(
         is_public=True,
         user__in=job_seeker_users
-    )
+    ).select_related('user')
     
     # Get job skills
     job_skills = job.get_skills_list()
@@ -272,13 +414,13 @@ def get_candidate_recommendations(job, limit=20):
         return []
     
     # Get candidates who have already applied (to exclude them)
-    existing_applicants = Application.objects.filter(job=job).values_list('user', flat=True)
+    existing_applicants = set(Application.objects.filter(job=job).values_list('user', flat=True))
     
     recommendations = []
     
     for candidate in candidates:
         # Skip if candidate has already applied
-        if candidate.user.id in existing_applicants:
+        if candidate.user_id in existing_applicants:
             continue
         
         # Get candidate skills
@@ -1,16 +1,75 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
+from django.contrib.auth.views import redirect_to_login
 from django.contrib import messages
-from django.db.models import Q
-from django.http import JsonResponse
+from django.db.models import Count, Max, Q
+from django.http import Http404, JsonResponse
+from accounts.models import UserProfile
+from hirebuzz.caching import cache_anonymous_page, conditional_page, fragment_version
+from profiles.models import Profile
 from .models import Job
 from .forms import JobForm, JobSearchForm
-from .utils import geocode_location, get_job_recommendations, get_candidate_recommendations
+from .utils import (
+    ageocode_location, alocation_coordinates, filter_jobs_by_distance, get_job_recommendations,
+    get_candidate_recommendations, location_coordinates,
+)
+
+
+def _map_job_data(job):
+    """Job fields shown on the map and used by the commute filter."""
+    return {
+        'id': job.id,
+        'title': job.title,
+        'company': job.company,
+        'location': job.location,
+        'latitude': float(job.latitude),
+        'longitude': float(job.longitude),
+        'employment_type': job.get_employment_type_display(),
+        'work_type': job.get_work_type_display(),
+        'salary_display': job.get_salary_display(),
+        'url': job.get_absolute_url(),
+        'skills': job.get_skills_list()[:3],  # First 3 skills
+    }
+
+
+def _viewer_profile(user):
+    """The viewer's profile or None, cached on the user for the view and its template."""
+    try:
+        return user.profile
+    except Profile.DoesNotExist:
+        return None
+
+
+def _job_listing_version(request):
+    """Latest change and size of the active listings, plus the viewer's profile."""
+    listing = Job.objects.filter(status='active').aggregate(latest=Max('updated_at'), count=Count('id'))
+    version = (listing['latest'], listing['count'])
+    if request.user.is_authenticated:
+        # The listing and map show the viewer's profile location and commute radius;
+        # the template reads the same cached profile, so this costs no extra query
+        profile = _viewer_profile(request.user)
+        version += (profile and profile.updated_at,)
+    return version
+
+
+def _job_map_version(request):
+    if not request.user.is_authenticated:
+        return None
+    return _job_listing_version(request)
 
 
-def index(request):
-    """Display job listings with search and filter functionality."""
+@conditional_page(_job_listing_version, 'jobs:index')
+async def index(request):
+    """
+    Display job listings with search and filter functionality.
+
+    Async so the commute filter's geocoder call does not hold a worker thread.
+    """
+    user = await request.auser()
     form = JobSearchForm(request.GET)
+    enable_commute_filter = False
     jobs = Job.objects.filter(status='active')
 
     if form.is_valid():
@@ -86,33 +145,20 @@ def index(request):
 
     # Apply commute radius filtering if enabled
     commute_filter_applied = False
-    if request.user.is_authenticated and enable_commute_filter:
+    if user.is_authenticated and enable_commute_filter:
         try:
-            user_profile = request.user.profile
-            if user_profile.location:
-                from jobs.utils import geocode_location, filter_jobs_by_distance
-                user_lat, user_lon = geocode_location(user_profile.location)
+            user_profile = await sync_to_async(_viewer_profile)(user)
+            if user_profile and user_profile.location:
+                user_lat, user_lon = await alocation_coordinates(user_profile)
                 if user_lat and user_lon:
                     # Use form commute_radius or fall back to profile default
                     radius_to_use = commute_radius if commute_radius else user_profile.commute_radius
                     
                     # Convert jobs to list format for distance filtering
                     jobs_list = []
-                    for job in jobs:
+                    async for job in jobs:
                         if job.has_coordinates():
-                            jobs_list.append({
-                                'id': job.id,
-                                'title': job.title,
-                                'company': job.company,
-                                'location': job.location,
-                                'latitude': float(job.latitude),
-                                'longitude': float(job.longitude),
-                                'employment_type': job.get_employment_type_display(),
-                                'work_type': job.get_work_type_display(),
-                                'salary_display': job.get_salary_display(),
-                                'url': job.get_absolute_url(),
-                                'skills': job.get_skills_list()[:3],
-                            })
+                            jobs_list.append(_map_job_data(job))
                     
                     # Filter by distance
                     filtered_jobs = filter_jobs_by_distance(
@@ -133,15 +179,24 @@ def index(request):
         'search_form': form,
         'commute_filter_applied': commute_filter_applied,
     }
-    return render(request, 'jobs/index.html', context)
+    # Rendering evaluates the queryset, so it runs in a thread
+    return await sync_to_async(render)(request, 'jobs/index.html', context)
+
 
+def _job_version(request, pk):
+    return Job.objects.filter(pk=pk, status='active').values_list('updated_at', flat=True).first()
 
+
+@conditional_page(_job_version, 'jobs:detail')
+@cache_anonymous_page(_job_version, 'jobs:detail')
 def detail(request, pk):
     """Display job detail page."""
     job = get_object_or_404(Job, pk=pk, status='active')
     context = {
         'template_data': {'title': f'{job.title} at {job.company} - HireBuzz'},
         'job': job,
+        'job_version': fragment_version(job),
+        'fragment_cache_seconds': settings.FRAGMENT_CACHE_SECONDS,
     }
     return render(request, 'jobs/detail.html', context)
 
@@ -217,18 +272,21 @@ def delete_job(request, pk):
     return render(request, 'jobs/delete_job.html', context)
 
 
-@login_required
-def map_view(request):
+@conditional_page(_job_map_version, 'jobs:map')
+async def map_view(request):
     """Display jobs on an interactive map for job seekers."""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return redirect_to_login(request.get_full_path())
+
     # Only allow job seekers to view the map
-    try:
-        user_profile = request.user.user_profile
-        if not user_profile.is_job_seeker():
-            messages.warning(request, 'Only job seekers can view the job map.')
-            return redirect('jobs:index')
-    except:
+    account_profile = await UserProfile.objects.filter(user=user).afirst()
+    if account_profile is None:
         messages.warning(request, 'Please complete your profile setup first.')
         return redirect('profiles:create')
+    if not account_profile.is_job_seeker():
+        messages.warning(request, 'Only job seekers can view the job map.')
+        return redirect('jobs:index')
     
     # Get jobs with coordinates
     jobs_with_coords = Job.objects.filter(
@@ -238,21 +296,7 @@ def map_view(request):
     ).exclude(location__in=['Remote', 'remote', 'Anywhere', 'anywhere'])
     
     # Prepare job data for the map
-    jobs_data = []
-    for job in jobs_with_coords:
-        jobs_data.append({
-            'id': job.id,
-            'title': job.title,
-            'company': job.company,
-            'location': job.location,
-            'latitude': float(job.latitude),
-            'longitude': float(job.longitude),
-            'employment_type': job.get_employment_type_display(),
-            'work_type': job.get_work_type_display(),
-            'salary_display': job.get_salary_display(),
-            'url': job.get_absolute_url(),
-            'skills': job.get_skills_list()[:3],  # First 3 skills
-        })
+    jobs_data = [_map_job_data(job) async for job in jobs_with_coords]
     
     # Get user's location and commute radius from profile
     user_lat = None
@@ -261,18 +305,17 @@ def map_view(request):
     max_distance = request.GET.get('distance', None)  # Override from URL if provided
     
     # Get location and commute radius from user's profile
-    try:
-        user_profile = request.user.profile
+    user_profile = await sync_to_async(_viewer_profile)(user)
+    has_profile_location = False
+    if user_profile is not None:
+        has_profile_location = bool(user_profile.location)
         if user_profile.location:
-            from jobs.utils import geocode_location
-            profile_lat, profile_lon = geocode_location(user_profile.location)
+            profile_lat, profile_lon = await alocation_coordinates(user_profile)
             if profile_lat and profile_lon:
                 user_lat = profile_lat
                 user_lon = profile_lon
         # Get user's preferred commute radius
         user_commute_radius = user_profile.commute_radius
-    except:
-        pass
     
     # Use user's preferred commute radius if no distance override is provided
     if max_distance is None:
@@ -282,14 +325,6 @@ def map_view(request):
     # Note: We'll pass all jobs to the template and let JavaScript handle distance filtering
     # This allows for dynamic distance filtering without page reloads
     
-    # Check if user has location in profile
-    has_profile_location = False
-    try:
-        user_profile = request.user.profile
-        has_profile_location = bool(user_profile.location)
-    except:
-        pass
-    
     context = {
         'template_data': {'title': 'Job Map - HireBuzz'},
         'jobs_data': jobs_data,
@@ -300,15 +335,18 @@ def map_view(request):
         'user_commute_radius': user_commute_radius,
         'has_profile_location': has_profile_location,
     }
-    return render(request, 'jobs/map.html', context)
+    return await sync_to_async(render)(request, 'jobs/map.html', context)
 
 
-def geocode_job(request, job_id):
+async def geocode_job(request, job_id):
     """API endpoint to geocode a specific job."""
     if request.method != 'POST':
         return JsonResponse({'error': 'Method not allowed'}, status=405)
     
-    job = get_object_or_404(Job, id=job_id)
+    try:
+        job = await Job.objects.aget(id=job_id)
+    except Job.DoesNotExist:
+        raise Http404('No Job matches the given query.')
     
     if job.has_coordinates():
         return JsonResponse({
@@ -318,12 +356,12 @@ def geocode_job(request, job_id):
             'longitude': float(job.longitude)
         })
     
-    lat, lon = geocode_location(job.location)
+    lat, lon = await ageocode_location(job.location)
     
     if lat is not None and lon is not None:
         job.latitude = lat
         job.longitude = lon
-        job.save()
+        await job.asave()
         
         return JsonResponse({
             'success': True,
@@ -360,15 +398,15 @@ def applicant_cluster_map(request):
         is_public=True,
         show_location=True,
         location__isnull=False
-    ).exclude(location__in=['', 'Remote', 'remote', 'Anywhere', 'anywhere'])
+    ).exclude(location__in=['', 'Remote', 'remote', 'Anywhere', 'anywhere']).select_related('user')
     
     # Prepare applicant data for clustering
     applicants_data = []
     location_counts = {}
     
     for profile in job_seeker_profiles:
-        # Geocode the location
-        lat, lon = geocode_location(profile.location)
+        # Saved coordinates, or geocode the location if the queue hasn't yet
+        lat, lon = location_coordinates(profile)
         
         if lat is not None and lon is not None:
             # Count applicants by location for clustering
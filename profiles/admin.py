@@ -1,17 +1,57 @@
+from django.conf import settings
 from django.contrib import admin
-from django.http import HttpResponse
-from django.utils import timezone
-import csv
+
+from exports.admin import queue_export, queue_export_action
+from exports.utils import streaming_csv_response
 from .models import Profile, SavedCandidateSearch
 
 
+PROFILE_EXPORT_HEADER = [
+    'User', 'User Email', 'Headline', 'Bio', 'Location', 'Skills',
+    'Education', 'Work Experience', 'LinkedIn URL', 'GitHub URL',
+    'Portfolio URL', 'Other URL', 'Is Public', 'Show Bio', 'Show Location',
+    'Show Phone', 'Show Education', 'Show Work Experience', 'Show Links',
+    'Created At', 'Updated At'
+]
+
+
+def profile_export_row(profile):
+    return [
+        profile.user.username,
+        profile.user.email,
+        profile.headline,
+        profile.bio,
+        profile.location,
+        profile.skills,
+        profile.education,
+        profile.work_experience,
+        profile.linkedin_url,
+        profile.github_url,
+        profile.portfolio_url,
+        profile.other_url,
+        profile.is_public,
+        profile.show_bio,
+        profile.show_location,
+        profile.show_phone,
+        profile.show_education,
+        profile.show_work_experience,
+        profile.show_links,
+        profile.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+        profile.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+    ]
+
+
 @admin.register(Profile)
 class ProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'headline', 'location', 'is_public', 'created_at')
     list_filter = ('is_public', 'show_bio', 'show_location', 'show_education', 'created_at')
     search_fields = ('user__username', 'user__email', 'headline', 'location', 'skills')
     readonly_fields = ('created_at', 'updated_at')
-    actions = ['export_profiles_csv']
+    actions = [
+        'export_profiles_csv',
+        queue_export_action('profiles', 'csv', 'Queue background CSV export of selected profiles'),
+        queue_export_action('profiles', 'jsonl', 'Queue background JSON Lines export of selected profiles'),
+    ]
     
     fieldsets = (
         ('Basic Information', {
@@ -37,45 +77,12 @@ class ProfileAdmin(admin.ModelAdmin):
     
     @admin.action(description='Export selected profiles to CSV')
     def export_profiles_csv(self, request, queryset):
-        """Export selected profiles to CSV file."""
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = f'attachment; filename="profiles_export_{timezone.now().strftime("%Y%m%d_%H%M%S")}.csv"'
-        
-        writer = csv.writer(response)
-        writer.writerow([
-            'User', 'User Email', 'Headline', 'Bio', 'Location', 'Skills', 
-            'Education', 'Work Experience', 'LinkedIn URL', 'GitHub URL', 
-            'Portfolio URL', 'Other URL', 'Is Public', 'Show Bio', 'Show Location', 
-            'Show Phone', 'Show Education', 'Show Work Experience', 'Show Links', 
-            'Created At', 'Updated At'
-        ])
-        
-        for profile in queryset:
-            writer.writerow([
-                profile.user.username,
-                profile.user.email,
-                profile.headline,
-                profile.bio,
-                profile.location,
-                profile.skills,
-                profile.education,
-                profile.work_experience,
-                profile.linkedin_url,
-                profile.github_url,
-                profile.portfolio_url,
-                profile.other_url,
-                profile.is_public,
-                profile.show_bio,
-                profile.show_location,
-                profile.show_phone,
-                profile.show_education,
-                profile.show_work_experience,
-                profile.show_links,
-                profile.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                profile.updated_at.strftime('%Y-%m-%d %H:%M:%S')
-            ])
-        
-        return response
+        """Stream selected profiles to a CSV file, or queue a background export for large selections."""
+        if queryset.count() > settings.EXPORT_INLINE_MAX_ROWS:
+            return queue_export(self, request, queryset, 'profiles', 'csv')
+        return streaming_csv_response(
+            queryset, 'profiles_export', PROFILE_EXPORT_HEADER, profile_export_row, select_related=('user',)
+        )
 
 
 @admin.register(SavedCandidateSearch)
@@ -0,0 +1,23 @@
+# Generated by Django 5.0.14 on 2026-10-19 06:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('profiles', '0007_alter_savedcandidatesearch_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='profile',
+            name='latitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Latitude of the location, filled in by the geocode queue', max_digits=9, null=True),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='longitude',
+            field=models.DecimalField(blank=True, decimal_places=6, help_text='Longitude of the location, filled in by the geocode queue', max_digits=9, null=True),
+        ),
+    ]
@@ -2,8 +2,10 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import URLValidator, RegexValidator
 
+from jobs.models import GeocodedLocationMixin
 
-class Profile(models.Model):
+
+class Profile(GeocodedLocationMixin, models.Model):
     """Job seeker profile model with comprehensive information for recruiters."""
 
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='profile')
@@ -17,6 +19,20 @@ class Profile(models.Model):
         help_text="A brief description about yourself and your career goals"
     )
     location = models.CharField(max_length=100, blank=True)
+    latitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        help_text="Latitude of the location, filled in by the geocode queue"
+    )
+    longitude = models.DecimalField(
+        max_digits=9,
+        decimal_places=6,
+        null=True,
+        blank=True,
+        help_text="Longitude of the location, filled in by the geocode queue"
+    )
     phone = models.CharField(
         max_length=20,
         blank=True,
@@ -111,6 +127,11 @@ class Profile(models.Model):
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    VISIBILITY_FIELDS = (
+        'is_public', 'show_bio', 'show_location', 'show_phone', 'show_education',
+        'show_work_experience', 'show_links', 'show_resume',
+    )
     
     class Meta:
         ordering = ['-updated_at']
@@ -122,6 +143,20 @@ class Profile(models.Model):
         """Return skills as a list for easier template rendering."""
         return [skill.strip() for skill in self.skills.split(',') if skill.strip()]
     
+    def has_coordinates(self):
+        """Check if the profile location has been geocoded."""
+        return self.latitude is not None and self.longitude is not None
+
+    def get_coordinates(self):
+        """Return coordinates as a tuple if available."""
+        if self.has_coordinates():
+            return (float(self.latitude), float(self.longitude))
+        return None
+
+    def visibility_key(self):
+        """Summarise the privacy settings, for cache keys of what others can see."""
+        return ''.join('1' if getattr(self, field) else '0' for field in self.VISIBILITY_FIELDS)
+
     def has_links(self):
         """Check if profile has any social/professional links."""
         return any([self.linkedin_url, self.github_url, self.portfolio_url, self.other_url])
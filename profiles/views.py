@@ -8,11 +8,14 @@ from django.db.models import Q
 from django.utils import timezone
 from django.conf import settings
 from communications.models import Message
+from hirebuzz.caching import cache_anonymous_page, conditional_page, fragment_version, viewer_role
+from hirebuzz.metrics import SAVED_SEARCH_MATCHES
+from jobs.gazetteer import get_gazetteer
 
 
 def index(request):
     """Display all public profiles for browsing."""
-    profiles = Profile.objects.filter(is_public=True)
+    profiles = Profile.objects.filter(is_public=True).select_related('user')
 
     # Filtering for recruiter search
     skills_query = (request.GET.get('skills') or '').strip()
@@ -46,80 +49,7 @@ def index(request):
         )
 
     # US Cities and States for location dropdown
-    location_choices = [
-        ('', 'All Locations'),
-        ('Remote', 'Remote'),
-        ('Alabama', 'Alabama'),
-        ('Alaska', 'Alaska'),
-        ('Arizona', 'Arizona'),
-        ('Arkansas', 'Arkansas'),
-        ('California', 'California'),
-        ('Colorado', 'Colorado'),
-        ('Connecticut', 'Connecticut'),
-        ('Delaware', 'Delaware'),
-        ('Florida', 'Florida'),
-        ('Georgia', 'Georgia'),
-        ('Hawaii', 'Hawaii'),
-        ('Idaho', 'Idaho'),
-        ('Illinois', 'Illinois'),
-        ('Indiana', 'Indiana'),
-        ('Iowa', 'Iowa'),
-        ('Kansas', 'Kansas'),
-        ('Kentucky', 'Kentucky'),
-        ('Louisiana', 'Louisiana'),
-        ('Maine', 'Maine'),
-        ('Maryland', 'Maryland'),
-        ('Massachusetts', 'Massachusetts'),
-        ('Michigan', 'Michigan'),
-        ('Minnesota', 'Minnesota'),
-        ('Mississippi', 'Mississippi'),
-        ('Missouri', 'Missouri'),
-        ('Montana', 'Montana'),
-        ('Nebraska', 'Nebraska'),
-        ('Nevada', 'Nevada'),
-        ('New Hampshire', 'New Hampshire'),
-        ('New Jersey', 'New Jersey'),
-        ('New Mexico', 'New Mexico'),
-        ('New York', 'New York'),
-        ('North Carolina', 'North Carolina'),
-        ('North Dakota', 'North Dakota'),
-        ('Ohio', 'Ohio'),
-        ('Oklahoma', 'Oklahoma'),
-        ('Oregon', 'Oregon'),
-        ('Pennsylvania', 'Pennsylvania'),
-        ('Rhode Island', 'Rhode Island'),
-        ('South Carolina', 'South Carolina'),
-        ('South Dakota', 'South Dakota'),
-        ('Tennessee', 'Tennessee'),
-        ('Texas', 'Texas'),
-        ('Utah', 'Utah'),
-        ('Vermont', 'Vermont'),
-        ('Virginia', 'Virginia'),
-        ('Washington', 'Washington'),
-        ('West Virginia', 'West Virginia'),
-        ('Wisconsin', 'Wisconsin'),
-        ('Wyoming', 'Wyoming'),
-        ('Washington DC', 'Washington DC'),
-        ('Atlanta, GA', 'Atlanta, GA'),
-        ('Austin, TX', 'Austin, TX'),
-        ('Boston, MA', 'Boston, MA'),
-        ('Chicago, IL', 'Chicago, IL'),
-        ('Dallas, TX', 'Dallas, TX'),
-        ('Denver, CO', 'Denver, CO'),
-        ('Detroit, MI', 'Detroit, MI'),
-        ('Houston, TX', 'Houston, TX'),
-        ('Los Angeles, CA', 'Los Angeles, CA'),
-        ('Miami, FL', 'Miami, FL'),
-        ('New York, NY', 'New York, NY'),
-        ('Philadelphia, PA', 'Philadelphia, PA'),
-        ('Phoenix, AZ', 'Phoenix, AZ'),
-        ('San Antonio, TX', 'San Antonio, TX'),
-        ('San Diego, CA', 'San Diego, CA'),
-        ('San Francisco, CA', 'San Francisco, CA'),
-        ('San Jose, CA', 'San Jose, CA'),
-        ('Seattle, WA', 'Seattle, WA'),
-        ('Tampa, FL', 'Tampa, FL'),
-    ]
+    location_choices = [('', 'All Locations'), ('Remote', 'Remote')] + get_gazetteer().location_choices()
 
     context = {
         'profiles': profiles,
@@ -237,12 +167,15 @@ def run_saved_search(request, pk):
 
     # Send an in-platform message to the recruiter with a summary
     new_count = new_matches.count()
+    total_count = profiles_qs.count()
+    SAVED_SEARCH_MATCHES.observe(total_count, kind='all')
+    SAVED_SEARCH_MATCHES.observe(new_count, kind='new')
     if new_count > 0:
         subject = 'New candidate matches for your saved search'
         lines = [
             'You have new candidate matches on HireBuzz.',
             f"Filters: skills='{saved.skills or '-'}', location='{saved.location or '-'}', projects='{saved.projects or '-'}'",
-            f'Total matches now: {profiles_qs.count()}',
+            f'Total matches now: {total_count}',
             f'New since last check: {new_count}',
             '',
             'Top new matches:',
@@ -377,6 +310,15 @@ def edit_user_info(request):
     return render(request, 'profiles/edit_user_info.html', context)
 
 
+def _public_profile_version(request, user_id):
+    # The page also shows the account's name and email, which live on User
+    return Profile.objects.filter(user_id=user_id, is_public=True).values_list(
+        'updated_at', 'user__username', 'user__first_name', 'user__last_name', 'user__email',
+    ).first()
+
+
+@conditional_page(_public_profile_version, 'profiles:view')
+@cache_anonymous_page(_public_profile_version, 'profiles:view')
 def view_profile(request, user_id):
     """View a specific user's public profile."""
     user = get_object_or_404(User, id=user_id)
@@ -395,6 +337,10 @@ def view_profile(request, user_id):
         'profile': profile,
         'profile_user': user,
         'is_owner': is_owner,
+        'profile_version': fragment_version(profile),
+        'profile_visibility': profile.visibility_key(),
+        'viewer_role': viewer_role(request.user, owner=user),
+        'fragment_cache_seconds': settings.FRAGMENT_CACHE_SECONDS,
         'template_data': {'title': f'{user.get_full_name() or user.username} - Profile - HireBuzz'}
     }
     return render(request, 'profiles/view_profile.html', context)